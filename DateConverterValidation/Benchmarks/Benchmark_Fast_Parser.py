@@ -0,0 +1,50 @@
+"""
+Fixed-Width Parser Microbenchmark
+Compares the fixed-width numeric path against datetime.strptime per format pair
+"""
+
+import sys
+import os
+import timeit
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from DateConverter import FORMAT_PLANS, convert_with_plans, strptime_convert
+
+def build_sample(plan, year="2024", month="02", day="29"):
+    """Build a date string in the plan's layout"""
+    fields = {'yyyy': year, 'yy': year[-2:], 'MM': month, 'dd': day}
+    return ''.join(fields.get(token, token) for token, _, _ in plan.layout)
+
+def benchmark_pair(input_name, output_name, number=20000, repeat=5):
+    """Return (fast, strptime) seconds per call for one format pair"""
+    input_plan = FORMAT_PLANS[input_name]
+    output_plan = FORMAT_PLANS[output_name]
+    date_str = build_sample(input_plan)
+
+    fast = min(timeit.repeat(lambda: convert_with_plans(date_str, input_plan, output_plan),
+                             number=number, repeat=repeat)) / number
+    slow = min(timeit.repeat(lambda: strptime_convert(date_str, input_plan, output_plan),
+                             number=number, repeat=repeat)) / number
+    return fast, slow
+
+def main():
+    """Benchmark every numeric format pair"""
+    numeric = [name for name, plan in FORMAT_PLANS.items() if plan.numeric]
+
+    print("Fixed-width parser vs datetime.strptime (per call)")
+    print(f"{'input':<12} {'output':<12} {'fast (us)':>10} {'strptime (us)':>14} {'speedup':>8}")
+    print("-" * 60)
+
+    speedups = []
+    for input_name in numeric:
+        for output_name in numeric:
+            fast, slow = benchmark_pair(input_name, output_name)
+            speedups.append(slow / fast)
+            print(f"{input_name:<12} {output_name:<12} {fast * 1e6:>10.2f} {slow * 1e6:>14.2f} {slow / fast:>7.1f}x")
+
+    print("-" * 60)
+    print(f"Mean speedup over {len(speedups)} pairs: {sum(speedups) / len(speedups):.1f}x")
+
+if __name__ == "__main__":
+    main()
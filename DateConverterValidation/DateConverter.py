@@ -3,8 +3,17 @@ Date Format Converter - Complete Working Implementation
 For Date Converter Validation Testing Project
 """
 
+import argparse
+import csv
+import io
+import os
+import sys
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
 from enum import Enum
+from functools import lru_cache
+from itertools import islice
 
 class DateFormats(Enum):
     """All supported date formats"""
@@ -67,6 +76,19 @@ def get_python_format(date_format):
 
     return result
 
+# Days in each month of a non-leap year
+DAYS_IN_MONTH = (31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31)
+
+# The Gregorian calendar repeats every 400 years, so leap years and month
+# lengths are tabulated once for one cycle and indexed with year % 400
+LEAP_YEAR_CYCLE = bytes(
+    (year % 4 == 0 and year % 100 != 0) or (year % 400 == 0) for year in range(400)
+)
+MONTH_DAYS_CYCLE = bytes(
+    29 if month == 1 and LEAP_YEAR_CYCLE[year] else DAYS_IN_MONTH[month]
+    for year in range(400) for month in range(12)
+)
+
 def is_leap_year(year):
     """
     Check if a year is a leap year
@@ -80,7 +102,7 @@ def is_leap_year(year):
     except (ValueError, TypeError):
         return False
 
-    return (year % 4 == 0 and year % 100 != 0) or (year % 400 == 0)
+    return LEAP_YEAR_CYCLE[year % 400] == 1
 
 def is_valid_date(year, month, day):
     """
@@ -105,19 +127,201 @@ def is_valid_date(year, month, day):
     if day < 1:
         return False
 
-    # Days in each month
-    days_in_month = [31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31]
-
-    # Adjust February for leap year
-    if is_leap_year(year):
-        days_in_month[1] = 29
-
-    # Check day maximum
-    if day > days_in_month[month - 1]:
+    # Check day maximum (February already adjusted for leap years)
+    if day > MONTH_DAYS_CYCLE[(year % 400) * 12 + month - 1]:
         return False
 
     return True
 
+def validate_many(years, months, days):
+    """
+    Validate many dates at once
+
+    Takes three parallel iterables of date components and returns a list
+    of booleans, each the same as is_valid_date for that position.
+    """
+    month_days = MONTH_DAYS_CYCLE
+    results = []
+    append = results.append
+    for year, month, day in zip(years, months, days):
+        try:
+            year = int(year)
+            month = int(month)
+            day = int(day)
+        except (ValueError, TypeError):
+            append(False)
+            continue
+        append(0 < year < 10000 and 0 < month < 13 and 0 < day
+               and day <= month_days[(year % 400) * 12 + month - 1])
+    return results
+
+# Width of each custom format token, longest tokens first so that the
+# layout scanner matches 'yyyy' before 'yy' and 'MMM' before 'MM'
+FORMAT_TOKEN_WIDTHS = [
+    ('yyyy', 4),
+    ('MMM', 3),
+    ('yy', 2),
+    ('MM', 2),
+    ('dd', 2),
+    ('hh', 2),
+    ('mm', 2),
+    ('ss', 2),
+    ('a', 2),
+]
+
+def get_format_layout(date_format):
+    """
+    Split a custom format string into its field layout
+
+    Returns a tuple of (token, offset, width) entries in string order.
+    Literal separators are kept as their own entries with the literal
+    text as the token, e.g. "yyyy-MM-dd" becomes
+    (('yyyy', 0, 4), ('-', 4, 1), ('MM', 5, 2), ('-', 7, 1), ('dd', 8, 2))
+    """
+    if isinstance(date_format, DateFormats):
+        date_format = date_format.value
+
+    layout = []
+    offset = 0
+    position = 0
+    literal = ''
+    while position < len(date_format):
+        for token, width in FORMAT_TOKEN_WIDTHS:
+            if date_format.startswith(token, position):
+                break
+        else:
+            literal += date_format[position]
+            position += 1
+            continue
+
+        if literal:
+            layout.append((literal, offset, len(literal)))
+            offset += len(literal)
+            literal = ''
+        layout.append((token, offset, width))
+        offset += width
+        position += len(token)
+
+    if literal:
+        layout.append((literal, offset, len(literal)))
+
+    return tuple(layout)
+
+# Position of each numeric field in FormatPlan.numeric_template arguments
+NUMERIC_FIELD_INDEX = {'yyyy': 0, 'MM': 1, 'dd': 2, 'yy': 3}
+
+# Maps every ASCII digit to '9' so a date string can be compared against
+# a plan's shape (e.g. "9999-99-99") in a single C-level call
+DIGIT_MASK = str.maketrans('0123456789', '9999999999')
+
+# Also maps ASCII letters to 'a', giving the shape signature used for
+# format detection (e.g. "07-Dec-2024" -> "99-aaa-9999")
+SIGNATURE_MASK = str.maketrans(
+    '0123456789abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ',
+    '9' * 10 + 'a' * 52
+)
+
+# Tokens written with letters rather than digits
+TEXT_TOKENS = ('MMM', 'a')
+
+class FormatPlan:
+    """
+    Precompiled conversion plan for one DateFormats member
+
+    Holds everything convert_between_formats needs per format so the
+    token replacement in get_python_format runs once per format instead
+    of once per call. Numeric date-only formats (no text month, no time)
+    also get fixed offsets for slicing and an output template, so they
+    can be converted without datetime.strptime/strftime.
+    """
+
+    __slots__ = ('date_format', 'pattern', 'lowercase_ampm', 'layout', 'width',
+                 'signature', 'numeric', 'shape', 'year_slice', 'month_slice', 'day_slice',
+                 'numeric_template')
+
+    def __init__(self, date_format):
+        self.date_format = date_format
+        self.pattern = get_python_format(date_format)
+        self.lowercase_ampm = 'a' in date_format.value
+        self.layout = get_format_layout(date_format)
+        self.width = sum(width for _, _, width in self.layout)
+
+        fields = {token: slice(offset, offset + width)
+                  for token, offset, width in self.layout if token in NUMERIC_FIELD_INDEX}
+        tokens = {token for token, _, _ in self.layout}
+        literals = tokens - {token for token, _ in FORMAT_TOKEN_WIDTHS}
+
+        # Shape of a well-formed date in this format, see SIGNATURE_MASK
+        self.signature = ''.join(
+            token if token in literals else ('a' if token in TEXT_TOKENS else '9') * width
+            for token, _, width in self.layout
+        )
+
+        # Fixed-width numeric layout: exactly one year, month and day field
+        self.numeric = (tokens - literals == set(fields)
+                        and len(fields) == 3 and 'MM' in fields and 'dd' in fields)
+        self.shape = None
+        self.year_slice = self.month_slice = self.day_slice = None
+        self.numeric_template = None
+
+        if self.numeric:
+            self.shape = ''.join('9' * width if token in fields else token
+                                 for token, _, width in self.layout)
+            self.year_slice = fields.get('yyyy', fields.get('yy'))
+            self.month_slice = fields['MM']
+            self.day_slice = fields['dd']
+            self.numeric_template = ''.join(
+                '{%d}' % NUMERIC_FIELD_INDEX[token] if token in NUMERIC_FIELD_INDEX else token
+                for token, _, _ in self.layout
+            )
+
+    def split_numeric(self, date_str):
+        """
+        Slice a fixed-width numeric date into (yyyy, MM, dd, yy) strings
+
+        Returns None when date_str does not have exactly this plan's shape
+        (length, separators, ASCII digits) so the caller can fall back to
+        datetime.strptime, which also accepts e.g. unpadded months and days.
+        Two-digit years are expanded with the same pivot as strptime's %y
+        (00-68 -> 20xx, 69-99 -> 19xx).
+        """
+        if date_str.translate(DIGIT_MASK) != self.shape:
+            return None
+
+        year = date_str[self.year_slice]
+        month = date_str[self.month_slice]
+        day = date_str[self.day_slice]
+
+        if len(year) == 2:
+            short_year = year
+            year = ('20' if short_year < '69' else '19') + short_year
+        else:
+            short_year = year[2:]
+
+        return year, month, day, short_year
+
+    def __repr__(self):
+        return f"FormatPlan({self.date_format.name}, {self.pattern!r})"
+
+# One plan per format, keyed by format name (built once at import)
+FORMAT_PLANS = {fmt.name: FormatPlan(fmt) for fmt in DateFormats}
+
+# Format names grouped by shape signature, in DateFormats order
+FORMAT_SIGNATURE_INDEX = {}
+for _plan in FORMAT_PLANS.values():
+    FORMAT_SIGNATURE_INDEX.setdefault(_plan.signature, []).append(_plan.date_format.name)
+del _plan
+
+def get_format_plan(format_name):
+    """Get the FormatPlan for a DateFormats enum or name, None if unknown"""
+    if isinstance(format_name, DateFormats):
+        format_name = format_name.name
+
+    try:
+        return FORMAT_PLANS[format_name]
+    except (KeyError, TypeError):
+        return None
+
 def convert_between_formats(date_str, from_format_name, to_format_name):
     """
     Convert date string from one format to another
@@ -139,29 +343,54 @@ def convert_between_formats(date_str, from_format_name, to_format_name):
         return None
 
     try:
-        # Get format enums
-        input_format = DateFormats[from_format_name]
-        output_format = DateFormats[to_format_name]
+        # Get precompiled format plans
+        input_plan = FORMAT_PLANS[from_format_name]
+        output_plan = FORMAT_PLANS[to_format_name]
+    except (KeyError, TypeError):
+        # KeyError: Invalid format name
+        # TypeError: Unhashable format name
+        return None
 
-        # Convert to Python format strings
-        input_pattern = get_python_format(input_format)
-        output_pattern = get_python_format(output_format)
+    return convert_with_plans(date_str, input_plan, output_plan)
 
+def convert_with_plans(date_str, input_plan, output_plan):
+    """
+    Convert a stripped, non-empty date string between two FormatPlans
+
+    Numeric date-only formats are sliced and reassembled directly; any
+    other format pair, or input that is not exactly fixed-width, goes
+    through strptime_convert.
+    """
+    if input_plan.numeric and output_plan.numeric:
+        fields = input_plan.split_numeric(date_str)
+        if fields is not None:
+            if not is_valid_date(fields[0], fields[1], fields[2]):
+                return None
+            return output_plan.numeric_template.format(*fields)
+
+    return strptime_convert(date_str, input_plan, output_plan)
+
+def strptime_convert(date_str, input_plan, output_plan):
+    """Convert a date string between two FormatPlans using datetime.strptime"""
+    try:
         # Parse the input date
-        dt = datetime.strptime(date_str, input_pattern)
+        dt = datetime.strptime(date_str, input_plan.pattern)
 
 
-        # Format the output date
-        result = dt.strftime(output_pattern)
+        # Format the output date; glibc strftime does not zero-pad %Y below
+        # 1000, so such years are written in directly as the fast path does
+        pattern = output_plan.pattern
+        if dt.year < 1000:
+            pattern = pattern.replace('%Y', '%04d' % dt.year)
+        result = dt.strftime(pattern)
 
         # Handle AM/PM case (Python uses uppercase, we might want lowercase)
-        if 'a' in output_format.value:
+        if output_plan.lowercase_ampm:
             result = result.replace('AM', 'am').replace('PM', 'pm')
 
         return result
 
-    except (KeyError, ValueError, TypeError, AttributeError) as e:
-        # KeyError: Invalid format name
+    except (ValueError, TypeError, AttributeError) as e:
         # ValueError: Date parsing failed
         # TypeError: Invalid input types
         # AttributeError: Missing attributes
@@ -180,6 +409,228 @@ def convert_date_format(date_str, input_format, output_format):
 
     return convert_between_formats(date_str, input_format, output_format)
 
+def convert_many(dates, from_format_name, to_format_name, stream=False):
+    """
+    Convert many date strings between the same pair of formats
+
+    The formats are resolved once for the whole batch instead of once per
+    date. Each entry gives the same result as convert_between_formats,
+    with None for invalid entries.
+
+    Args:
+        dates: Iterable of input date strings (list, CSV column, file lines...)
+        from_format_name: Name or DateFormats enum of the input format
+        to_format_name: Name or DateFormats enum of the output format
+        stream: If True, return a generator that converts lazily instead of a list
+
+    Returns:
+        List (or generator when stream=True) of converted strings or None
+    """
+    input_plan = get_format_plan(from_format_name)
+    output_plan = get_format_plan(to_format_name)
+
+    if input_plan is None or output_plan is None:
+        def convert_one(date_str):
+            return None
+    else:
+        def convert_one(date_str):
+            if not date_str or not isinstance(date_str, str):
+                return None
+            date_str = date_str.strip()
+            if not date_str:
+                return None
+            return convert_with_plans(date_str, input_plan, output_plan)
+
+    if stream:
+        return (convert_one(date_str) for date_str in dates)
+    return [convert_one(date_str) for date_str in dates]
+
+# Default number of conversions kept by ConversionCache
+DEFAULT_CACHE_SIZE = 65536
+
+class ConversionCache:
+    """
+    Bounded LRU cache in front of a date conversion function
+
+    Results are keyed by (date_str, from_format_name, to_format_name) and
+    None results are cached too, since malformed values repeat as often as
+    valid ones. Calls with unhashable arguments bypass the cache.
+
+    Usage:
+        cache = ConversionCache(maxsize=10000)
+        cache("2024-12-07", "D_YYYYMMDD", "S_DDMMYYYY")
+        cache.stats()  # {'hits': 0, 'misses': 1, 'evictions': 0, 'size': 1, ...}
+
+    or as a decorator through memoize_conversions.
+    """
+
+    def __init__(self, convert=None, maxsize=DEFAULT_CACHE_SIZE):
+        if maxsize < 1:
+            raise ValueError(f"maxsize must be at least 1, got {maxsize}")
+
+        self.convert = convert or convert_between_formats
+        self.maxsize = maxsize
+        self.cached_convert = lru_cache(maxsize=maxsize)(self.convert)
+
+    def __call__(self, date_str, from_format_name, to_format_name):
+        try:
+            return self.cached_convert(date_str, from_format_name, to_format_name)
+        except TypeError:
+            # Unhashable arguments cannot be used as a cache key
+            return self.convert(date_str, from_format_name, to_format_name)
+
+    def stats(self):
+        """Return hits, misses, evictions, size, maxsize and hit_rate"""
+        info = self.cached_convert.cache_info()
+        lookups = info.hits + info.misses
+        return {
+            'hits': info.hits,
+            'misses': info.misses,
+            # Every miss inserts one entry, so whatever is not still cached was evicted
+            'evictions': info.misses - info.currsize,
+            'size': info.currsize,
+            'maxsize': self.maxsize,
+            'hit_rate': info.hits / lookups if lookups else 0.0,
+        }
+
+    def clear(self):
+        """Drop all cached results and reset the counters"""
+        self.cached_convert.cache_clear()
+
+def memoize_conversions(maxsize=DEFAULT_CACHE_SIZE):
+    """
+    Decorator wrapping a (date_str, from_format, to_format) function in a
+    ConversionCache, e.g.
+
+        @memoize_conversions(maxsize=4096)
+        def to_iso(date_str, from_format_name, to_format_name):
+            ...
+
+        to_iso.stats()
+    """
+    def decorator(convert):
+        return ConversionCache(convert, maxsize)
+    return decorator
+
+# Opt-in cached variant of convert_between_formats with a process-wide cache
+cached_convert_between_formats = ConversionCache(convert_between_formats)
+
+def valid_date_mask(years, months, days):
+    """
+    Vectorised is_valid_date over NumPy integer arrays
+
+    Applies the same year range, month range and MONTH_DAYS_CYCLE checks
+    element-wise and returns a boolean array.
+    """
+    import numpy as np
+
+    years = np.asarray(years)
+    months = np.asarray(months)
+    days = np.asarray(days)
+
+    month_days = np.frombuffer(MONTH_DAYS_CYCLE, dtype=np.uint8)
+
+    month_ok = (months >= 1) & (months <= 12)
+    max_day = month_days[(years % 400) * 12 + np.where(month_ok, months, 1) - 1]
+
+    return (years >= 1) & (years <= 9999) & month_ok & (days >= 1) & (days <= max_day)
+
+def convert_array(dates, from_format_name, to_format_name):
+    """
+    Convert a NumPy array of fixed-width byte strings between numeric formats
+
+    Year, month and day are read as integer arrays straight from a uint8
+    view of the input, validated with valid_date_mask and written into a
+    new fixed-width array. Entries that are not exactly fixed-width (e.g.
+    padded with spaces or unpadded like b"2024-1-5") are converted one by
+    one with the scalar path, so every entry matches convert_between_formats.
+
+    Args:
+        dates: NumPy array (any shape) of bytes strings, e.g. dtype 'S10'
+        from_format_name: Name or DateFormats enum of a numeric input format
+        to_format_name: Name or DateFormats enum of a numeric output format
+
+    Returns:
+        (converted, valid): bytes array of the output format width with b''
+        for invalid entries, and a boolean validity mask, both shaped like dates
+
+    Raises:
+        ValueError: If a format is unknown or not a numeric date-only format,
+            or dates is not a bytes string array
+    """
+    import numpy as np
+
+    input_plan = get_format_plan(from_format_name)
+    output_plan = get_format_plan(to_format_name)
+    if input_plan is None or output_plan is None:
+        raise ValueError(f"Unknown format: {from_format_name} -> {to_format_name}")
+    if not (input_plan.numeric and output_plan.numeric):
+        raise ValueError("convert_array only supports numeric date-only formats")
+
+    dates = np.asarray(dates)
+    if dates.dtype.kind != 'S':
+        raise ValueError(f"Expected a bytes string array, got dtype {dates.dtype}")
+
+    flat = np.ascontiguousarray(dates.reshape(-1))
+    count = flat.shape[0]
+
+    # Bring the input to exactly the plan width so it can be viewed as uint8 rows
+    if flat.dtype.itemsize != input_plan.width:
+        flat = flat.astype(f'S{max(flat.dtype.itemsize, input_plan.width)}')
+    chars = flat.view(np.uint8).reshape(count, flat.dtype.itemsize)
+    digits = chars[:, :input_plan.width].astype(np.int32) - ord('0')
+
+    # Shape check: digits where the plan has fields, exact separators elsewhere
+    shape_ok = np.ones(count, dtype=bool)
+    if flat.dtype.itemsize > input_plan.width:
+        shape_ok &= (chars[:, input_plan.width:] == 0).all(axis=1)
+    for position, expected in enumerate(input_plan.shape):
+        if expected == '9':
+            shape_ok &= (digits[:, position] >= 0) & (digits[:, position] <= 9)
+        else:
+            shape_ok &= chars[:, position] == ord(expected)
+
+    def field_value(field_slice):
+        value = np.zeros(count, dtype=np.int32)
+        for position in range(field_slice.start, field_slice.stop):
+            value = value * 10 + digits[:, position]
+        return value
+
+    years = field_value(input_plan.year_slice)
+    if input_plan.year_slice.stop - input_plan.year_slice.start == 2:
+        years = np.where(years < 69, years + 2000, years + 1900)
+    months = field_value(input_plan.month_slice)
+    days = field_value(input_plan.day_slice)
+
+    valid = shape_ok & valid_date_mask(years, months, days)
+
+    # Assemble the output rows digit by digit
+    output = np.zeros((count, output_plan.width), dtype=np.uint8)
+    values = {'yyyy': years, 'yy': years % 100, 'MM': months, 'dd': days}
+    for token, offset, width in output_plan.layout:
+        if token in values:
+            value = values[token]
+            for position in range(offset + width - 1, offset - 1, -1):
+                output[:, position] = value % 10 + ord('0')
+                value = value // 10
+        else:
+            output[:, offset:offset + width] = np.frombuffer(token.encode('ascii'), dtype=np.uint8)
+    output[~valid] = 0
+    converted = output.view(f'S{output_plan.width}').reshape(count)
+
+    # Entries that are not exactly fixed-width go through the scalar converter
+    for index in np.flatnonzero(~shape_ok):
+        try:
+            date_str = flat[index].decode('ascii').strip()
+        except UnicodeDecodeError:
+            continue
+        result = convert_with_plans(date_str, input_plan, output_plan) if date_str else None
+        if result is not None:
+            converted[index] = result.encode('ascii')
+            valid[index] = True
+
+    return converted.reshape(dates.shape), valid.reshape(dates.shape)
+
 def find_format_enum(format_str):
     """Find DateFormats enum by name or value"""
     if not format_str:
@@ -192,12 +643,75 @@ def find_format_enum(format_str):
         pass
 
     # Try by value
-    for fmt in DateFormats:
-        if fmt.value == format_str:
-            return fmt
+    try:
+        return DateFormats(format_str)
+    except (ValueError, TypeError):
+        pass
 
     return None
 
+def detect_formats(date_str):
+    """
+    Find every format that date_str is a valid date in
+
+    The shape signature of the string (length, separator positions and
+    digit/letter mask) is looked up in FORMAT_SIGNATURE_INDEX, which
+    narrows the candidates to one or a few formats; each candidate is
+    then confirmed by parsing. Strings that match no signature (e.g.
+    unpadded "2024-1-5") are tried against every format.
+
+    Returns:
+        List of format names in DateFormats order (empty if none match)
+    """
+    if not date_str or not isinstance(date_str, str):
+        return []
+
+    date_str = date_str.strip()
+    if not date_str:
+        return []
+
+    candidates = FORMAT_SIGNATURE_INDEX.get(date_str.translate(SIGNATURE_MASK), FORMAT_PLANS)
+    return [name for name in candidates
+            if convert_with_plans(date_str, FORMAT_PLANS[name], FORMAT_PLANS[name]) is not None]
+
+def detect_format(date_str):
+    """
+    Detect the format of a date string
+
+    Returns:
+        First matching format name in DateFormats order, or None.
+        Ambiguous strings such as "10-11-12" (yy-MM-dd or dd-MM-yy) give the
+        first match; use detect_formats to see all of them.
+    """
+    formats = detect_formats(date_str)
+    return formats[0] if formats else None
+
+def detect_column_format(dates, sample_size=1000):
+    """
+    Detect the dominant format of a column of date strings
+
+    Every format a sampled entry is valid in gets one vote, so ambiguous
+    entries are settled by the rest of the column (e.g. "10-11-12" next
+    to "15-06-31", which is only valid as dd-MM-yy, gives D_DDMMyy).
+
+    Args:
+        dates: Iterable of date strings
+        sample_size: Number of leading entries to look at
+
+    Returns:
+        Format name with the most votes (ties in DateFormats order), or None
+    """
+    votes = {}
+    for date_str in islice(dates, sample_size):
+        for name in detect_formats(date_str):
+            votes[name] = votes.get(name, 0) + 1
+
+    if not votes:
+        return None
+
+    order = {name: index for index, name in enumerate(FORMAT_PLANS)}
+    return max(votes, key=lambda name: (votes[name], -order[name]))
+
 def get_all_format_names():
     """Return list of all format names"""
     return [fmt.name for fmt in DateFormats]
@@ -216,81 +730,263 @@ def get_format_example(format_name):
     }
     return examples.get(format_name, "Example not available")
 
-# # # Quick test if run directly
-# if __name__ == "__main__":
-#     print("Testing DateConverter...")
-#     print("=" * 60)
-#
-#     # Test 1: Basic conversion
-#     result = convert_between_formats("2024-12-07", "D_YYYYMMDD", "S_DDMMYYYY")
-#     print(f"Test 1 (Basic): {result}")
-#     assert result == "07/12/2024", f"Test 1 failed: got {result}, expected 07/12/2024"
-#     print("  ✓ PASSED")
-#
-#     # Test 2: Reverse conversion
-#     result = convert_between_formats("07/12/2024", "S_DDMMYYYY", "D_YYYYMMDD")
-#     print(f"Test 2 (Reverse): {result}")
-#     assert result == "2024-12-07", f"Test 2 failed: got {result}, expected 2024-12-07"
-#     print("  ✓ PASSED")
-#
-#     # Test 3: Leap year
-#     result = convert_between_formats("2020-02-29", "D_YYYYMMDD", "S_DDMMYYYY")
-#     print(f"Test 3 (Leap year): {result}")
-#     assert result == "29/02/2020", f"Test 3 failed: got {result}, expected 29/02/2020"
-#     print("  ✓ PASSED")
-#
-#     # Test 4: Invalid date (Feb 30)
-#     result = convert_between_formats("2024-02-30", "D_YYYYMMDD", "S_DDMMYYYY")
-#     print(f"Test 4 (Invalid Feb 30): {result}")
-#     assert result is None, f"Test 4 failed: got {result}, expected None"
-#     print("  ✓ PASSED")
-#
-#     # Test 5: Text month
-#     result = convert_between_formats("2024-Jan-15", "D_YYYYMMDD_N", "D_YYYYMMDD")
-#     print(f"Test 5 (Text month): {result}")
-#     assert result == "2024-01-15", f"Test 5 failed: got {result}, expected 2024-01-15"
-#     print("  ✓ PASSED")
-#
-#     # Test 6: Two-digit year
-#     result = convert_between_formats("24-12-07", "D_YYMMDD", "D_YYYYMMDD")
-#     print(f"Test 6 (2-digit year): {result}")
-#     assert result == "2024-12-07", f"Test 6 failed: got {result}, expected 2024-12-07"
-#     print("  ✓ PASSED")
-#
-#     # Test 7: Invalid month
-#     result = convert_between_formats("2024-13-01", "D_YYYYMMDD", "S_DDMMYYYY")
-#     print(f"Test 7 (Invalid month 13): {result}")
-#     assert result is None, f"Test 7 failed: got {result}, expected None"
-#     print("  ✓ PASSED")
-#
-#     # Test 8: Invalid day
-#     result = convert_between_formats("2024-06-31", "D_YYYYMMDD", "S_DDMMYYYY")
-#     print(f"Test 8 (Invalid June 31): {result}")
-#     assert result is None, f"Test 8 failed: got {result}, expected None"
-#     print("  ✓ PASSED")
-#
-#     # Test 9: Leap year validation
-#     print(f"\nTest 9 (Leap year validation):")
-#     assert is_leap_year(2020) == True, "2020 should be leap year"
-#     print("  ✓ 2020 is leap year")
-#     assert is_leap_year(2019) == False, "2019 should not be leap year"
-#     print("  ✓ 2019 is not leap year")
-#     assert is_leap_year(2000) == True, "2000 should be leap year"
-#     print("  ✓ 2000 is leap year (divisible by 400)")
-#     assert is_leap_year(1900) == False, "1900 should not be leap year"
-#     print("  ✓ 1900 is not leap year (divisible by 100 but not 400)")
-#
-#     # Test 10: Non-leap year Feb 29
-#     result = convert_between_formats("2019-02-29", "D_YYYYMMDD", "S_DDMMYYYY")
-#     print(f"\nTest 10 (Non-leap Feb 29): {result}")
-#     assert result is None, f"Test 10 failed: got {result}, expected None"
-#     print("  ✓ PASSED")
-#
-#     print("\n" + "=" * 60)
-#     print("✓ ALL 10 TESTS PASSED!")
-#     print("=" * 60)
-#     print("\nDateConverter is working correctly.")
-#     print("You can now run your test suites:")
-#     print("  pytest tests/test_category_partition.py -v")
-#     print("  pytest tests/test_metamorphic.py -v")
-#     print("  pytest tests/test_mutation_pairwise.py -v")
\ No newline at end of file
+# Buffer size for file conversion reads and writes
+FILE_BUFFER_SIZE = 1 << 20
+
+# Rows converted per convert_many call when converting files
+DEFAULT_CHUNK_SIZE = 10000
+
+# Bytes of input handed to each worker in parallel file conversion
+DEFAULT_CHUNK_BYTES = 8 << 20
+
+def convert_lines(input_file, output_file, from_format_name, to_format_name,
+                  column=None, delimiter=',', header=False, chunk_size=DEFAULT_CHUNK_SIZE):
+    """
+    Convert dates from an open text file to another, one chunk at a time
+
+    Without a column the input has one date per line and each output line
+    is the converted date (empty for invalid dates). With a column the
+    input is CSV and only that column is replaced; a column name means the
+    first row is a header, an integer index uses the header flag.
+    At most chunk_size rows are held in memory at once.
+
+    Returns:
+        (rows, invalid) counts, not including the header row
+    """
+    rows = 0
+    invalid = 0
+
+    if column is None:
+        lines = (line.rstrip('\r\n') for line in input_file)
+        while True:
+            chunk = list(islice(lines, chunk_size))
+            if not chunk:
+                break
+            converted = convert_many(chunk, from_format_name, to_format_name)
+            rows += len(converted)
+            invalid += converted.count(None)
+            output_file.write(''.join(f"{value or ''}\n" for value in converted))
+        return rows, invalid
+
+    reader = csv.reader(input_file, delimiter=delimiter)
+    writer = csv.writer(output_file, delimiter=delimiter, lineterminator='\n')
+
+    if isinstance(column, str):
+        header_row = next(reader, None)
+        if header_row is None:
+            return rows, invalid
+        if column not in header_row:
+            raise ValueError(f"Column {column!r} not found in header {header_row}")
+        index = header_row.index(column)
+        writer.writerow(header_row)
+    else:
+        index = column
+        if header:
+            header_row = next(reader, None)
+            if header_row is None:
+                return rows, invalid
+            writer.writerow(header_row)
+
+    while True:
+        chunk = list(islice(reader, chunk_size))
+        if not chunk:
+            break
+        dates = [row[index] if index < len(row) else None for row in chunk]
+        converted = convert_many(dates, from_format_name, to_format_name)
+        for row, value in zip(chunk, converted):
+            if index < len(row):
+                row[index] = value or ''
+        rows += len(converted)
+        invalid += converted.count(None)
+        writer.writerows(chunk)
+
+    return rows, invalid
+
+def convert_file(input_path, output_path, from_format_name, to_format_name,
+                 column=None, delimiter=',', header=False, chunk_size=DEFAULT_CHUNK_SIZE):
+    """
+    Convert dates in input_path and write them to output_path
+
+    '-' reads from stdin / writes to stdout. See convert_lines for the
+    column, header and chunk_size arguments.
+
+    Returns:
+        (rows, invalid) counts
+    """
+    if get_format_plan(from_format_name) is None or get_format_plan(to_format_name) is None:
+        raise ValueError(f"Unknown format: {from_format_name} -> {to_format_name}")
+
+    input_file = sys.stdin if input_path == '-' else \
+        open(input_path, 'r', encoding='utf-8', newline='', buffering=FILE_BUFFER_SIZE)
+    output_file = sys.stdout if output_path == '-' else \
+        open(output_path, 'w', encoding='utf-8', newline='', buffering=FILE_BUFFER_SIZE)
+
+    try:
+        return convert_lines(input_file, output_file, from_format_name, to_format_name,
+                             column=column, delimiter=delimiter, header=header,
+                             chunk_size=chunk_size)
+    finally:
+        if input_file is not sys.stdin:
+            input_file.close()
+        if output_file is not sys.stdout:
+            output_file.close()
+
+def convert_byte_range(input_path, start, end, from_format_name, to_format_name,
+                       column=None, delimiter=','):
+    """
+    Convert the lines in bytes [start, end) of input_path
+
+    start and end must fall on line boundaries. Used as the worker task of
+    convert_file_parallel, so column must already be an index.
+
+    Returns:
+        (converted text, rows, invalid)
+    """
+    with open(input_path, 'rb') as input_file:
+        input_file.seek(start)
+        data = input_file.read(end - start)
+
+    output_file = io.StringIO(newline='')
+    rows, invalid = convert_lines(io.StringIO(data.decode('utf-8'), newline=''), output_file,
+                                  from_format_name, to_format_name,
+                                  column=column, delimiter=delimiter, chunk_size=DEFAULT_CHUNK_SIZE)
+    return output_file.getvalue(), rows, invalid
+
+def split_line_ranges(input_path, start, chunk_bytes):
+    """
+    Split input_path from byte offset start into (start, end) ranges of
+    about chunk_bytes each, with every boundary moved forward to the
+    start of the next line
+    """
+    size = os.path.getsize(input_path)
+    ranges = []
+    with open(input_path, 'rb') as input_file:
+        while start < size:
+            input_file.seek(min(start + chunk_bytes, size))
+            input_file.readline()
+            end = min(input_file.tell(), size)
+            ranges.append((start, end))
+            start = end
+    return ranges
+
+def convert_file_parallel(input_path, output_path, from_format_name, to_format_name,
+                          column=None, delimiter=',', header=False,
+                          workers=None, chunk_bytes=DEFAULT_CHUNK_BYTES):
+    """
+    Convert dates in input_path with a pool of worker processes
+
+    The input is split into byte ranges of about chunk_bytes aligned on
+    line boundaries, each range is converted in a ProcessPoolExecutor and
+    the results are written to output_path in the original order. Only
+    about two ranges per worker are in flight at once, so memory stays
+    bounded. Each CSV record must be on a single line (no quoted newlines).
+    See convert_lines for the column and header arguments.
+
+    Returns:
+        (rows, invalid) counts
+    """
+    if get_format_plan(from_format_name) is None or get_format_plan(to_format_name) is None:
+        raise ValueError(f"Unknown format: {from_format_name} -> {to_format_name}")
+    if input_path == '-':
+        raise ValueError("Parallel conversion needs an input file, not stdin")
+
+    workers = workers or os.cpu_count() or 1
+
+    # Header row (if any) is copied by the parent, workers only see data rows
+    start = 0
+    header_row = None
+    if isinstance(column, str) or (column is not None and header):
+        with open(input_path, 'rb') as input_file:
+            header_line = input_file.readline()
+        start = len(header_line)
+        header_row = next(csv.reader([header_line.decode('utf-8')], delimiter=delimiter), None)
+        if isinstance(column, str):
+            if header_row is None or column not in header_row:
+                raise ValueError(f"Column {column!r} not found in header {header_row}")
+            column = header_row.index(column)
+
+    output_file = sys.stdout if output_path == '-' else \
+        open(output_path, 'w', encoding='utf-8', newline='', buffering=FILE_BUFFER_SIZE)
+
+    rows = 0
+    invalid = 0
+    try:
+        if header_row is not None:
+            csv.writer(output_file, delimiter=delimiter, lineterminator='\n').writerow(header_row)
+
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            pending = deque()
+            for range_start, range_end in split_line_ranges(input_path, start, chunk_bytes):
+                pending.append(executor.submit(convert_byte_range, input_path, range_start, range_end,
+                                               from_format_name, to_format_name, column, delimiter))
+                if len(pending) >= 2 * workers:
+                    text, chunk_rows, chunk_invalid = pending.popleft().result()
+                    output_file.write(text)
+                    rows += chunk_rows
+                    invalid += chunk_invalid
+
+            while pending:
+                text, chunk_rows, chunk_invalid = pending.popleft().result()
+                output_file.write(text)
+                rows += chunk_rows
+                invalid += chunk_invalid
+    finally:
+        if output_file is not sys.stdout:
+            output_file.close()
+
+    return rows, invalid
+
+def parse_column(value):
+    """Column argument: integer index if numeric, otherwise a header name"""
+    return int(value) if value.isdigit() else value
+
+def build_arg_parser():
+    """Command line interface for python -m DateConverter"""
+    parser = argparse.ArgumentParser(prog="python -m DateConverter",
+                                     description="Date format converter")
+    commands = parser.add_subparsers(dest="command", required=True)
+
+    convert = commands.add_parser("convert", help="Convert the dates in a file")
+    convert.add_argument("input", help="Input file, '-' for stdin")
+    convert.add_argument("output", help="Output file, '-' for stdout")
+    convert.add_argument("--from", dest="from_format", required=True, choices=get_all_format_names(),
+                         metavar="FORMAT", help="Input DateFormats name, e.g. D_YYYYMMDD")
+    convert.add_argument("--to", dest="to_format", required=True, choices=get_all_format_names(),
+                         metavar="FORMAT", help="Output DateFormats name, e.g. S_DDMMYYYY")
+    convert.add_argument("--column", type=parse_column, default=None,
+                         help="CSV column name or index (default: one date per line)")
+    convert.add_argument("--delimiter", default=",", help="CSV delimiter (default: ',')")
+    convert.add_argument("--header", action="store_true",
+                         help="First CSV row is a header (implied by a column name)")
+    convert.add_argument("--chunk-size", type=int, default=DEFAULT_CHUNK_SIZE,
+                         help=f"Rows converted per chunk (default: {DEFAULT_CHUNK_SIZE})")
+    convert.add_argument("--workers", type=int, default=1,
+                         help="Worker processes, 0 for one per CPU (default: 1, no pool)")
+    convert.add_argument("--chunk-bytes", type=int, default=DEFAULT_CHUNK_BYTES,
+                         help=f"Input bytes per worker task (default: {DEFAULT_CHUNK_BYTES})")
+
+    return parser
+
+def main(argv=None):
+    """Entry point for python -m DateConverter"""
+    args = build_arg_parser().parse_args(argv)
+
+    try:
+        if args.workers == 1:
+            rows, invalid = convert_file(args.input, args.output, args.from_format, args.to_format,
+                                         column=args.column, delimiter=args.delimiter,
+                                         header=args.header, chunk_size=args.chunk_size)
+        else:
+            rows, invalid = convert_file_parallel(args.input, args.output, args.from_format,
+                                                  args.to_format, column=args.column,
+                                                  delimiter=args.delimiter, header=args.header,
+                                                  workers=args.workers, chunk_bytes=args.chunk_bytes)
+    except (OSError, ValueError) as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
+
+    print(f"Converted {rows} rows, {invalid} invalid", file=sys.stderr)
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,121 @@
+"""
+Test Set Generation Driver
+Runs every test set generator in one process pool, importing the generator
+functions directly instead of starting one interpreter per script
+"""
+
+import argparse
+import contextlib
+import importlib
+import io
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+sys.path.insert(0, os.path.abspath(os.path.dirname(__file__)))
+
+from Manifest import fingerprint, is_up_to_date, read_manifest, write_manifest
+
+# name -> (module, generate function, save function, output file)
+GENERATORS = {
+    "base": ("Generate_Base_Test_Set", "generate_base_tests", "save_tests_to_file", "BaseTestSet.csv"),
+    "category_partition": ("Generate_Category_Partition_Test_Set", "generate_category_partition_tests",
+                           "save_tests_to_file", "CategoryPartitionTestSet.csv"),
+    "pairwise": ("Generate_Pair_Wise_Test_Set", "generate_pairwise_tests", "save_to_csv", "PairWiseInputSet.csv"),
+    "metamorphic": ("Generate_Metamorphic_Test_Set", "generate_metamorphic_tests", "save_to_csv",
+                    "MetamorphicTestSet.csv"),
+}
+
+
+def run_generator(name, output_dir=".", force=False):
+    """
+    Generate and save one test set, returning its statistics
+
+    The test set is left alone when its manifest shows it was written by
+    the same generator sources and parameters (see Manifest.py), unless
+    force is set. Returns a dict with name, rows, path, seconds
+    (generation and saving), output (what the save function printed) and
+    regenerated (False if the test set was up to date).
+    """
+    module_name, generate_name, save_name, filename = GENERATORS[name]
+    start = time.perf_counter()
+
+    module = importlib.import_module(module_name)
+    path = os.path.join(output_dir, filename)
+    digest = fingerprint(module.SOURCES, module.PARAMETERS)
+
+    if not force and is_up_to_date(path, digest):
+        return {
+            "name": name,
+            "rows": read_manifest(path)["rows"],
+            "path": path,
+            "seconds": time.perf_counter() - start,
+            "output": "",
+            "regenerated": False,
+        }
+
+    test_cases = getattr(module, generate_name)()
+    output = io.StringIO()
+    with contextlib.redirect_stdout(output):
+        getattr(module, save_name)(test_cases, path)
+    write_manifest(path, digest, len(test_cases))
+
+    return {
+        "name": name,
+        "rows": len(test_cases),
+        "path": path,
+        "seconds": time.perf_counter() - start,
+        "output": output.getvalue(),
+        "regenerated": True,
+    }
+
+
+def generate_all(names=None, output_dir=".", workers=None, force=False):
+    """
+    Run the generators in names (all by default) concurrently
+
+    workers is the process pool size (None = one per generator, up to
+    the CPU count); workers=1 runs them one after another in this
+    process. force regenerates up to date test sets too. Returns the
+    run_generator statistics in the order of names.
+    """
+    names = list(GENERATORS) if names is None else list(names)
+    unknown = [name for name in names if name not in GENERATORS]
+    if unknown:
+        raise ValueError(f"Unknown generator(s): {', '.join(unknown)}")
+
+    if workers is None:
+        workers = min(len(names), os.cpu_count() or 1)
+    if workers <= 1 or len(names) <= 1:
+        return [run_generator(name, output_dir, force) for name in names]
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = [executor.submit(run_generator, name, output_dir, force) for name in names]
+        return [future.result() for future in futures]
+
+
+def main(argv=None):
+    """Generate every test set and print per-generator timing"""
+    parser = argparse.ArgumentParser(description="Generate all date converter test sets in parallel")
+    parser.add_argument("--only", nargs="+", choices=list(GENERATORS), help="Generators to run (default: all)")
+    parser.add_argument("--output-dir", default=".", help="Directory for the CSV files (default: current)")
+    parser.add_argument("--workers", type=int, default=None,
+                        help="Process pool size, 1 runs serially (default: one per generator)")
+    parser.add_argument("--force", action="store_true", help="Regenerate test sets even if they are up to date")
+    args = parser.parse_args(argv)
+
+    start = time.perf_counter()
+    results = generate_all(args.only, args.output_dir, args.workers, args.force)
+    total = time.perf_counter() - start
+
+    for result in results:
+        status = "" if result["regenerated"] else ", up to date"
+        print(f"✓ {result['name']}: {result['rows']} test cases -> {result['path']} ({result['seconds']:.3f}s{status})")
+    print(f"\nGenerated {sum(r['rows'] for r in results)} test cases in {total:.3f}s")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -7,6 +7,15 @@ import sys
 import os
 
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+sys.path.insert(0, os.path.abspath(os.path.dirname(__file__)))
+
+from Manifest import DATE_CONVERTER, fingerprint, is_up_to_date, read_manifest, write_manifest
+
+# Output file and fingerprint inputs, unchanged test sets are not regenerated
+OUTPUT_FILE = "BaseTestSet.csv"
+SOURCES = [os.path.abspath(__file__), DATE_CONVERTER]
+PARAMETERS = {}
+
 
 def generate_base_tests():
     """Generate base test cases"""
@@ -174,15 +183,21 @@ def save_tests_to_file(test_cases, filename="BaseTestSet.csv"):
     for cat, count in sorted(categories.items()):
         print(f"  {cat}: {count} tests")
 
-def main():
-    """Generate and save base test cases"""
+def main(force=False):
+    """Generate and save base test cases, skipped when the manifest is current unless force"""
+    digest = fingerprint(SOURCES, PARAMETERS)
+    if not force and is_up_to_date(OUTPUT_FILE, digest):
+        print(f"✓ {OUTPUT_FILE} is up to date ({read_manifest(OUTPUT_FILE)['rows']} test cases), use --force to regenerate")
+        return
+
     print("Generating Base Test Set...")
     test_cases = generate_base_tests()
-    save_tests_to_file(test_cases)
+    save_tests_to_file(test_cases, OUTPUT_FILE)
+    write_manifest(OUTPUT_FILE, digest, len(test_cases))
 
     print(f"\nSample test cases:")
     for tc in test_cases[:5]:
         print(f"{tc['test_id']}: {tc['date_input']} ({tc['input_format']} -> {tc['output_format']}) = {tc['expected_output']}")
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main(force="--force" in sys.argv[1:])
\ No newline at end of file
@@ -9,6 +9,15 @@ import csv
 from itertools import product
 
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+sys.path.insert(0, os.path.abspath(os.path.dirname(__file__)))
+
+from Manifest import DATE_CONVERTER, fingerprint, is_up_to_date, read_manifest, write_manifest
+
+# Output file and fingerprint inputs, unchanged test sets are not regenerated
+OUTPUT_FILE = "CategoryPartitionTestSet.csv"
+SOURCES = [os.path.abspath(__file__), DATE_CONVERTER]
+PARAMETERS = {}
+
 
 def generate_category_partition_tests():
     """
@@ -347,11 +356,17 @@ def save_tests_to_file(test_cases, filename="CategoryPartitionTestSet.csv"):
     print(f"✓ Generated {len(test_cases)} category-partition test cases")
     print(f"✓ Saved to {filename}")
 
-def main():
-    """Generate and save category-partition test cases"""
+def main(force=False):
+    """Generate and save category-partition test cases, skipped when the manifest is current unless force"""
+    digest = fingerprint(SOURCES, PARAMETERS)
+    if not force and is_up_to_date(OUTPUT_FILE, digest):
+        print(f"✓ {OUTPUT_FILE} is up to date ({read_manifest(OUTPUT_FILE)['rows']} test cases), use --force to regenerate")
+        return
+
     print("Generating Category-Partition Test Set...")
     test_cases = generate_category_partition_tests()
-    save_tests_to_file(test_cases)
+    save_tests_to_file(test_cases, OUTPUT_FILE)
+    write_manifest(OUTPUT_FILE, digest, len(test_cases))
 
     # Print summary by constraint
     constraints = {}
@@ -368,4 +383,4 @@ def main():
         print(f"{tc['test_id']}: {tc['date_input']} -> {tc['expected_output']} ({tc['constraint']})")
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main(force="--force" in sys.argv[1:])
\ No newline at end of file
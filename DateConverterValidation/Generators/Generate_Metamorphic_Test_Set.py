@@ -15,6 +15,15 @@ import sys
 import os
 
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+sys.path.insert(0, os.path.abspath(os.path.dirname(__file__)))
+
+from Manifest import DATE_CONVERTER, fingerprint, is_up_to_date, read_manifest, write_manifest
+
+# Output file and fingerprint inputs, unchanged test sets are not regenerated
+OUTPUT_FILE = "MetamorphicTestSet.csv"
+SOURCES = [os.path.abspath(__file__), DATE_CONVERTER]
+PARAMETERS = {}
+
 
 def generate_metamorphic_tests():
     """Generate all metamorphic test cases"""
@@ -256,13 +265,19 @@ def save_to_csv(test_cases, filename="MetamorphicTestSet.csv"):
     print(f"✓ Generated {len(test_cases)} metamorphic test cases")
     print(f"✓ Saved to {filename}")
 
-def main():
-    """Generate and save metamorphic test cases"""
+def main(force=False):
+    """Generate and save metamorphic test cases, skipped when the manifest is current unless force"""
+    digest = fingerprint(SOURCES, PARAMETERS)
+    if not force and is_up_to_date(OUTPUT_FILE, digest):
+        print(f"✓ {OUTPUT_FILE} is up to date ({read_manifest(OUTPUT_FILE)['rows']} test cases), use --force to regenerate")
+        return
+
     print("Generating Metamorphic Test Set...")
     print("Based on 5 metamorphic relations")
 
     test_cases = generate_metamorphic_tests()
-    save_to_csv(test_cases)
+    save_to_csv(test_cases, OUTPUT_FILE)
+    write_manifest(OUTPUT_FILE, digest, len(test_cases))
 
     # Print summary by MR type
     mr_counts = {}
@@ -281,4 +296,4 @@ def main():
             print(f"  {sample['test_id']} ({mr_type}): {sample['description']}")
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main(force="--force" in sys.argv[1:])
\ No newline at end of file
@@ -6,14 +6,71 @@ Uses combinatorial testing to generate test cases efficiently
 import csv
 import sys
 import os
-from allpairspy import AllPairs
 
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+sys.path.insert(0, os.path.abspath(os.path.dirname(__file__)))
 
-def generate_pairwise_tests():
+from Manifest import DATE_CONVERTER, fingerprint, is_up_to_date, read_manifest, write_manifest
+
+# Output file and fingerprint inputs, unchanged test sets are not regenerated
+OUTPUT_FILE = "PairWiseInputSet.csv"
+SOURCES = [os.path.abspath(__file__), os.path.join(os.path.dirname(os.path.abspath(__file__)), 'Pairwise_Engine.py'),
+           DATE_CONVERTER]
+
+from Pairwise_Engine import PairwiseEngine, implies
+
+# Days that end each month of the model, used by the month_end scenario
+MONTH_END_DAYS = {"01": "31", "02": "28", "04": "30", "06": "30", "12": "31"}
+
+
+def month_end_constraint(row):
+    """month_end rows use a real month and its last day"""
+    if row.get("scenario") != "month_end":
+        return True
+    month = row.get("month")
+    if month is not None and month not in MONTH_END_DAYS:
+        return False
+    return month is None or "day" not in row or row["day"] == MONTH_END_DAYS[month]
+
+
+# Scenario constraints, applied while the pairwise rows are generated
+SCENARIO_CONSTRAINTS = [
+    implies({"scenario": "leap_feb29"}, {"month": ["02"], "day": ["29"]}),
+    implies({"scenario": "invalid_day"}, {"day": ["32"]}),
+    implies({"scenario": "invalid_month"}, {"month": ["13"]}),
+    month_end_constraint,
+]
+
+# Parameter values for pairwise testing
+PARAMETER_MODEL = {
+    # Input format categories
+    "input_format": ["YYYY-MM-DD", "DD-MM-YYYY", "YYYY/MM/DD", "DD/MM/YYYY", "YY-MM-DD", "YYYY-MMM-DD"],
+
+    # Output format categories
+    "output_format": ["YYYY-MM-DD", "DD-MM-YYYY", "YYYY/MM/DD", "DD/MM/YYYY", "YY-MM-DD", "DD-MMM-YYYY"],
+
+    # Year types
+    "year": ["2024", "2020", "2000", "1900", "0001", "9999", "99", "00"],
+
+    # Month types
+    "month": ["01", "02", "04", "06", "12", "00", "13"],
+
+    # Day types
+    "day": ["01", "15", "28", "29", "30", "31", "00", "32"],
+
+    # Date validity scenarios
+    "scenario": ["typical", "leap_feb29", "month_end", "invalid_day", "invalid_month", "boundary"]
+}
+
+# Default seed of the pairwise engine
+SEED = 0
+PARAMETERS = {"seed": SEED, "model": PARAMETER_MODEL}
+
+
+def generate_pairwise_tests(seed=SEED):
     """
     Generate pairwise test cases for date converter
-    Uses All-Pairs combinatorial testing technique
+    Uses All-Pairs combinatorial testing technique, seeded for reproducible rows
 
     Parameters:
     1. Input Format
@@ -24,32 +81,11 @@ def generate_pairwise_tests():
     6. Separator Type
     """
 
-    # Define parameter values for pairwise testing
-    parameters = [
-        # Input format categories
-        ["YYYY-MM-DD", "DD-MM-YYYY", "YYYY/MM/DD", "DD/MM/YYYY", "YY-MM-DD", "YYYY-MMM-DD"],
-
-        # Output format categories
-        ["YYYY-MM-DD", "DD-MM-YYYY", "YYYY/MM/DD", "DD/MM/YYYY", "YY-MM-DD", "DD-MMM-YYYY"],
-
-        # Year types
-        ["2024", "2020", "2000", "1900", "0001", "9999", "99", "00"],
-
-        # Month types
-        ["01", "02", "04", "06", "12", "00", "13"],
-
-        # Day types
-        ["01", "15", "28", "29", "30", "31", "00", "32"],
-
-        # Date validity scenarios
-        ["typical", "leap_feb29", "month_end", "invalid_day", "invalid_month", "boundary"]
-    ]
-
     test_cases = []
     test_id = 1
 
-    # Generate all-pairs combinations
-    for combination in AllPairs(parameters):
+    # Generate all-pairs combinations, scenario constraints included
+    for combination in PairwiseEngine(PARAMETER_MODEL, SCENARIO_CONSTRAINTS, seed=seed):
         in_fmt_cat, out_fmt_cat, year, month, day, scenario = combination
 
         # Map format categories to actual format names
@@ -98,23 +134,7 @@ def map_format_category(fmt_category):
     return format_map.get(fmt_category, "D_YYYYMMDD")
 
 def build_date_from_params(fmt_category, year, month, day, scenario):
-    """Build date string from parameters"""
-    # Handle special scenarios
-    if scenario == "leap_feb29":
-        month = "02"
-        day = "29"
-    elif scenario == "month_end":
-        if month in ["01", "03", "05", "07", "08", "10", "12"]:
-            day = "31"
-        elif month in ["04", "06", "09", "11"]:
-            day = "30"
-        elif month == "02":
-            day = "28"
-    elif scenario == "invalid_day":
-        day = "32"
-    elif scenario == "invalid_month":
-        month = "13"
-
+    """Build date string from parameters (scenario constraints already hold)"""
     # Adjust year format if needed
     if "YY-" in fmt_category and len(year) == 4:
         year = year[-2:]  # Take last 2 digits
@@ -240,13 +260,19 @@ def save_to_csv(test_cases, filename="PairWiseInputSet.csv"):
     print(f"✓ Generated {len(test_cases)} pairwise test cases")
     print(f"✓ Saved to {filename}")
 
-def main():
-    """Generate and save pairwise test cases"""
+def main(force=False):
+    """Generate and save pairwise test cases, skipped when the manifest is current unless force"""
+    digest = fingerprint(SOURCES, PARAMETERS)
+    if not force and is_up_to_date(OUTPUT_FILE, digest):
+        print(f"✓ {OUTPUT_FILE} is up to date ({read_manifest(OUTPUT_FILE)['rows']} test cases), use --force to regenerate")
+        return
+
     print("Generating Pairwise (All-Pairs) Test Set...")
     print("Using combinatorial testing technique")
 
     test_cases = generate_pairwise_tests()
-    save_to_csv(test_cases)
+    save_to_csv(test_cases, OUTPUT_FILE)
+    write_manifest(OUTPUT_FILE, digest, len(test_cases))
 
     # Print summary by scenario
     scenarios = {}
@@ -269,4 +295,4 @@ def main():
         print(f"{tc['test_id']}: {tc['date_input']} ({tc['input_format']} -> {tc['output_format']})")
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main(force="--force" in sys.argv[1:])
\ No newline at end of file
@@ -0,0 +1,69 @@
+"""
+Test Set Manifests
+Fingerprints generator inputs so unchanged test sets are not rewritten
+"""
+
+import hashlib
+import json
+import os
+from pathlib import Path
+
+# Module under test, part of every generator's fingerprint
+DATE_CONVERTER = Path(__file__).resolve().parent.parent / "DateConverter.py"
+
+
+def manifest_path(output_file):
+    """BaseTestSet.csv -> BaseTestSet.manifest.json"""
+    return Path(output_file).with_suffix(".manifest.json")
+
+
+def file_digest(path):
+    """SHA-256 of a file's bytes"""
+    return hashlib.sha256(Path(path).read_bytes()).hexdigest()
+
+
+def fingerprint(sources, parameters):
+    """
+    SHA-256 over source files (name and content, line endings normalised)
+    and the generator parameters (seed, parameter model, ...)
+    """
+    digest = hashlib.sha256()
+    for source in sources:
+        digest.update(Path(source).name.encode())
+        digest.update(b"\0")
+        digest.update(Path(source).read_bytes().replace(b"\r\n", b"\n"))
+        digest.update(b"\0")
+    digest.update(json.dumps(parameters, sort_keys=True, default=repr).encode())
+    return digest.hexdigest()
+
+
+def read_manifest(output_file):
+    """Manifest stored next to output_file, None if missing or unreadable"""
+    try:
+        with open(manifest_path(output_file), 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def is_up_to_date(output_file, fingerprint_digest):
+    """True if output_file exists unchanged since a run with the same fingerprint"""
+    manifest = read_manifest(output_file)
+    if manifest is None or manifest.get("fingerprint") != fingerprint_digest:
+        return False
+    if not os.path.exists(output_file):
+        return False
+    return manifest.get("outputs", {}).get(Path(output_file).name) == file_digest(output_file)
+
+
+def write_manifest(output_file, fingerprint_digest, rows):
+    """Record the fingerprint, row count and output digest next to output_file"""
+    manifest = {
+        "fingerprint": fingerprint_digest,
+        "rows": rows,
+        "outputs": {Path(output_file).name: file_digest(output_file)},
+    }
+    with open(manifest_path(output_file), 'w', encoding='utf-8', newline='\n') as f:
+        json.dump(manifest, f, indent=2, sort_keys=True)
+        f.write("\n")
+    return manifest
@@ -0,0 +1,185 @@
+"""
+Pairwise (All-Pairs) Combinatorial Engine
+Builds test rows covering every pair of parameter values, with constraints
+checked while rows are built and deterministic seeding
+"""
+
+import random
+
+
+class PairwiseEngine:
+    """
+    Greedy all-pairs generator
+
+    parameters is a dict of name -> list of values (or a list of value
+    lists, named 0, 1, ...). Every pair of values of every two parameters
+    that the constraints allow appears in at least one row.
+
+    Uncovered pairs of parameters i < j are tracked as one int bitset per
+    parameter pair, bit a * len(values_j) + b standing for (values_i[a],
+    values_j[b]). Each row starts from the first uncovered pair and fills
+    the other parameters with the value covering the most uncovered pairs
+    with the values already chosen, ties broken by a random.Random(seed).
+    When the constraints leave no value for a parameter on that greedy
+    path, a depth-first search with backtracking looks for any valid row
+    containing the pair; a pair is only given up when there is none.
+
+    A constraint is a callable taking a dict of the parameter values
+    chosen so far (name -> value) and returning False if they can never
+    be part of a valid row. It must return True while the parameters it
+    looks at are not all chosen yet; implies() builds the common kind.
+    """
+
+    def __init__(self, parameters, constraints=(), seed=0):
+        if isinstance(parameters, dict):
+            self.names = list(parameters)
+            self.values = [list(values) for values in parameters.values()]
+        else:
+            self.names = list(range(len(parameters)))
+            self.values = [list(values) for values in parameters]
+
+        if any(not values for values in self.values):
+            raise ValueError("Every parameter needs at least one value")
+
+        self.constraints = list(constraints)
+        self.seed = seed
+
+    def allowed(self, assignment):
+        """Check the constraints on a dict of parameter index -> value index"""
+        if not self.constraints:
+            return True
+        row = {self.names[p]: self.values[p][v] for p, v in assignment.items()}
+        return all(constraint(row) for constraint in self.constraints)
+
+    def _initial_pairs(self):
+        """Bitsets of the pairs to cover, pairs ruled out by the constraints left out"""
+        sizes = [len(values) for values in self.values]
+        uncovered = {}
+        for i in range(len(sizes)):
+            for j in range(i + 1, len(sizes)):
+                bits = 0
+                for a in range(sizes[i]):
+                    for b in range(sizes[j]):
+                        if self.allowed({i: a, j: b}):
+                            bits |= 1 << (a * sizes[j] + b)
+                uncovered[i, j] = bits
+        return uncovered
+
+    def _complete(self, assignment, uncovered, rng):
+        """Fill the unassigned parameters greedily, None if the constraints allow no value"""
+        sizes = [len(values) for values in self.values]
+        for p in range(len(sizes)):
+            if p in assignment:
+                continue
+
+            # masks of the values of p still uncovered together with each chosen value
+            masks = []
+            for q, a in assignment.items():
+                if q < p:
+                    masks.append(uncovered[q, p] >> (a * sizes[p]))
+                else:
+                    bits = uncovered[p, q]
+                    masks.append(sum(((bits >> (v * sizes[q] + a)) & 1) << v for v in range(sizes[p])))
+
+            best, best_gain = [], -1
+            for v in range(sizes[p]):
+                gain = sum((mask >> v) & 1 for mask in masks)
+                if gain < best_gain:
+                    continue
+                assignment[p] = v
+                if self.allowed(assignment):
+                    if gain > best_gain:
+                        best, best_gain = [v], gain
+                    else:
+                        best.append(v)
+                del assignment[p]
+
+            if not best:
+                return None
+            assignment[p] = best[0] if len(best) == 1 else rng.choice(best)
+        return assignment
+
+    def _search(self, assignment):
+        """Any valid completion of assignment by backtracking search, None if there is none"""
+        sizes = [len(values) for values in self.values]
+        free = [p for p in range(len(sizes)) if p not in assignment]
+
+        def extend(k):
+            if k == len(free):
+                return True
+            p = free[k]
+            for v in range(sizes[p]):
+                assignment[p] = v
+                if self.allowed(assignment) and extend(k + 1):
+                    return True
+            del assignment[p]
+            return False
+
+        return assignment if extend(0) else None
+
+    def __iter__(self):
+        rng = random.Random(self.seed)
+        sizes = [len(values) for values in self.values]
+
+        if len(sizes) < 2:
+            for v in range(sizes[0] if sizes else 0):
+                if self.allowed({0: v}):
+                    yield [self.values[0][v]]
+            return
+
+        uncovered = self._initial_pairs()
+        pairs = list(uncovered)
+
+        for i, j in pairs:
+            while uncovered[i, j]:
+                bits = uncovered[i, j]
+                index = (bits & -bits).bit_length() - 1
+                pair = {i: index // sizes[j], j: index % sizes[j]}
+                assignment = self._complete(dict(pair), uncovered, rng)
+                if assignment is None:
+                    # the greedy choices ran into the constraints, the pair may still fit another row
+                    assignment = self._search(pair)
+
+                if assignment is None:
+                    # no valid row contains this pair
+                    uncovered[i, j] &= ~(1 << index)
+                    continue
+
+                for p, q in pairs:
+                    uncovered[p, q] &= ~(1 << (assignment[p] * sizes[q] + assignment[q]))
+                yield [self.values[p][assignment[p]] for p in range(len(sizes))]
+
+
+def all_pairs(parameters, constraints=(), seed=0):
+    """List of pairwise rows, see PairwiseEngine"""
+    return list(PairwiseEngine(parameters, constraints, seed))
+
+
+def implies(condition, requirement):
+    """
+    Constraint: when every parameter in condition (name -> value) has that
+    value, every parameter in requirement (name -> allowed values) must
+    take one of its allowed values
+    """
+    requirement = {name: set(allowed) for name, allowed in requirement.items()}
+
+    def constraint(row):
+        if all(name in row and row[name] == value for name, value in condition.items()):
+            return all(row[name] in allowed for name, allowed in requirement.items() if name in row)
+        return True
+
+    return constraint
+
+
+def uncovered_pairs(rows, parameters, constraints=()):
+    """Pairs of (name, value) some valid row contains but missing from rows"""
+    engine = PairwiseEngine(parameters, constraints)
+    missing = set()
+    for i in range(len(engine.names)):
+        for j in range(i + 1, len(engine.names)):
+            seen = {(row[i], row[j]) for row in rows}
+            for a, value_a in enumerate(engine.values[i]):
+                for b, value_b in enumerate(engine.values[j]):
+                    if (value_a, value_b) not in seen and engine._search({i: a, j: b}) is not None:
+                        missing.add(((engine.names[i], value_a), (engine.names[j], value_b)))
+    return missing
@@ -0,0 +1,37 @@
+"""
+In-Process Mutation Testing engine for DateConverterValidation
+The engine is the quadratic solver project's Mutation_Engine.py, at
+ENGINE_PATH; it is loaded from that file as a module of its own, without
+changing sys.path, and its public names are re-exported here
+"""
+
+import importlib.util
+import sys
+from pathlib import Path
+
+ENGINE_PATH = Path(__file__).resolve().parent.parent / "Quadratic Equation Solver" / "Mutation_Engine.py"
+
+
+def load_engine(path=ENGINE_PATH):
+    """Execute the engine source at path as the module quadratic_mutation_engine (in sys.modules)"""
+    spec = importlib.util.spec_from_file_location("quadratic_mutation_engine", path)
+    if spec is None or not Path(path).is_file():
+        raise ImportError(f"The mutation engine is not at {path}, it comes with the quadratic solver project")
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[spec.name] = module
+    try:
+        spec.loader.exec_module(module)
+    except BaseException:
+        del sys.modules[spec.name]
+        raise
+    return module
+
+
+_engine = load_engine()
+
+Mutation = _engine.Mutation
+MutantTimeout = _engine.MutantTimeout
+MutationEngine = _engine.MutationEngine
+find_mutations = _engine.find_mutations
+summarize = _engine.summarize
+print_results = _engine.print_results
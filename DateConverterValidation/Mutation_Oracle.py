@@ -0,0 +1,132 @@
+"""
+In-Process Mutation Testing for DateConverter.py
+Checks AST mutants of the converter against the generated test sets held
+in memory, using the mutation engine in Mutation_Engine.py
+"""
+
+import argparse
+import csv
+import sys
+import time
+from pathlib import Path
+
+from Mutation_Engine import MutationEngine, print_results
+
+PROJECT_DIR = Path(__file__).resolve().parent
+GENERATED_DIR = PROJECT_DIR / "Generators"
+
+# Test sets with date_input, input_format, output_format, expected_output columns
+CONVERSION_TEST_SETS = ["BaseTestSet.csv", "CategoryPartitionTestSet.csv", "PairWiseInputSet.csv"]
+METAMORPHIC_TEST_SET = "MetamorphicTestSet.csv"
+
+# Functions on the convert_between_formats path, mutated by default
+CONVERSION_FUNCTIONS = [
+    "convert_between_formats", "convert_with_plans", "strptime_convert", "is_leap_year", "is_valid_date",
+    "get_python_format", "get_format_layout", "FormatPlan.__init__", "FormatPlan.split_numeric",
+]
+
+
+def expected_value(text):
+    """Empty or 'None' expected output means the conversion must fail"""
+    return None if text in ("", "None") else text
+
+
+def load_checks(directory=GENERATED_DIR):
+    """
+    Read the test sets once into (description, inputs, expected) checks
+
+    Conversion rows become one convert_between_formats call each. Of the
+    metamorphic rows, round-trips (seed -> step1 -> step2 equals seed)
+    and invalid inputs (seed -> step1 is None) are checked.
+    """
+    checks = []
+    for name in CONVERSION_TEST_SETS:
+        with open(Path(directory) / name, 'r', encoding='utf-8') as f:
+            for row in csv.DictReader(f):
+                inputs = (row['date_input'], row['input_format'], row['output_format'])
+                checks.append((row['test_id'], [inputs], expected_value(row['expected_output'])))
+
+    with open(Path(directory) / METAMORPHIC_TEST_SET, 'r', encoding='utf-8') as f:
+        for row in csv.DictReader(f):
+            first = (row['seed_input'], row['seed_format'], row['step1_format'])
+            if row['mr_type'] == 'Round-trip':
+                checks.append((row['test_id'], [first, (None, row['step1_format'], row['step2_format'])],
+                               row['seed_input']))
+            elif row['mr_type'] == 'Invalid remains invalid':
+                checks.append((row['test_id'], [first], None))
+    return checks
+
+
+def run_check(convert, steps):
+    """Result of the conversion steps, a None date stands for the previous result"""
+    result = None
+    for date_str, from_format, to_format in steps:
+        result = convert(result if date_str is None else date_str, from_format, to_format)
+    return result
+
+
+def date_converter_oracle(directory=GENERATED_DIR, reference=None):
+    """
+    Oracle for DateConverter.py mutants, see Mutation_Engine.py
+
+    Returns a callable taking a mutant module and returning None if every
+    check passes, or a description of the first failing check.
+
+    Some generated rows expect what the converter does not do (e.g. the
+    _N formats of the category partition set). With a reference module,
+    checks failing on it are left out and their ids kept in
+    oracle.dropped, so mutants are only judged by checks the original
+    passes.
+    """
+    checks = load_checks(directory)
+    dropped = []
+    if reference is not None:
+        kept = []
+        for check in checks:
+            if run_check(reference.convert_between_formats, check[1]) == check[2]:
+                kept.append(check)
+            else:
+                dropped.append(check[0])
+        checks = kept
+
+    def oracle(module):
+        convert = module.convert_between_formats
+        for test_id, steps, expected in checks:
+            result = run_check(convert, steps)
+            if result != expected:
+                return f"{test_id}: got {result!r}, expected {expected!r}"
+        return None
+
+    oracle.rows = len(checks)
+    oracle.dropped = dropped
+    return oracle
+
+
+def main(argv=None):
+    """Mutate DateConverter.py and report the surviving mutants"""
+    parser = argparse.ArgumentParser(description="Mutation test DateConverter.py in process against the test sets")
+    parser.add_argument("--test-sets", default=str(GENERATED_DIR), help="Directory of the generated test set CSVs")
+    parser.add_argument("--function", action="append", dest="functions",
+                        help="Only mutate this function, may be repeated (default: the conversion path)")
+    parser.add_argument("--all-functions", action="store_true", help="Mutate every function")
+    parser.add_argument("--timeout", type=float, default=1.0, help="Seconds per mutant (default: 1)")
+    args = parser.parse_args(argv)
+
+    functions = None if args.all_functions else (args.functions or CONVERSION_FUNCTIONS)
+    engine = MutationEngine(PROJECT_DIR / "DateConverter.py", functions)
+    try:
+        oracle = date_converter_oracle(args.test_sets, reference=engine.module())
+        start = time.perf_counter()
+        results = engine.run(oracle, timeout=args.timeout)
+    except (OSError, ValueError) as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
+
+    if oracle.dropped:
+        print(f"Left out {len(oracle.dropped)} checks the original fails: {', '.join(oracle.dropped)}", file=sys.stderr)
+    print_results(results, time.perf_counter() - start)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -4,6 +4,7 @@ Executes all test techniques and generates comparative analysis
 """
 
 import subprocess
+import sys
 import time
 import json
 import os
@@ -28,27 +29,20 @@ class TestAnalyzer:
         print("STEP 1: GENERATING TEST CASES")
         print("=" * 70)
 
-        generators = [
-            "Generators/Generate_Base_Test_Set.py",
-            "Generators/Generate_Category_Partition_Test_Set.py",
-            "Generators/Generate_Pair_Wise_Test_Set.py",
-            "Generators/Generate_Metamorphic_Test_Set.py"
-        ]
+        # generator functions run in one process pool, no interpreter per script
+        sys.path.insert(0, str(Path(__file__).parent.parent / "Generators"))
+        from Generate_All_Test_Sets import generate_all
 
-        for generator in generators:
-            print(f"\n→ Running {generator}...")
-            try:
-                result = subprocess.run(
-                    ['python', generator],
-                    capture_output=True,
-                    text=True,
-                    timeout=30
-                )
-                print(result.stdout)
-                if result.returncode != 0:
-                    print(f"Error: {result.stderr}")
-            except Exception as e:
-                print(f"Failed to run {generator}: {e}")
+        try:
+            results = generate_all()
+        except Exception as e:
+            print(f"Failed to generate test cases: {e}")
+            results = []
+
+        for result in results:
+            print(f"\n→ {result['name']}: {result['rows']} test cases in {result['seconds']:.3f}s")
+            print(result['output'])
+            self.results['summary'].setdefault('generation_times', {})[result['name']] = result['seconds']
 
         print("\n✓ Test case generation complete")
 
@@ -0,0 +1,99 @@
+"""
+Tests for the LRU conversion cache (ConversionCache, memoize_conversions)
+"""
+
+import unittest
+import sys
+import os
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from DateConverter import (
+    ConversionCache,
+    cached_convert_between_formats,
+    convert_between_formats,
+    memoize_conversions
+)
+
+
+class TestConversionCache(unittest.TestCase):
+    """Hit/miss/eviction accounting and results"""
+
+    def setUp(self):
+        self.calls = []
+
+        def convert(date_str, from_format_name, to_format_name):
+            self.calls.append(date_str)
+            return convert_between_formats(date_str, from_format_name, to_format_name)
+
+        self.cache = ConversionCache(convert, maxsize=2)
+
+    def test_results_match_uncached(self):
+        for date_str in ["2024-12-07", "2024-02-30", "", None]:
+            self.assertEqual(self.cache(date_str, "D_YYYYMMDD", "S_DDMMYYYY"),
+                             convert_between_formats(date_str, "D_YYYYMMDD", "S_DDMMYYYY"))
+
+    def test_hits_and_misses(self):
+        self.cache("2024-12-07", "D_YYYYMMDD", "S_DDMMYYYY")
+        self.cache("2024-12-07", "D_YYYYMMDD", "S_DDMMYYYY")
+        self.cache("2024-12-07", "D_YYYYMMDD", "D_YYMMDD")
+
+        stats = self.cache.stats()
+        self.assertEqual((stats['hits'], stats['misses'], stats['size']), (1, 2, 2))
+        self.assertEqual(stats['hit_rate'], 1 / 3)
+        self.assertEqual(len(self.calls), 2)
+
+    def test_negative_caching(self):
+        self.assertIsNone(self.cache("2024-02-30", "D_YYYYMMDD", "S_DDMMYYYY"))
+        self.assertIsNone(self.cache("2024-02-30", "D_YYYYMMDD", "S_DDMMYYYY"))
+        self.assertEqual(self.calls, ["2024-02-30"])
+        self.assertEqual(self.cache.stats()['hits'], 1)
+
+    def test_lru_eviction(self):
+        for date_str in ["2024-12-01", "2024-12-02", "2024-12-01", "2024-12-03"]:
+            self.cache(date_str, "D_YYYYMMDD", "S_DDMMYYYY")
+
+        stats = self.cache.stats()
+        self.assertEqual((stats['evictions'], stats['size'], stats['maxsize']), (1, 2, 2))
+
+        # 2024-12-02 was least recently used, 2024-12-01 must still be cached
+        self.cache("2024-12-01", "D_YYYYMMDD", "S_DDMMYYYY")
+        self.cache("2024-12-02", "D_YYYYMMDD", "S_DDMMYYYY")
+        self.assertEqual(self.calls.count("2024-12-01"), 1)
+        self.assertEqual(self.calls.count("2024-12-02"), 2)
+
+    def test_clear(self):
+        self.cache("2024-12-07", "D_YYYYMMDD", "S_DDMMYYYY")
+        self.cache.clear()
+        self.assertEqual(self.cache.stats(), {'hits': 0, 'misses': 0, 'evictions': 0,
+                                              'size': 0, 'maxsize': 2, 'hit_rate': 0.0})
+
+    def test_unhashable_arguments_bypass_cache(self):
+        self.assertIsNone(self.cache(["2024-12-07"], "D_YYYYMMDD", "S_DDMMYYYY"))
+        self.assertEqual(self.cache.stats()['size'], 0)
+
+    def test_invalid_maxsize(self):
+        with self.assertRaises(ValueError):
+            ConversionCache(maxsize=0)
+
+
+class TestMemoizeConversions(unittest.TestCase):
+    """Decorator and module-level cached converter"""
+
+    def test_decorator(self):
+        @memoize_conversions(maxsize=8)
+        def to_upper(date_str, from_format_name, to_format_name):
+            return date_str.upper()
+
+        self.assertEqual(to_upper("dec", "a", "b"), "DEC")
+        self.assertEqual(to_upper("dec", "a", "b"), "DEC")
+        self.assertEqual(to_upper.stats()['hits'], 1)
+        self.assertEqual(to_upper.stats()['maxsize'], 8)
+
+    def test_cached_convert_between_formats(self):
+        self.assertEqual(cached_convert_between_formats("2024-12-07", "D_YYYYMMDD", "S_DDMMYYYY"),
+                         "07/12/2024")
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,66 @@
+"""
+Tests for the NumPy-vectorised converter convert_array and valid_date_mask
+"""
+
+import pytest
+import sys
+from pathlib import Path
+
+import numpy as np
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from DateConverter import convert_array, convert_many, is_valid_date, valid_date_mask
+
+
+class TestValidDateMask:
+    """valid_date_mask must agree with is_valid_date"""
+
+    def test_matches_is_valid_date(self):
+        years = np.array([0, 1, 1900, 2000, 2019, 2020, 2024, 9999, 10000])
+        months = np.arange(0, 14)
+        days = np.array([0, 1, 28, 29, 30, 31, 32])
+        y, m, d = (grid.ravel() for grid in np.meshgrid(years, months, days, indexing='ij'))
+
+        expected = [is_valid_date(*row) for row in zip(y.tolist(), m.tolist(), d.tolist())]
+        assert valid_date_mask(y, m, d).tolist() == expected
+
+
+class TestConvertArray:
+    """Vectorised conversion of fixed-width byte strings"""
+
+    DATES = ["2024-12-07", "2020-02-29", "2019-02-29", "0001-01-01", "9999-12-31",
+             "0000-01-01", "2024-13-01", "2024-06-31", "2024/12/07", "2024-1-5",
+             " 2024-12-07", "", "20x4-12-07"]
+
+    @pytest.mark.parametrize("to_format", ["S_DDMMYYYY", "D_YYMMDD", "S_DDMMyy", "D_YYYYMMDD"])
+    def test_matches_convert_many(self, to_format):
+        dates = np.array([d.encode() for d in self.DATES])
+        converted, valid = convert_array(dates, "D_YYYYMMDD", to_format)
+
+        expected = convert_many(self.DATES, "D_YYYYMMDD", to_format)
+        assert valid.tolist() == [e is not None for e in expected]
+        assert [c.decode() if v else None for c, v in zip(converted, valid)] == expected
+
+    def test_two_digit_year_input(self):
+        dates = np.array([b"68-01-01", b"69-01-01", b"00-02-29"], dtype='S8')
+        converted, valid = convert_array(dates, "D_YYMMDD", "S_DDMMYYYY")
+        assert converted.tolist() == [b"01/01/2068", b"01/01/1969", b"29/02/2000"]
+        assert valid.all()
+
+    def test_output_dtype_and_shape(self):
+        dates = np.array([[b"2024-12-07", b"2024-02-30"]], dtype='S10')
+        converted, valid = convert_array(dates, "D_YYYYMMDD", "S_YYMMDD")
+        assert converted.dtype == np.dtype('S8')
+        assert converted.shape == valid.shape == (1, 2)
+        assert converted.tolist() == [[b"24/12/07", b""]]
+        assert valid.tolist() == [[True, False]]
+
+    def test_rejects_non_numeric_formats(self):
+        with pytest.raises(ValueError):
+            convert_array(np.array([b"2024-Dec-07"]), "D_YYYYMMDD_N", "D_YYYYMMDD")
+        with pytest.raises(ValueError):
+            convert_array(np.array([b"2024-12-07"]), "D_YYYYMMDD", "INVALID")
+
+    def test_rejects_unicode_arrays(self):
+        with pytest.raises(ValueError):
+            convert_array(np.array(["2024-12-07"]), "D_YYYYMMDD", "S_DDMMYYYY")
@@ -0,0 +1,135 @@
+"""
+Tests for streaming file conversion and the python -m DateConverter CLI
+"""
+
+import io
+import pytest
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from DateConverter import convert_file, convert_file_parallel, convert_lines, main, split_line_ranges
+
+
+class TestConvertLines:
+    """Chunked conversion of open text files"""
+
+    def test_one_date_per_line(self):
+        output = io.StringIO()
+        stats = convert_lines(io.StringIO("2024-12-07\n2024-02-30\r\n\n2020-02-29"), output,
+                              "D_YYYYMMDD", "S_DDMMYYYY", chunk_size=2)
+        assert output.getvalue() == "07/12/2024\n\n\n29/02/2020\n"
+        assert stats == (4, 2)
+
+    def test_csv_column_by_name(self):
+        output = io.StringIO()
+        stats = convert_lines(io.StringIO("id,date\n1,2024-12-07\n2,bad\n"), output,
+                              "D_YYYYMMDD", "D_YYMMDD", column="date")
+        assert output.getvalue() == "id,date\n1,24-12-07\n2,\n"
+        assert stats == (2, 1)
+
+    def test_csv_column_by_index(self):
+        output = io.StringIO()
+        stats = convert_lines(io.StringIO("07/12/2024;x\n29/02/2019;y\n"), output,
+                              "S_DDMMYYYY", "D_YYYYMMDD", column=0, delimiter=";")
+        assert output.getvalue() == "2024-12-07;x\n;y\n"
+        assert stats == (2, 1)
+
+    def test_csv_header_with_index(self):
+        output = io.StringIO()
+        convert_lines(io.StringIO("date\n2024-12-07\n"), output,
+                      "D_YYYYMMDD", "S_YYYYMMDD", column=0, header=True)
+        assert output.getvalue() == "date\n2024/12/07\n"
+
+    def test_short_rows_are_invalid(self):
+        output = io.StringIO()
+        stats = convert_lines(io.StringIO("a,2024-12-07\nb\n"), output,
+                              "D_YYYYMMDD", "S_YYYYMMDD", column=1)
+        assert output.getvalue() == "a,2024/12/07\nb\n"
+        assert stats == (2, 1)
+
+    def test_missing_column(self):
+        with pytest.raises(ValueError):
+            convert_lines(io.StringIO("id,date\n"), io.StringIO(), "D_YYYYMMDD", "S_YYYYMMDD", column="day")
+
+
+class TestConvertFileCli:
+    """File paths and command line entry point"""
+
+    def test_convert_file(self, tmp_path):
+        input_path = tmp_path / "in.txt"
+        output_path = tmp_path / "out.txt"
+        input_path.write_text("2024-12-07\n2019-02-29\n")
+
+        stats = convert_file(str(input_path), str(output_path), "D_YYYYMMDD", "D_DDMMYYYY")
+        assert stats == (2, 1)
+        assert output_path.read_text() == "07-12-2024\n\n"
+
+    def test_unknown_format(self, tmp_path):
+        with pytest.raises(ValueError):
+            convert_file(str(tmp_path / "in.txt"), str(tmp_path / "out.txt"), "D_YYYYMMDD", "INVALID")
+
+    def test_main(self, tmp_path, capsys):
+        input_path = tmp_path / "in.csv"
+        output_path = tmp_path / "out.csv"
+        input_path.write_text("when\n2024-12-07\n")
+
+        exit_code = main(["convert", str(input_path), str(output_path),
+                          "--from", "D_YYYYMMDD", "--to", "S_DDMMYYYY", "--column", "when"])
+        assert exit_code == 0
+        assert output_path.read_text() == "when\n07/12/2024\n"
+        assert "Converted 1 rows, 0 invalid" in capsys.readouterr().err
+
+    def test_main_missing_file(self, tmp_path, capsys):
+        exit_code = main(["convert", str(tmp_path / "missing.txt"), str(tmp_path / "out.txt"),
+                          "--from", "D_YYYYMMDD", "--to", "S_DDMMYYYY"])
+        assert exit_code == 1
+        assert "Error" in capsys.readouterr().err
+
+
+class TestConvertFileParallel:
+    """Process pool conversion must match the serial converter"""
+
+    LINES = ["2024-12-07", "2024-02-30", "", "0001-01-01", "2020-02-29", "bad", "2024-1-5"] * 7
+
+    def test_split_line_ranges(self, tmp_path):
+        input_path = tmp_path / "in.txt"
+        input_path.write_bytes(b"aaaa\nbb\ncccccc\nd")
+        ranges = split_line_ranges(str(input_path), 0, 3)
+        assert ranges == [(0, 5), (5, 15), (15, 16)]
+
+    def test_lines_match_serial(self, tmp_path):
+        input_path = tmp_path / "in.txt"
+        input_path.write_text("\n".join(self.LINES) + "\n")
+
+        serial = convert_file(str(input_path), str(tmp_path / "serial.txt"), "D_YYYYMMDD", "S_DDMMyy")
+        parallel = convert_file_parallel(str(input_path), str(tmp_path / "parallel.txt"),
+                                         "D_YYYYMMDD", "S_DDMMyy", workers=2, chunk_bytes=16)
+        assert parallel == serial
+        assert (tmp_path / "parallel.txt").read_text() == (tmp_path / "serial.txt").read_text()
+
+    def test_csv_match_serial(self, tmp_path):
+        input_path = tmp_path / "in.csv"
+        input_path.write_text("id,date\n" + "".join(f'{i},{d},"x,{i}"\n' for i, d in enumerate(self.LINES)))
+
+        serial = convert_file(str(input_path), str(tmp_path / "serial.csv"),
+                              "D_YYYYMMDD", "D_DDMMYYYY", column="date")
+        parallel = convert_file_parallel(str(input_path), str(tmp_path / "parallel.csv"),
+                                         "D_YYYYMMDD", "D_DDMMYYYY", column="date",
+                                         workers=3, chunk_bytes=40)
+        assert parallel == serial == (len(self.LINES), 21)
+        assert (tmp_path / "parallel.csv").read_text() == (tmp_path / "serial.csv").read_text()
+
+    def test_stdin_not_supported(self):
+        with pytest.raises(ValueError):
+            convert_file_parallel("-", "-", "D_YYYYMMDD", "S_DDMMyy")
+
+    def test_main_with_workers(self, tmp_path):
+        input_path = tmp_path / "in.txt"
+        output_path = tmp_path / "out.txt"
+        input_path.write_text("2024-12-07\n2024-12-08\n")
+
+        exit_code = main(["convert", str(input_path), str(output_path), "--from", "D_YYYYMMDD",
+                          "--to", "S_DDMMYYYY", "--workers", "2", "--chunk-bytes", "4"])
+        assert exit_code == 0
+        assert output_path.read_text() == "07/12/2024\n08/12/2024\n"
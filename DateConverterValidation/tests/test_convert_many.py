@@ -0,0 +1,54 @@
+"""
+Tests for the batch conversion API convert_many
+"""
+
+import unittest
+import sys
+import os
+import types
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from DateConverter import DateFormats, convert_between_formats, convert_many
+
+
+class TestConvertMany(unittest.TestCase):
+    """convert_many must match convert_between_formats entry by entry"""
+
+    DATES = ["2024-12-07", " 2020-02-29 ", "2019-02-29", "", None, 20241207,
+             "2024-1-5", "0001-01-01", "invalid", "2024/12/07"]
+
+    def test_matches_scalar(self):
+        expected = [convert_between_formats(d, "D_YYYYMMDD", "S_DDMMYYYY") for d in self.DATES]
+        self.assertEqual(convert_many(self.DATES, "D_YYYYMMDD", "S_DDMMYYYY"), expected)
+
+    def test_returns_list(self):
+        result = convert_many(["2024-12-07"], "D_YYYYMMDD", "S_DDMMYYYY")
+        self.assertEqual(result, ["07/12/2024"])
+
+    def test_stream_mode(self):
+        result = convert_many(iter(self.DATES), "D_YYYYMMDD", "S_DDMMYYYY", stream=True)
+        self.assertIsInstance(result, types.GeneratorType)
+        self.assertEqual(next(result), "07/12/2024")
+        self.assertEqual(next(result), "29/02/2020")
+        self.assertIsNone(next(result))
+
+    def test_accepts_enums(self):
+        result = convert_many(["07-Dec-2024"], DateFormats.D_DDMMYYYY_N, DateFormats.D_YYYYMMDD)
+        self.assertEqual(result, ["2024-12-07"])
+
+    def test_datetime_formats(self):
+        result = convert_many(["2024-12-07, 03:30pm", "2024-12-07, 13:30pm"],
+                              "D_YYYYMMDDHHMMA", "S_DDMMYYYYHHMMA")
+        self.assertEqual(result, ["07/12/2024, 03:30pm", None])
+
+    def test_invalid_format_names(self):
+        self.assertEqual(convert_many(["2024-12-07", "x"], "INVALID", "S_DDMMYYYY"), [None, None])
+        self.assertEqual(list(convert_many(["2024-12-07"], "D_YYYYMMDD", None, stream=True)), [None])
+
+    def test_empty_input(self):
+        self.assertEqual(convert_many([], "D_YYYYMMDD", "S_DDMMYYYY"), [])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,99 @@
+"""
+Tests for format auto-detection (detect_format, detect_formats, detect_column_format)
+"""
+
+import unittest
+import sys
+import os
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from DateConverter import (
+    DateFormats,
+    FORMAT_PLANS,
+    FORMAT_SIGNATURE_INDEX,
+    convert_between_formats,
+    detect_column_format,
+    detect_format,
+    detect_formats,
+    find_format_enum
+)
+
+
+class TestSignatureIndex(unittest.TestCase):
+    """Shape signatures of the format plans"""
+
+    def test_every_format_indexed(self):
+        indexed = [name for names in FORMAT_SIGNATURE_INDEX.values() for name in names]
+        self.assertEqual(sorted(indexed), sorted(fmt.name for fmt in DateFormats))
+
+    def test_signatures(self):
+        self.assertEqual(FORMAT_PLANS["D_YYYYMMDD"].signature, "9999-99-99")
+        self.assertEqual(FORMAT_PLANS["S_DDMMYYYY_N"].signature, "99/aaa/9999")
+        self.assertEqual(FORMAT_PLANS["D_YYYYMMDDHHMMSSA"].signature, "9999-99-99, 99:99:99aa")
+
+    def test_ambiguous_signatures(self):
+        self.assertEqual(FORMAT_SIGNATURE_INDEX["99-99-99"], ["D_YYMMDD", "D_DDMMyy"])
+
+
+class TestDetectFormat(unittest.TestCase):
+    """Detection of single date strings"""
+
+    def test_detect_every_format_example(self):
+        for fmt in DateFormats:
+            sample = convert_between_formats("2024-12-25, 03:30:45pm", "D_YYYYMMDDHHMMSSA", fmt.name)
+            self.assertIn(fmt.name, detect_formats(sample), sample)
+
+    def test_unambiguous(self):
+        self.assertEqual(detect_format("2024-12-07"), "D_YYYYMMDD")
+        self.assertEqual(detect_format(" 07-Dec-2024 "), "D_DDMMYYYY_N")
+        self.assertEqual(detect_format("07/12/2024, 03:30pm"), "S_DDMMYYYYHHMMA")
+
+    def test_ambiguous(self):
+        self.assertEqual(detect_formats("10-11-12"), ["D_YYMMDD", "D_DDMMyy"])
+        self.assertEqual(detect_format("10-11-12"), "D_YYMMDD")
+        self.assertEqual(detect_formats("15-06-31"), ["D_DDMMyy"])
+
+    def test_signature_match_but_invalid_date(self):
+        self.assertIsNone(detect_format("2023-02-29"))
+        self.assertIsNone(detect_format("2024-Foo-07"))
+
+    def test_unpadded_falls_back_to_full_scan(self):
+        self.assertEqual(detect_format("2024-1-5"), "D_YYYYMMDD")
+
+    def test_invalid_input(self):
+        self.assertIsNone(detect_format(""))
+        self.assertIsNone(detect_format(None))
+        self.assertIsNone(detect_format("not a date"))
+
+
+class TestDetectColumnFormat(unittest.TestCase):
+    """Dominant format of a column"""
+
+    def test_dominant_format(self):
+        column = ["2024-12-07", "2024-12-08", "07/12/2024", "bad"]
+        self.assertEqual(detect_column_format(column), "D_YYYYMMDD")
+
+    def test_ambiguity_settled_by_column(self):
+        self.assertEqual(detect_column_format(["10-11-12", "15-06-31"]), "D_DDMMyy")
+        self.assertEqual(detect_column_format(["10-11-12", "31-06-15"]), "D_YYMMDD")
+
+    def test_sample_size(self):
+        column = iter(["07/12/2024"] * 3 + ["2024-12-07"] * 10)
+        self.assertEqual(detect_column_format(column, sample_size=3), "S_DDMMYYYY")
+
+    def test_no_valid_entries(self):
+        self.assertIsNone(detect_column_format(["bad", "", None]))
+
+
+class TestFindFormatEnumByValue(unittest.TestCase):
+    """find_format_enum value lookup"""
+
+    def test_by_value(self):
+        self.assertEqual(find_format_enum("dd/MM/yyyy"), DateFormats.S_DDMMYYYY)
+        self.assertIsNone(find_format_enum("dd.MM.yyyy"))
+        self.assertIsNone(find_format_enum(["yyyy-MM-dd"]))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,127 @@
+"""
+Tests for the fixed-width numeric parser behind convert_between_formats
+Checks it against the original strptime/strftime converter over the generated corpora
+"""
+
+import pytest
+import sys
+import csv
+from datetime import datetime
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+from DateConverter import FORMAT_PLANS, DateFormats, convert_between_formats, convert_with_plans, strptime_convert
+
+PROJECT_DIR = Path(__file__).parent.parent
+CORPORA = ["BaseTestSet.csv", "PairWiseInputSet.csv", "CategoryPartitionTestSet.csv"]
+
+
+def load_corpus_rows():
+    """Load (date_input, input_format, output_format) rows from every corpus found"""
+    rows = []
+    for name in CORPORA:
+        for csv_path in [PROJECT_DIR / name, PROJECT_DIR / "Generators" / name]:
+            if csv_path.exists():
+                with open(csv_path, 'r', encoding='utf-8') as f:
+                    for tc in csv.DictReader(f):
+                        rows.append((tc['date_input'], tc['input_format'], tc['output_format']))
+                break
+    return rows
+
+
+def original_convert(date_str, input_format, output_format):
+    """
+    The converter as it was before the format plans: plain datetime.strptime
+    and strftime, with years below 1000 written with four digits (glibc's
+    strftime does not pad them, the one intended difference)
+    """
+    def python_format(name):
+        pattern = DateFormats[name].value
+        for old, new in [('yyyy', '%Y'), ('yy', '%y'), ('MMM', '%b'), ('MM', '%m'), ('dd', '%d'),
+                         ('hh', '%I'), ('mm', '%M'), ('ss', '%S'), ('a', '%p')]:
+            pattern = pattern.replace(old, new)
+        return pattern
+
+    if not date_str or not isinstance(date_str, str) or not date_str.strip():
+        return None
+    try:
+        dt = datetime.strptime(date_str.strip(), python_format(input_format))
+        output_pattern = python_format(output_format)
+    except (KeyError, ValueError, TypeError, AttributeError):
+        return None
+    if dt.year < 1000:
+        output_pattern = output_pattern.replace('%Y', '%04d' % dt.year)
+    result = dt.strftime(output_pattern)
+    if 'a' in DateFormats[output_format].value:
+        result = result.replace('AM', 'am').replace('PM', 'pm')
+    return result
+
+
+def format_text(plan, year, hour=3, minute=4, second=5):
+    """Text of 2 Jan of year (zero-padded to four digits) at the given time in plan's format"""
+    text = datetime(2001, 1, 2, hour, minute, second).strftime(plan.pattern.replace('%Y', '%04d' % year))
+    return text.replace('AM', 'am') if plan.lowercase_ampm else text
+
+
+@pytest.mark.parametrize("date_input,input_format,output_format", load_corpus_rows())
+def test_matches_original_converter_on_corpora(date_input, input_format, output_format):
+    """Both paths must give what the original converter gives for every corpus row"""
+    expected = original_convert(date_input, input_format, output_format)
+    assert convert_between_formats(date_input, input_format, output_format) == expected
+
+    date_str = date_input.strip()
+    if date_str and input_format in FORMAT_PLANS and output_format in FORMAT_PLANS:
+        input_plan = FORMAT_PLANS[input_format]
+        output_plan = FORMAT_PLANS[output_format]
+        assert convert_with_plans(date_str, input_plan, output_plan) == expected
+        assert strptime_convert(date_str, input_plan, output_plan) == expected
+
+
+@pytest.mark.parametrize("input_format", list(FORMAT_PLANS))
+@pytest.mark.parametrize("output_format", list(FORMAT_PLANS))
+def test_year_one_zero_padded_for_every_pair(input_format, output_format):
+    """Year 1 is written as 0001 whichever path converts the pair (a yy input of 01 means 2001)"""
+    input_plan = FORMAT_PLANS[input_format]
+    output_plan = FORMAT_PLANS[output_format]
+    year = 1 if '%Y' in input_plan.pattern else 2001
+    time = (3, 4, 5 if '%S' in input_plan.pattern else 0) if '%I' in input_plan.pattern else (0, 0, 0)
+
+    result = convert_between_formats(format_text(input_plan, 1), input_format, output_format)
+    assert result == format_text(output_plan, year, *time)
+    if '%Y' in output_plan.pattern and year == 1:
+        assert '0001' in result
+
+
+class TestFixedWidthParser:
+    """Fixed-width slicing and fallback behaviour"""
+
+    def test_numeric_plans(self):
+        numeric = {name for name, plan in FORMAT_PLANS.items() if plan.numeric}
+        assert numeric == {"D_YYYYMMDD", "D_DDMMYYYY", "D_YYMMDD", "D_DDMMyy",
+                           "S_YYYYMMDD", "S_DDMMYYYY", "S_YYMMDD", "S_DDMMyy"}
+
+    def test_split_numeric(self):
+        assert FORMAT_PLANS["S_DDMMYYYY"].split_numeric("07/12/2024") == ("2024", "12", "07", "24")
+        assert FORMAT_PLANS["D_YYMMDD"].split_numeric("68-01-01") == ("2068", "01", "01", "68")
+        assert FORMAT_PLANS["D_YYMMDD"].split_numeric("69-01-01") == ("1969", "01", "01", "69")
+
+    def test_split_numeric_rejects_other_shapes(self):
+        plan = FORMAT_PLANS["D_YYYYMMDD"]
+        assert plan.split_numeric("2024/12/07") is None
+        assert plan.split_numeric("2024-1-5") is None
+        assert plan.split_numeric("2024-12-0x") is None
+        assert plan.split_numeric("２０２４-12-07") is None
+
+    def test_unpadded_input_falls_back_to_strptime(self):
+        assert convert_between_formats("2024-1-5", "D_YYYYMMDD", "S_DDMMYYYY") == "05/01/2024"
+
+    def test_year_always_zero_padded(self):
+        assert convert_between_formats("0001-01-01", "D_YYYYMMDD", "S_DDMMYYYY") == "01/01/0001"
+        assert convert_between_formats("0001-01-15", "D_YYYYMMDD", "D_DDMMYYYY_N") == "15-Jan-0001"
+        assert convert_between_formats("0999/Dec/31", "S_YYYYMMDD_N", "D_YYYYMMDD") == "0999-12-31"
+        assert convert_between_formats("01/01/0999", "S_DDMMYYYY", "D_YYMMDD") == "99-01-01"
+
+    def test_invalid_fixed_width_dates(self):
+        assert convert_between_formats("2023-02-29", "D_YYYYMMDD", "S_DDMMyy") is None
+        assert convert_between_formats("00-13-01", "D_YYMMDD", "D_YYYYMMDD") is None
+        assert convert_between_formats("0000-01-01", "D_YYYYMMDD", "D_YYMMDD") is None
@@ -0,0 +1,78 @@
+"""
+Tests for the precompiled format plans used by convert_between_formats
+"""
+
+import unittest
+import sys
+import os
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from DateConverter import (
+    DateFormats,
+    FORMAT_PLANS,
+    FormatPlan,
+    get_format_layout,
+    get_format_plan,
+    get_python_format,
+    convert_between_formats
+)
+
+
+class TestFormatLayout(unittest.TestCase):
+    """Test get_format_layout field offsets"""
+
+    def test_numeric_layout(self):
+        self.assertEqual(
+            get_format_layout(DateFormats.D_YYYYMMDD),
+            (('yyyy', 0, 4), ('-', 4, 1), ('MM', 5, 2), ('-', 7, 1), ('dd', 8, 2))
+        )
+
+    def test_two_digit_year_layout(self):
+        self.assertEqual(
+            get_format_layout("dd/MM/yy"),
+            (('dd', 0, 2), ('/', 2, 1), ('MM', 3, 2), ('/', 5, 1), ('yy', 6, 2))
+        )
+
+    def test_text_month_layout(self):
+        self.assertEqual(get_format_layout(DateFormats.D_DDMMYYYY_N)[2], ('MMM', 3, 3))
+
+    def test_datetime_layout(self):
+        layout = get_format_layout(DateFormats.S_YYYYMMDDHHMMSSA)
+        self.assertEqual(layout[5], (', ', 10, 2))
+        self.assertEqual([entry[0] for entry in layout[6:]], ['hh', ':', 'mm', ':', 'ss', 'a'])
+        self.assertEqual(layout[-1], ('a', 20, 2))
+
+
+class TestFormatPlans(unittest.TestCase):
+    """Test FormatPlan construction and lookup"""
+
+    def test_plan_for_every_format(self):
+        self.assertEqual(set(FORMAT_PLANS), {fmt.name for fmt in DateFormats})
+
+    def test_plan_matches_python_format(self):
+        for fmt in DateFormats:
+            self.assertEqual(FORMAT_PLANS[fmt.name].pattern, get_python_format(fmt))
+
+    def test_ampm_flag(self):
+        self.assertTrue(FORMAT_PLANS["D_YYYYMMDDHHMMA"].lowercase_ampm)
+        self.assertFalse(FORMAT_PLANS["D_YYYYMMDD"].lowercase_ampm)
+
+    def test_plan_width(self):
+        self.assertEqual(FORMAT_PLANS["D_YYYYMMDD"].width, 10)
+        self.assertEqual(FORMAT_PLANS["S_DDMMyy"].width, 8)
+        self.assertEqual(FORMAT_PLANS["D_DDMMYYYYHHMMA"].width, len("07-12-2024, 03:30pm"))
+
+    def test_get_format_plan(self):
+        self.assertIsInstance(get_format_plan("S_DDMMYYYY"), FormatPlan)
+        self.assertIs(get_format_plan(DateFormats.S_DDMMYYYY), FORMAT_PLANS["S_DDMMYYYY"])
+        self.assertIsNone(get_format_plan("INVALID"))
+        self.assertIsNone(get_format_plan(None))
+        self.assertIsNone(get_format_plan([]))
+
+    def test_unhashable_format_name(self):
+        self.assertIsNone(convert_between_formats("2024-12-07", [], "S_DDMMYYYY"))
+
+
+if __name__ == '__main__':
+    unittest.main()
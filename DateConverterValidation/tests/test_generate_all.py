@@ -0,0 +1,97 @@
+"""
+Tests for the parallel test set generation driver
+"""
+
+import json
+import sys
+import pytest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+sys.path.insert(0, str(Path(__file__).parent.parent / "Generators"))
+from Generate_All_Test_Sets import GENERATORS, generate_all, main, run_generator
+from Manifest import fingerprint, manifest_path
+
+
+class TestGenerateAll:
+    """The driver must write the same files as the generator scripts"""
+
+    COMMITTED = Path(__file__).parent.parent / "Generators"
+
+    @pytest.mark.parametrize("workers", [1, 2])
+    def test_matches_committed_test_sets(self, workers, tmp_path):
+        results = generate_all(output_dir=str(tmp_path), workers=workers)
+        assert [result["name"] for result in results] == list(GENERATORS)
+
+        for result in results:
+            path = Path(result["path"])
+            assert path.read_bytes() == (self.COMMITTED / path.name).read_bytes()
+            assert result["rows"] == len(path.read_text(encoding="utf-8").splitlines()) - 1
+            assert result["seconds"] >= 0
+
+    def test_run_generator_captures_output(self, tmp_path, capsys):
+        result = run_generator("base", str(tmp_path))
+        assert "Saved to" in result["output"]
+        assert capsys.readouterr().out == ""
+
+    def test_unknown_generator(self):
+        with pytest.raises(ValueError):
+            generate_all(["random"])
+
+    def test_main(self, tmp_path, capsys):
+        assert main(["--only", "pairwise", "--output-dir", str(tmp_path)]) == 0
+        assert "pairwise" in capsys.readouterr().out
+        assert (tmp_path / "PairWiseInputSet.csv").exists()
+
+
+class TestIncrementalGeneration:
+    """Test sets whose fingerprint is unchanged must not be rewritten"""
+
+    def test_second_run_is_skipped(self, tmp_path):
+        first = run_generator("base", str(tmp_path))
+        assert first["regenerated"]
+        manifest = json.loads(manifest_path(first["path"]).read_text(encoding="utf-8"))
+        assert manifest["rows"] == first["rows"]
+
+        mtime = Path(first["path"]).stat().st_mtime_ns
+        second = run_generator("base", str(tmp_path))
+        assert not second["regenerated"]
+        assert second["rows"] == first["rows"]
+        assert Path(second["path"]).stat().st_mtime_ns == mtime
+
+    def test_force_regenerates(self, tmp_path):
+        run_generator("pairwise", str(tmp_path))
+        assert run_generator("pairwise", str(tmp_path), force=True)["regenerated"]
+
+    def test_changed_output_is_regenerated(self, tmp_path):
+        path = Path(run_generator("metamorphic", str(tmp_path))["path"])
+        path.write_text("edited\n", encoding="utf-8")
+        assert run_generator("metamorphic", str(tmp_path))["regenerated"]
+        assert path.read_bytes() == (TestGenerateAll.COMMITTED / path.name).read_bytes()
+
+    def test_changed_fingerprint_is_regenerated(self, tmp_path):
+        path = run_generator("category_partition", str(tmp_path))["path"]
+        manifest = json.loads(manifest_path(path).read_text(encoding="utf-8"))
+        manifest["fingerprint"] = "0" * 64
+        manifest_path(path).write_text(json.dumps(manifest), encoding="utf-8")
+        assert run_generator("category_partition", str(tmp_path))["regenerated"]
+
+    def test_fingerprint_depends_on_parameters(self, tmp_path):
+        source = tmp_path / "source.py"
+        source.write_bytes(b"x = 1\r\n")
+        digest = fingerprint([source], {"seed": 0})
+        assert fingerprint([source], {"seed": 1}) != digest
+
+        # line endings alone are not a change
+        source.write_bytes(b"x = 1\n")
+        assert fingerprint([source], {"seed": 0}) == digest
+
+    def test_committed_test_sets_are_up_to_date(self):
+        results = generate_all(output_dir=str(TestGenerateAll.COMMITTED), workers=1)
+        assert not any(result["regenerated"] for result in results)
+
+    def test_main_reports_up_to_date(self, tmp_path, capsys):
+        main(["--only", "base", "--output-dir", str(tmp_path)])
+        capsys.readouterr()
+        main(["--only", "base", "--output-dir", str(tmp_path)])
+        assert "up to date" in capsys.readouterr().out
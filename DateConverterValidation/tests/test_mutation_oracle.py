@@ -0,0 +1,68 @@
+"""
+Tests for in-process mutation testing of DateConverter.py
+"""
+
+import importlib
+import inspect
+import sys
+import pytest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+import DateConverter
+from Mutation_Oracle import CONVERSION_FUNCTIONS, date_converter_oracle, load_checks, main
+from Mutation_Engine import MutationEngine
+
+
+class TestMutationOracle:
+    """The oracle must pass on DateConverter.py and kill its mutants"""
+
+    def test_load_checks(self):
+        checks = load_checks()
+        ids = [test_id for test_id, _, _ in checks]
+        assert len(ids) == len(set(ids))
+        assert ids[0] == "BASE_001"
+        assert any(test_id.startswith("MR") for test_id in ids)
+
+    def test_original_passes(self):
+        oracle = date_converter_oracle(reference=DateConverter)
+        assert oracle(DateConverter) is None
+        assert oracle.rows + len(oracle.dropped) == len(load_checks())
+
+    def test_without_reference_keeps_every_check(self):
+        oracle = date_converter_oracle()
+        assert oracle.dropped == []
+        assert oracle(DateConverter) is not None
+
+    def test_kills_mutants(self):
+        engine = MutationEngine(Path(DateConverter.__file__), ["is_valid_date"])
+        oracle = date_converter_oracle(reference=engine.module())
+        results = engine.run(oracle)
+
+        statuses = {(r["mutant"].line, r["mutant"].description): r["status"] for r in results}
+        assert all(status != "timeout" for status in statuses.values())
+        killed = [key for key, status in statuses.items() if status == "killed"]
+        assert len(killed) > len(results) // 2
+
+    def test_conversion_functions_exist(self):
+        engine = MutationEngine(Path(DateConverter.__file__), CONVERSION_FUNCTIONS)
+        assert {m.function for m in engine.mutations} == set(CONVERSION_FUNCTIONS)
+
+    def test_engine_is_the_quadratic_solvers(self):
+        import Mutation_Engine
+        import Mutation_Oracle
+        path = list(sys.path)
+        importlib.reload(Mutation_Engine)
+        importlib.reload(Mutation_Oracle)
+        assert sys.path == path
+        assert Path(inspect.getfile(MutationEngine)) == Mutation_Engine.ENGINE_PATH
+        assert Mutation_Engine.ENGINE_PATH.parent.name == "Quadratic Equation Solver"
+
+    def test_missing_engine(self, tmp_path):
+        import Mutation_Engine
+        with pytest.raises(ImportError, match="quadratic solver project"):
+            Mutation_Engine.load_engine(tmp_path / "Mutation_Engine.py")
+
+    def test_main(self, capsys):
+        assert main(["--function", "is_leap_year"]) == 0
+        assert "mutants in" in capsys.readouterr().out
@@ -0,0 +1,136 @@
+"""
+Tests for the in-repo pairwise engine used by Generate_Pair_Wise_Test_Set.py
+"""
+
+import itertools
+import random
+import sys
+import time
+import pytest
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+sys.path.insert(0, str(Path(__file__).parent.parent / "Generators"))
+from Pairwise_Engine import PairwiseEngine, all_pairs, implies, uncovered_pairs
+from Generate_Pair_Wise_Test_Set import SCENARIO_CONSTRAINTS, generate_pairwise_tests
+
+
+class TestPairCoverage:
+    """Every allowed pair must appear in some row"""
+
+    @pytest.mark.parametrize("sizes", [[2, 2], [3, 4, 5], [8, 8, 8, 8], [2, 9, 3, 7, 5, 4], [10] * 15])
+    def test_covers_all_pairs(self, sizes):
+        parameters = [[f"v{v}" for v in range(n)] for n in sizes]
+        rows = all_pairs(parameters)
+        assert uncovered_pairs(rows, parameters) == set()
+        assert len(rows) >= sorted(sizes)[-1] * sorted(sizes)[-2]
+
+    def test_rows_follow_parameter_order(self):
+        rows = all_pairs({"a": [1, 2], "b": ["x", "y", "z"]})
+        assert sorted(rows) == [[a, b] for a, b in itertools.product([1, 2], ["x", "y", "z"])]
+
+    def test_single_parameter(self):
+        assert all_pairs([["a", "b"]]) == [["a"], ["b"]]
+
+    def test_empty_values_rejected(self):
+        with pytest.raises(ValueError):
+            all_pairs({"a": [1], "b": []})
+
+
+class TestConstraints:
+    """Constraints hold in every row and exclude only impossible pairs"""
+
+    PARAMETERS = {
+        "month": ["01", "02", "04", "13"],
+        "day": ["01", "29", "31", "32"],
+        "scenario": ["typical", "leap_feb29", "invalid_day", "invalid_month"],
+    }
+    CONSTRAINTS = [
+        implies({"scenario": "leap_feb29"}, {"month": ["02"], "day": ["29"]}),
+        implies({"scenario": "invalid_day"}, {"day": ["32"]}),
+        implies({"scenario": "invalid_month"}, {"month": ["13"]}),
+    ]
+
+    def test_rows_satisfy_constraints(self):
+        rows = all_pairs(self.PARAMETERS, self.CONSTRAINTS)
+        for month, day, scenario in rows:
+            if scenario == "leap_feb29":
+                assert (month, day) == ("02", "29")
+            if scenario == "invalid_day":
+                assert day == "32"
+            if scenario == "invalid_month":
+                assert month == "13"
+        assert uncovered_pairs(rows, self.PARAMETERS, self.CONSTRAINTS) == set()
+
+    def test_impossible_pairs_are_skipped(self):
+        # month 13 and leap_feb29 never meet, but every other pair does
+        rows = all_pairs(self.PARAMETERS, self.CONSTRAINTS)
+        assert ["13", "29", "leap_feb29"] not in rows
+        assert ("01", "leap_feb29") not in {(row[0], row[2]) for row in rows}
+
+    @pytest.mark.parametrize("seed", [0, 1, 2, 3])
+    def test_pairs_the_greedy_fill_misses_are_kept(self, seed):
+        # every pair has a valid row, but filling d greedily can leave no value for it
+        # (seed 0 used to lose (b=1, c=0) and (a=0, b=1), seed 1 (a=0, b=0))
+        parameters = {"a": [0, 1], "b": [0, 1], "c": [0, 1], "d": [0, 1]}
+        constraints = [implies({"c": 0}, {"d": [1]}), implies({"a": 0}, {"d": [0]})]
+        rows = all_pairs(parameters, constraints, seed)
+        for a, b, c, d in rows:
+            assert not (c == 0 and d != 1) and not (a == 0 and d != 0)
+        assert uncovered_pairs(rows, parameters, constraints) == set()
+
+    def test_implies_on_partial_rows(self):
+        constraint = implies({"scenario": "leap_feb29"}, {"month": ["02"]})
+        assert constraint({"month": "01"})
+        assert constraint({"scenario": "leap_feb29"})
+        assert not constraint({"scenario": "leap_feb29", "month": "01"})
+        assert constraint({"scenario": "typical", "month": "01"})
+
+
+class TestDeterminism:
+    """Same seed, same rows"""
+
+    PARAMETERS = [[v for v in range(n)] for n in (4, 6, 3, 5, 7)]
+
+    def test_same_seed(self):
+        assert all_pairs(self.PARAMETERS, seed=7) == all_pairs(self.PARAMETERS, seed=7)
+
+    def test_engine_is_reiterable(self):
+        engine = PairwiseEngine(self.PARAMETERS, seed=3)
+        assert list(engine) == list(engine)
+
+    def test_seeds_differ(self):
+        results = {tuple(map(tuple, all_pairs(self.PARAMETERS, seed=seed))) for seed in range(5)}
+        assert len(results) > 1
+
+
+class TestSpeed:
+    """Large models must generate in well under a second"""
+
+    def test_fifteen_parameters_ten_values(self):
+        rng = random.Random(0)
+        parameters = {f"p{i}": [f"{i}_{v}" for v in range(10 + rng.randrange(3))] for i in range(15)}
+        start = time.perf_counter()
+        rows = all_pairs(parameters)
+        assert time.perf_counter() - start < 1.0
+        assert uncovered_pairs(rows, parameters) == set()
+
+
+class TestPairwiseGenerator:
+    """The date test set generator applies its scenario constraints"""
+
+    def test_generated_rows_satisfy_constraints(self):
+        for tc in generate_pairwise_tests():
+            if tc["scenario"] == "edge_case":
+                continue
+            year, month, day = tc["description"].split(": ")[1].split("-")
+            row = {"year": year, "month": month, "day": day, "scenario": tc["scenario"]}
+            assert all(constraint(row) for constraint in SCENARIO_CONSTRAINTS), tc
+
+    def test_leap_feb29_rows(self):
+        rows = [tc for tc in generate_pairwise_tests() if tc["scenario"] == "leap_feb29"]
+        assert rows
+        assert all(tc["description"].endswith("-02-29") for tc in rows)
+
+    def test_seeded_generation_is_reproducible(self):
+        assert generate_pairwise_tests(seed=5) == generate_pairwise_tests(seed=5)
@@ -0,0 +1,61 @@
+"""
+Tests for the leap-year / days-in-month lookup tables and validate_many
+"""
+
+import calendar
+import unittest
+import sys
+import os
+
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from DateConverter import (
+    LEAP_YEAR_CYCLE,
+    MONTH_DAYS_CYCLE,
+    is_leap_year,
+    is_valid_date,
+    validate_many
+)
+
+
+class TestLookupTables(unittest.TestCase):
+    """Tables must agree with the calendar module"""
+
+    def test_table_sizes(self):
+        self.assertEqual(len(LEAP_YEAR_CYCLE), 400)
+        self.assertEqual(len(MONTH_DAYS_CYCLE), 400 * 12)
+
+    def test_leap_years_match_calendar(self):
+        for year in range(1, 10000):
+            self.assertEqual(is_leap_year(year), calendar.isleap(year), year)
+
+    def test_month_lengths_match_calendar(self):
+        for year in (1, 4, 100, 400, 1900, 2000, 2023, 2024, 9999):
+            for month in range(1, 13):
+                last_day = calendar.monthrange(year, month)[1]
+                self.assertTrue(is_valid_date(year, month, last_day))
+                self.assertFalse(is_valid_date(year, month, last_day + 1))
+
+
+class TestValidateMany(unittest.TestCase):
+    """validate_many must match is_valid_date element by element"""
+
+    def test_matches_is_valid_date(self):
+        years = [0, 1, 1900, 2000, 2023, 2024, "2024", 9999, 10000, None, "abc", -400]
+        months = [2, 1, 2, 2, 2, 2, "02", 12, 1, 1, 1, 2]
+        days = [29, 1, 29, 29, 29, 29, "29", 31, 1, 1, 1, 29]
+
+        expected = [is_valid_date(y, m, d) for y, m, d in zip(years, months, days)]
+        self.assertEqual(validate_many(years, months, days), expected)
+        self.assertEqual(expected, [False, True, False, True, False, True, True, True,
+                                    False, False, False, False])
+
+    def test_month_and_day_bounds(self):
+        self.assertEqual(validate_many([2024] * 4, [0, 13, 1, 1], [1, 1, 0, 32]), [False] * 4)
+
+    def test_accepts_iterators(self):
+        self.assertEqual(validate_many(iter([2024]), iter([4]), iter([30])), [True])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,473 @@
+import argparse
+import math
+import sys
+import time
+
+import numpy as np
+
+from collections import namedtuple
+from pathlib import Path
+
+from Solver import solve_quadratic
+from Solver_Batch import CASE_CODES, CASE_NAMES, DEFAULT_CHUNK_ROWS, solve_quadratic_batch
+from TestSetIO import RootArrays, batch_arrays, compare_roots, result_arrays
+
+sys.path.insert(0, str(Path(__file__).resolve().parent / "Generators"))
+
+from Block_Space import make_blocks
+
+
+"""
+Property-based fuzzing of solve_quadratic.
+
+Coefficients are drawn from a weighted mix of DISTRIBUTIONS, every
+coefficient independently, DEFAULT_CHUNK_ROWS rows at a time, solved
+with solve_quadratic_batch and checked against the INVARIANTS with
+array operations. Chunk i of a run with seed s is drawn from
+np.random.default_rng([s, i]), so any chunk, and any failure found in
+it, can be reproduced on its own. Failing rows are shrunk to simpler
+coefficients that still fail the same invariant.
+"""
+
+
+# float64 limits the distributions draw near
+TINY = np.finfo(np.float64).tiny
+MAX_EXPONENT = np.finfo(np.float64).maxexp
+
+# coefficient text for the incorrect_type path: what float() accepts is a number, the rest must be rejected
+TEXT_VALUES = ("abc", "", " ", "1e", "1,5", "--1", "None", "0x10", "1 2", "j", "1_000", " 2 ", "-0", "inf", "nan",
+               "1e400")
+
+# relative residual |a x^2 + b x + c| / (|a| |x|^2 + |b| |x| + |c|) a returned root may have
+RESIDUAL_TOLERANCE = 1e-6
+
+# spacing of the subnormal floats: roots and products rounded into that range are only this accurate
+SUBNORMAL_SPACING = np.ldexp(1.0, -1074)
+
+# relative rounding error of one float64 operation, at most half of this
+EPSILON = np.finfo(np.float64).eps
+
+# margin on the rounding error bound of the textbook formula before a residual failure counts as cancellation
+CANCELLATION_MARGIN = 4.0
+
+# rows of every chunk also solved with solve_quadratic, which solve_quadratic_batch must match exactly
+SCALAR_ROWS = 256
+
+INVARIANTS = ("case", "residual", "cancellation", "scalar", "text")
+
+# invariants the textbook formula is known to break: reported, but a run failing only these passes
+KNOWN_LIMITS = ("cancellation",)
+
+# one failing row: coefficients as solved (text for text coefficients), the chunk it was drawn in,
+# and the shrunk coefficients that still fail (None if not shrunk)
+Failure = namedtuple("Failure", ["invariant", "row", "case", "roots", "seed", "chunk", "index", "shrunk"])
+
+
+# bounds of the block partition of the block space generators, 5 blocks over the float32 range
+BLOCK_LOWS = np.array([block.low for block in make_blocks(5)])
+BLOCK_HIGHS = np.array([block.high for block in make_blocks(5)])
+
+
+def per_block(rng, n):
+
+    # a block of the block space first, then uniform within it, so every block is drawn equally often
+    chosen = rng.integers(0, len(BLOCK_LOWS), n)
+    return rng.uniform(BLOCK_LOWS[chosen], BLOCK_HIGHS[chosen])
+
+
+def log_uniform(rng, n):
+
+    # uniform binary exponent over the normal float64 range, either sign
+    values = np.ldexp(rng.uniform(0.5, 1.0, n), rng.integers(-1021, MAX_EXPONENT + 1, n))
+    return np.where(rng.random(n) < 0.5, -values, values)
+
+
+def small_int(rng, n):
+
+    # integers in [-10, 10], where discriminants are exactly zero and coefficients exactly zero often
+    return rng.integers(-10, 11, n).astype(np.float64)
+
+
+def subnormal(rng, n):
+
+    values = rng.uniform(0.0, TINY, n)
+    return np.where(rng.random(n) < 0.5, -values, values)
+
+
+def signed_zero(rng, n):
+
+    return np.where(rng.random(n) < 0.5, -0.0, 0.0)
+
+
+def special(rng, n):
+
+    return rng.choice(np.array([np.nan, np.inf, -np.inf]), n)
+
+
+"""
+Samplers (rng, n) -> n float64 coefficients. "text" is not a sampler:
+its coefficients are drawn from TEXT_VALUES by draw().
+"""
+DISTRIBUTIONS = {
+    "per_block": per_block,
+    "log_uniform": log_uniform,
+    "small_int": small_int,
+    "subnormal": subnormal,
+    "signed_zero": signed_zero,
+    "special": special,
+    "text": None,
+}
+
+DEFAULT_WEIGHTS = {
+    "per_block": 1.0,
+    "log_uniform": 1.0,
+    "small_int": 1.0,
+    "subnormal": 0.1,
+    "signed_zero": 0.2,
+    "special": 0.05,
+    "text": 0.01,
+}
+
+
+def _text_value(text):
+
+    # float() of the text, None where it is rejected
+    try:
+        return float(text)
+    except ValueError:
+        return None
+
+
+"""
+Draw n rows of coefficients with the distribution weights.
+
+Returns (values, text, has_text, rejected): values is an (n, 3) float64
+array; text is None, or an (n, 3) object array of the coefficients with
+the TEXT_VALUES drawn in place, whose values hold float() of the text;
+has_text marks the rows with text and rejected those with text float()
+rejects (their values are NaN).
+"""
+def draw(rng, n, weights=DEFAULT_WEIGHTS):
+
+    names = [name for name, weight in weights.items() if weight > 0]
+    unknown = [name for name in names if name not in DISTRIBUTIONS]
+    if unknown or not names:
+        raise ValueError(f"Unknown or no distributions {unknown}, expected some of {', '.join(DISTRIBUTIONS)}")
+    p = np.array([weights[name] for name in names], dtype=np.float64)
+    chosen = rng.choice(len(names), size=(n, 3), p=p / p.sum())
+
+    values = np.empty((n, 3), dtype=np.float64)
+    has_text = rejected = np.zeros(n, dtype=bool)
+    drawn = None
+    for k, name in enumerate(names):
+        where = chosen == k
+        count = int(np.count_nonzero(where))
+        if not count:
+            continue
+        if name == "text":
+            drawn = rng.choice(np.array(TEXT_VALUES, dtype=object), count)
+            parsed = [_text_value(value) for value in drawn]
+            values[where] = [np.nan if value is None else value for value in parsed]
+            bad = np.zeros((n, 3), dtype=bool)
+            bad[where] = [value is None for value in parsed]
+            has_text, rejected = where.any(axis=1), bad.any(axis=1)
+        else:
+            values[where] = DISTRIBUTIONS[name](rng, count)
+
+    if drawn is None:
+        return values, None, has_text, rejected
+    text = values.astype(object)
+    text[chosen == names.index("text")] = drawn
+    return values, text, has_text, rejected
+
+
+def expected_cases(a, b, c):
+
+    # the case solve_quadratic's definition gives every row of numbers
+    cases = np.full(a.shape, CASE_CODES["overflow"], dtype=np.uint8)
+    with np.errstate(all="ignore"):
+        disc = b * b - 4 * a * c
+        quadratic = (a != 0) & np.isfinite(disc)
+        cases[quadratic & (disc > 0)] = CASE_CODES["quadratic_two_real"]
+        cases[quadratic & (disc == 0)] = CASE_CODES["quadratic_one_real"]
+        cases[quadratic & (disc < 0)] = CASE_CODES["quadratic_two_complex"]
+    cases[(a == 0) & (b != 0)] = CASE_CODES["linear"]
+    cases[(a == 0) & (b == 0) & (c != 0)] = CASE_CODES["no_solution"]
+    cases[(a == 0) & (b == 0) & (c == 0)] = CASE_CODES["infinite_solutions"]
+    return cases
+
+
+def relative_residuals(a, b, c, roots):
+
+    # (residual, scale) of every root, (a x) x keeps the terms in range as long as the roots are
+    a, b, c = a[:, None], b[:, None], c[:, None]
+    with np.errstate(all="ignore"):
+        residual = np.abs((a * roots) * roots + b * roots + c)
+        scale = (np.abs(a) * np.abs(roots)) * np.abs(roots) + np.abs(b) * np.abs(roots) + np.abs(c)
+    return residual, scale
+
+
+def residual_failures(a, b, c, results, tolerance=RESIDUAL_TOLERANCE):
+
+    # (roots checked, failed root mask) of the residual check, allowing for rounding into the subnormal range
+    residual, scale = relative_residuals(a, b, c, results.roots)
+    with np.errstate(all="ignore"):
+        allowance = (np.abs(2 * a[:, None] * results.roots) + np.abs(b[:, None]) + 4) * SUBNORMAL_SPACING
+        checked = ~results.na & np.isfinite(scale)
+        failed = checked & ~(residual <= tolerance * scale + allowance)
+    return int(np.count_nonzero(checked)), failed
+
+
+def cancellation_roots(a, b, c, results, tolerance=RESIDUAL_TOLERANCE):
+
+    # roots where rounding alone in (-b +/- sqrt(b*b - 4*a*c)) / (2*a) can push a root past the residual tolerance:
+    # a bound on every root's error from the discriminant's and sqrt's rounding, cancelled against -b, and
+    # from underflow, turned into a bound on the residual
+    roots = np.where(results.na, 0.0, results.roots)
+    a, b, c = a[:, None], b[:, None], c[:, None]
+    with np.errstate(all="ignore"):
+        disc = np.abs(b * b - 4 * a * c)
+        disc_error = EPSILON * (b * b + 4 * np.abs(a * c)) + 2 * SUBNORMAL_SPACING
+        sqrt_d = np.sqrt(disc)
+        sqrt_error = np.where(disc > 0, disc_error / (2 * sqrt_d), np.sqrt(disc_error)) + EPSILON * sqrt_d
+        error = np.where(a != 0, (EPSILON * (np.abs(b) + sqrt_d) + sqrt_error) / np.abs(2 * a), 0.0) \
+            + EPSILON * np.abs(roots) + SUBNORMAL_SPACING
+        bound = np.abs(2 * a * roots + b) * error + np.abs(a) * error * error
+        _, scale = relative_residuals(a[:, 0], b[:, 0], c[:, 0], roots)
+        return ~results.na & ~(CANCELLATION_MARGIN * bound <= tolerance * scale)
+
+
+"""
+Check rows of float coefficients against the numeric invariants:
+    - case          the case follows from a, b, c and the discriminant's sign
+    - residual      every root leaves a relative residual of at most
+                    tolerance (plus what rounding into the subnormal range
+                    costs), where the residual's terms are finite
+    - cancellation  roots failing the residual check where the rounding
+                    error bound of the textbook formula, with its known
+                    cancellation in -b +/- sqrt(disc) and in the
+                    discriminant, allows it; residual leaves them out
+    - scalar        solve_quadratic gives exactly the same case and roots as
+                    solve_quadratic_batch, for the rows in `scalar` (all if None)
+
+Returns ({invariant: (checks, failed row mask)}, RootArrays of the results).
+"""
+def check_values(values, tolerance=RESIDUAL_TOLERANCE, scalar=None, solve=solve_quadratic_batch):
+
+    a, b, c = values[:, 0], values[:, 1], values[:, 2]
+    results = batch_arrays(*solve(a, b, c))
+    checks = {"case": (len(a), results.cases != expected_cases(a, b, c))}
+
+    checked, failed = residual_failures(a, b, c, results, tolerance)
+    known = failed & cancellation_roots(a, b, c, results, tolerance)
+    checks["residual"] = (checked, (failed & ~known).any(axis=1))
+    checks["cancellation"] = (int(np.count_nonzero(failed)), known.any(axis=1) & ~checks["residual"][1])
+
+    scalar = np.arange(len(a)) if scalar is None else scalar
+    reference = result_arrays([solve_quadratic(row) for row in values[scalar].tolist()])
+    sampled = results._replace(cases=results.cases[scalar], roots=results.roots[scalar], na=results.na[scalar])
+    failed = np.zeros(len(a), dtype=bool)
+    failed[scalar[compare_roots(sampled, reference, rtol=0.0)]] = True
+    checks["scalar"] = (len(scalar), failed)
+    return checks, results
+
+
+"""
+Check the text invariant: solve_quadratic_batch given the coefficients
+as text (and numbers) returns incorrect_type for the rejected rows and
+exactly the results of the numbers for the others. results are those of
+the numeric rows, the rows of text that are not rejected.
+
+Returns (checks, failed row mask over all rows).
+"""
+def check_text(text, has_text, rejected, numeric, results, solve=solve_quadratic_batch):
+
+    failed = np.zeros(len(text), dtype=bool)
+    rows = np.flatnonzero(has_text)
+    if not len(rows):
+        return 0, failed
+    actual = batch_arrays(*solve(text[rows, 0], text[rows, 1], text[rows, 2]))
+
+    kept = ~rejected[rows]
+    position = np.searchsorted(numeric, rows[kept])
+    cases = np.full(len(rows), CASE_CODES["incorrect_type"], dtype=np.uint8)
+    roots = np.full((len(rows), 2), np.nan, dtype=np.complex128)
+    na = np.ones((len(rows), 2), dtype=bool)
+    cases[kept], roots[kept], na[kept] = results.cases[position], results.roots[position], results.na[position]
+
+    failed[rows[compare_roots(actual, RootArrays(cases, roots, na), rtol=0.0)]] = True
+    return len(rows), failed
+
+
+def _complexity(row):
+
+    # zero is simplest, then fewer significant digits, positive, and an exponent of zero
+    total = 0
+    for x in row:
+        if x == 0:
+            continue
+        if not math.isfinite(x):
+            total += 3
+            continue
+        digits = repr(abs(x)).split("e")[0].replace(".", "").strip("0")
+        total += 2 * len(digits) + (x < 0) + (math.floor(math.log10(abs(x))) != 0)
+    return total
+
+
+def _simpler_values(x):
+
+    # candidate replacements of one coefficient
+    candidates = [0.0, 1.0, -1.0, abs(x), -x]
+    if math.isfinite(x) and x != 0:
+        candidates.append(float(round(x)))
+        candidates.append(math.copysign(10.0 ** round(math.log10(abs(x))), x))
+        candidates.extend(float(f"{x:.{digits}g}") for digits in range(1, 16))
+    return candidates
+
+
+"""
+Shrink a row of float coefficients failing `invariant`: replace one
+coefficient at a time by a simpler value (zero, +-1, a rounded or
+shorter value, the nearest power of ten) while the row keeps failing,
+all candidates of a round checked in one batch, until no candidate is
+simpler and still fails.
+"""
+def shrink(row, invariant, tolerance=RESIDUAL_TOLERANCE, solve=solve_quadratic_batch, max_rounds=200):
+
+    row = tuple(float(x) for x in row)
+    for _ in range(max_rounds):
+        candidates = []
+        for i in range(3):
+            for value in _simpler_values(row[i]):
+                candidate = row[:i] + (value,) + row[i + 1:]
+                if _complexity(candidate) < _complexity(row):
+                    candidates.append(candidate)
+        if not candidates:
+            break
+        candidates.sort(key=_complexity)
+        failed = check_values(np.array(candidates), tolerance, solve=solve)[0][invariant][1]
+        if not failed.any():
+            break
+        row = candidates[int(np.argmax(failed))]
+    return row
+
+
+def _failure(invariant, row, seed, chunk, index, solve):
+
+    # the failing row solved again on its own for the report
+    results = batch_arrays(*solve(*[np.array([value], dtype=object if isinstance(value, str) else np.float64)
+                                    for value in row]))
+    case = CASE_NAMES[results.cases[0]]
+    roots = ["N/A" if na else complex(root) for root, na in zip(results.roots[0], results.na[0])]
+    return Failure(invariant, tuple(row), case, roots, seed, chunk, index, None)
+
+
+"""
+Fuzz solve_quadratic_batch with chunks first_chunk, first_chunk + 1, ...
+(`chunks` of them) of chunk_rows rows, checking the given invariants.
+
+Returns {"rows", "checks", "failed": {invariant: rows}, "failures"}: up
+to `limit` Failure records per invariant, shrunk unless shrink_failures
+is False. Failures of text rows are not shrunk. fuzz(seed, 1, first_chunk=i)
+with the same chunk_rows and weights draws chunk i again.
+"""
+def fuzz(seed=0, chunks=1, chunk_rows=DEFAULT_CHUNK_ROWS, weights=DEFAULT_WEIGHTS, invariants=INVARIANTS,
+         tolerance=RESIDUAL_TOLERANCE, scalar_rows=SCALAR_ROWS, limit=5, shrink_failures=True, first_chunk=0,
+         solve=solve_quadratic_batch):
+
+    unknown = [name for name in invariants if name not in INVARIANTS]
+    if unknown:
+        raise ValueError(f"Unknown invariants {unknown}, expected some of {', '.join(INVARIANTS)}")
+    report = {"rows": 0, "checks": 0, "failed": {name: 0 for name in invariants}, "failures": []}
+    listed = {name: 0 for name in invariants}
+
+    for chunk in range(first_chunk, first_chunk + chunks):
+        rng = np.random.default_rng([seed, chunk])
+        values, text, has_text, rejected = draw(rng, chunk_rows, weights)
+
+        # rows with text float() rejects are only checked by the text invariant
+        numeric = np.flatnonzero(~rejected)
+        scalar = np.sort(rng.choice(len(numeric), min(scalar_rows, len(numeric)), replace=False))
+        checks, results = check_values(values[numeric], tolerance, scalar, solve)
+        for name, (count, failed) in checks.items():
+            full = np.zeros(chunk_rows, dtype=bool)
+            full[numeric] = failed
+            checks[name] = (count, full)
+        if text is not None:
+            checks["text"] = check_text(text, has_text, rejected, numeric, results, solve)
+
+        report["rows"] += chunk_rows
+        for name, (count, failed) in checks.items():
+            if name not in invariants:
+                continue
+            report["checks"] += count
+            rows = np.flatnonzero(failed)
+            report["failed"][name] += len(rows)
+            for i in rows[:max(0, limit - listed[name])]:
+                listed[name] += 1
+                row = values[i].tolist() if name != "text" else text[i].tolist()
+                failure = _failure(name, row, seed, chunk, int(i), solve)
+                if shrink_failures and name != "text":
+                    failure = failure._replace(shrunk=shrink(row, name, tolerance, solve))
+                report["failures"].append(failure)
+
+    return report
+
+
+def parse_weights(specs):
+
+    # ["log_uniform=2", "text"] -> {"log_uniform": 2.0, "text": 1.0}
+    weights = {}
+    for spec in specs:
+        name, _, weight = spec.partition("=")
+        if name not in DISTRIBUTIONS:
+            raise ValueError(f"Unknown distribution {name!r}, expected one of {', '.join(DISTRIBUTIONS)}")
+        weights[name] = float(weight) if weight else 1.0
+    return weights
+
+
+def print_report(report, seconds):
+
+    for failure in report["failures"]:
+        print(f"    {failure.invariant}: {failure.row} -> {failure.case} {failure.roots} "
+              f"(seed {failure.seed}, chunk {failure.chunk}, row {failure.index})"
+              + (f", shrunk to {failure.shrunk}" if failure.shrunk is not None else ""))
+    print(", ".join(f"{name}: {count} {'known' if name in KNOWN_LIMITS else 'failed'}"
+                    for name, count in report["failed"].items()))
+    rate = report["checks"] / seconds * 60 if seconds else 0.0
+    print(f"{report['rows']} rows, {report['checks']} checks in {seconds:.2f}s ({rate:.0f}/min)")
+
+
+def main(argv=None):
+
+    parser = argparse.ArgumentParser(description="Fuzz solve_quadratic with random coefficients and check invariants")
+    parser.add_argument("--seed", type=int, default=0, help="Random seed (default: 0)")
+    parser.add_argument("--chunks", type=int, default=10, help="Chunks to draw (default: 10)")
+    parser.add_argument("--first-chunk", type=int, default=0, help="Index of the first chunk, to replay one (default: 0)")
+    parser.add_argument("--chunk-rows", type=int, default=DEFAULT_CHUNK_ROWS,
+                        help=f"Rows per chunk (default: {DEFAULT_CHUNK_ROWS})")
+    parser.add_argument("--distribution", action="append", dest="distributions", metavar="NAME[=WEIGHT]",
+                        help=f"Draw from this distribution, may be repeated (default: all of {', '.join(DISTRIBUTIONS)})")
+    parser.add_argument("--invariant", action="append", dest="invariants", choices=INVARIANTS,
+                        help="Only check this invariant, may be repeated (default: all)")
+    parser.add_argument("--tolerance", type=float, default=RESIDUAL_TOLERANCE,
+                        help=f"Largest relative residual of a root (default: {RESIDUAL_TOLERANCE})")
+    parser.add_argument("--limit", type=int, default=5, help="Failures listed per invariant (default: 5)")
+    parser.add_argument("--no-shrink", action="store_true", help="List failures as drawn")
+    args = parser.parse_args(argv)
+
+    start = time.perf_counter()
+    try:
+        weights = parse_weights(args.distributions) if args.distributions else DEFAULT_WEIGHTS
+        report = fuzz(args.seed, args.chunks, args.chunk_rows, weights, args.invariants or INVARIANTS, args.tolerance,
+                      limit=args.limit, shrink_failures=not args.no_shrink, first_chunk=args.first_chunk)
+    except ValueError as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
+
+    print_report(report, time.perf_counter() - start)
+    return 1 if any(count for name, count in report["failed"].items() if name not in KNOWN_LIMITS) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,249 @@
+import sys
+import pathlib
+import argparse
+import csv
+import itertools
+import random
+import numpy as np
+
+from collections import namedtuple
+from pathlib import Path
+
+sys.path.insert(0, str(pathlib.Path(__file__).resolve().parents[1]))
+
+from Solver import solve_quadratic
+from Solver_Batch import CASE_NAMES, to_float_array
+from TestSetWriter import binary_path, write_binary_test_set
+from Manifest import fingerprint, is_up_to_date, read_manifest, write_manifest
+from Covering_Array import covering_array
+
+
+f32_min = np.finfo(np.float32).min/10
+f32_max = np.finfo(np.float32).max/10
+
+# code every generated test set depends on besides its generator script: the engine modules, the write
+# path and, of Solver.py and Solver_Batch.py, only the solver and what the binary records are built with
+ENGINE_SOURCES = [
+    Path(__file__).resolve(),
+    Path(__file__).resolve().with_name("Covering_Array.py"),
+    Path(__file__).resolve().with_name("Manifest.py"),
+    Path(__file__).resolve().parents[1] / "TestSetWriter.py",
+    solve_quadratic,
+    to_float_array,
+    CASE_NAMES,
+]
+
+# default scalars of the metamorphic test set
+METAMORPHIC_SCALARS = (2.0, 0.5, 10.0, -1.0, -0.1)
+
+# a block of the input domain, low == high for a single value block like B3 = 0
+Block = namedtuple("Block", ["name", "low", "high"])
+
+
+"""
+Split [f32_min, f32_max] into `partitions` blocks, symmetric around a
+single value block 0.
+
+partitions must be odd. Each side gets (partitions - 1) / 2 blocks whose
+boundaries are evenly spaced on a log scale, so the default of 5 gives
+the original blocks:
+    B1 < -1, -1 <= B2 < 0, B3 = 0, 0 < B4 <= 1, B5 > 1
+"""
+def make_blocks(partitions=5):
+
+    if partitions < 3 or partitions % 2 == 0:
+        raise ValueError(f"partitions must be an odd number >= 3, got {partitions}")
+
+    side = (partitions - 1) // 2
+    inner = [float(f32_max ** ((2 * i - side) / side)) for i in range(1, side)]
+    positive = [0.0] + inner + [f32_max]
+    negative = [f32_min] + [-bound for bound in reversed(inner)] + [0.0]
+
+    bounds = list(zip(negative, negative[1:])) + [(0.0, 0.0)] + list(zip(positive, positive[1:]))
+    return [Block(f"B{i + 1}", low, high) for i, (low, high) in enumerate(bounds)]
+
+
+"""
+The block partition of one coefficient with `samples` random
+representatives drawn from every block (single value blocks have one).
+
+All randomness comes from self.random, seeded with `seed`: the
+representatives are drawn first, in block order, and strategies that
+make random choices continue from the same stream. With the defaults
+(5 blocks, 1 sample, seed 101) this reproduces the values of the
+original generator scripts. Use a new BlockSpace for every strategy run
+to get reproducible output.
+"""
+class BlockSpace:
+
+    def __init__(self, partitions=5, samples=1, seed=101, blocks=None):
+
+        if samples < 1:
+            raise ValueError(f"samples must be >= 1, got {samples}")
+
+        self.blocks = make_blocks(partitions) if blocks is None else list(blocks)
+        self.samples = samples
+        self.random = random.Random(seed)
+
+        self.values = {}
+        for block in self.blocks:
+            if block.low == block.high:
+                self.values[block.name] = [block.low]
+            else:
+                self.values[block.name] = [self.random.uniform(block.low, block.high) for _ in range(samples)]
+
+        # every representative of every block, in block order
+        self.levels = [value for block in self.blocks for value in self.values[block.name]]
+
+
+def all_combinations(space):
+
+    # every (a, b, c) combination of representatives, len(levels) ** 3 rows
+    for a, b, c in itertools.product(space.levels, repeat=3):
+        yield (a, b, c)
+
+
+def pairwise(space):
+
+    # cyclic latin square OA(n^2, 3, n, 2): covers every pair of representatives for any n
+    n = len(space.levels)
+    for x in range(n):
+        for y in range(n):
+            yield (space.levels[x], space.levels[y], space.levels[(x + y) % n])
+
+
+def covering(space, strength=2):
+
+    # rows of a strength t covering array over the representatives of a, b and c
+    n = len(space.levels)
+    for row in covering_array([n, n, n], strength, seed=space.random.random()):
+        yield (space.levels[row[0]], space.levels[row[1]], space.levels[row[2]])
+
+
+def base_choice(space):
+
+    # each block of each coefficient once, the other two coefficients from random blocks
+    names = [block.name for block in space.blocks]
+    for position in range(3):
+        for name in names:
+            for value in space.values[name]:
+                row = [None, None, None]
+                row[position] = value
+                for other in range(3):
+                    if other != position:
+                        values = space.values[space.random.choice(names)]
+                        row[other] = values[0] if len(values) == 1 else space.random.choice(values)
+                yield tuple(row)
+
+
+def metamorphic(space, scalars=METAMORPHIC_SCALARS, source=all_combinations):
+
+    # follow-up rows of every source row: b negated, then every coefficient scaled
+    for a, b, c in source(space):
+        yield (a, -b, c)
+        for i in scalars:
+            yield (i * a, i * b, i * c)
+
+
+STRATEGIES = {
+    "all_combinations": all_combinations,
+    "pairwise": pairwise,
+    "covering": covering,
+    "base_choice": base_choice,
+    "metamorphic": metamorphic,
+}
+
+
+"""
+Lazily generate (a, b, c) rows with a strategy from STRATEGIES over a new
+BlockSpace(partitions, samples, seed). Extra keyword options, like
+strength for covering, are passed to the strategy.
+"""
+def generate(strategy="all_combinations", partitions=5, samples=1, seed=101, **options):
+
+    if strategy not in STRATEGIES:
+        raise ValueError(f"Unknown strategy {strategy!r}, expected one of {', '.join(STRATEGIES)}")
+    return STRATEGIES[strategy](BlockSpace(partitions, samples, seed), **options)
+
+
+def solve_rows(tests):
+
+    # lazily turn (a, b, c) rows into test set rows a,b,c,case,root1,root2
+    for test in tests:
+        case, root_strs = solve_quadratic(test)
+        yield [test[0], test[1], test[2], case, root_strs[0], root_strs[1]]
+
+
+def write_csv(results, output_file, delim=","):
+
+    # streams rows to the file, returns the number written
+    count = 0
+    with Path(output_file).open("w", newline="") as outfh:
+        writer = csv.writer(outfh, delimiter=delim)
+        for row in results:
+            writer.writerow(row)
+            count += 1
+    return count
+
+
+def _written(rows, writer):
+
+    # passes rows on after writing each to the csv writer
+    for row in rows:
+        writer.writerow(row)
+        yield row
+
+
+def write_test_set(tests, output_file):
+
+    # CSV and binary test set of solved (a, b, c) rows, as the Generate_* scripts write them; both are
+    # written as the rows are solved, a chunk at a time, so a test set is never held in memory
+    with Path(output_file).open("w", newline="") as outfh:
+        writer = csv.writer(outfh, delimiter=",")
+        count = write_binary_test_set(binary_path(output_file), _written(solve_rows(tests), writer))
+    print(f"Wrote results to {output_file}")
+    print(f"Wrote results to {binary_path(output_file)}")
+    return count
+
+
+"""
+Write the test set of generate() to output_file, unless the manifest
+next to it shows the same generator, engine, solver and parameters
+produced the files that are there now (see Manifest.py). force=True
+always regenerates.
+
+Returns (rows, regenerated).
+"""
+def update_test_set(generate, output_file, generator_file, parameters, force=False):
+
+    outputs = [Path(output_file), binary_path(output_file)]
+    digest = fingerprint([generator_file] + ENGINE_SOURCES, parameters)
+    if not force and is_up_to_date(outputs, digest):
+        print(f"{output_file} is up to date")
+        return read_manifest(output_file)["rows"], False
+
+    rows = write_test_set(generate(), output_file)
+    write_manifest(outputs, digest, rows)
+    return rows, True
+
+
+def main(argv=None):
+
+    parser = argparse.ArgumentParser(description="Generate a quadratic test set from the block space")
+    parser.add_argument("strategy", choices=list(STRATEGIES))
+    parser.add_argument("output", help="CSV file to write")
+    parser.add_argument("--partitions", type=int, default=5, help="Blocks per coefficient, odd (default: 5)")
+    parser.add_argument("--samples", type=int, default=1, help="Random representatives per block (default: 1)")
+    parser.add_argument("--seed", type=int, default=101, help="Random seed (default: 101)")
+    parser.add_argument("--strength", type=int, default=2, help="Interaction strength of covering (default: 2)")
+    args = parser.parse_args(argv)
+
+    options = {"strength": args.strength} if args.strategy == "covering" else {}
+    rows = generate(args.strategy, args.partitions, args.samples, args.seed, **options)
+    count = write_csv(solve_rows(rows), args.output)
+    print(f"Wrote {count} rows to {args.output}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,278 @@
+import itertools
+import random
+import numpy as np
+
+from functools import lru_cache
+
+
+"""
+Covering arrays for combinatorial test generation.
+
+A covering array CA(N; t, k, v) has N rows and k columns, column i taking
+values 0 .. v_i - 1, such that every combination of values of every t
+columns appears in at least one row. Rows are indexes into each factor's
+list of values.
+
+covering_array() picks the construction:
+    - bush() when every factor has the same prime power number of levels
+      q, t <= q and there are at most q + 1 factors. This is an
+      orthogonal array OA(q^t, k, q, t), the smallest possible size.
+      bose() is the strength 2 case.
+    - latin_square() for strength 2 and at most three factors with the
+      same number of levels, also an orthogonal array.
+    - ipog() otherwise, a greedy in-parameter-order builder for mixed
+      levels.
+"""
+
+
+def prime_power(q):
+
+    # (p, k) with q == p ** k and p prime, None if q is not a prime power
+    if q < 2:
+        return None
+    for p in range(2, q + 1):
+        if q % p == 0:
+            k = 0
+            while q % p == 0:
+                q //= p
+                k += 1
+            return (p, k) if q == 1 else None
+    return None
+
+
+"""
+Addition and multiplication tables of GF(q) for a prime power q.
+
+Elements are 0 .. q-1, read as polynomials over GF(p) by their base p
+digits. Multiplication is modulo the first monic polynomial of degree k
+that gives a field. Tables are cached, do not modify them.
+"""
+@lru_cache(maxsize=None)
+def galois_field(q):
+
+    factors = prime_power(q)
+    if factors is None:
+        raise ValueError(f"GF({q}) does not exist, {q} is not a prime power")
+    p, k = factors
+
+    elements = np.arange(q)
+    if k == 1:
+        return (elements[:, None] + elements) % p, (elements[:, None] * elements) % p
+
+    digits = np.array([[(x // p ** d) % p for d in range(k)] for x in range(q)])
+    place = p ** np.arange(k)
+    add = ((digits[:, None, :] + digits[None, :, :]) % p) @ place
+
+    for modulus in range(q):
+        # x^k = -(lower terms of the modulus), as base p digits
+        reduction = [(-((modulus // p ** d) % p)) % p for d in range(k)]
+        mul = np.empty((q, q), dtype=np.int64)
+        for x in range(q):
+            for y in range(q):
+                product = [0] * (2 * k - 1)
+                for i in range(k):
+                    for j in range(k):
+                        product[i + j] += digits[x][i] * digits[y][j]
+                for d in range(2 * k - 2, k - 1, -1):
+                    carry = product[d] % p
+                    for i in range(k):
+                        product[d - k + i] += carry * reduction[i]
+                mul[x, y] = sum((product[d] % p) * p ** d for d in range(k))
+        if (mul[1:, 1:] != 0).all():
+            return add, mul
+
+    raise ValueError(f"No irreducible polynomial found for GF({q})")
+
+
+"""
+Bush's orthogonal array OA(q^t, k, q, t) for a prime power q, t <= q and
+k <= q + 1.
+
+Each row is a polynomial f of degree < t over GF(q); its columns are
+f(x) for every field element x followed by the leading coefficient, and
+any t of these determine f.
+"""
+def bush(q, strength, k):
+
+    if strength > q or k > q + 1:
+        raise ValueError(f"Bush construction needs t <= q and k <= q + 1, got q={q}, t={strength}, k={k}")
+    add, mul = galois_field(q)
+
+    coefficients = np.array(list(itertools.product(range(q), repeat=strength)))[:, ::-1]
+    columns = []
+    for x in range(q):
+        power = 1
+        value = np.zeros(len(coefficients), dtype=np.int64)
+        for degree in range(strength):
+            value = add[value, mul[coefficients[:, degree], power]]
+            power = mul[power, x]
+        columns.append(value)
+    columns.append(coefficients[:, strength - 1])
+
+    return np.stack(columns[:k], axis=1)
+
+
+def bose(q, k):
+
+    # OA(q^2, k, q, 2), k <= q + 1
+    return bush(q, 2, k)
+
+
+def latin_square(n):
+
+    # cyclic latin square as OA(n^2, 3, n, 2), exists for every n
+    x, y = np.divmod(np.arange(n * n), n)
+    return np.stack([x, y, (x + y) % n], axis=1)
+
+
+class _Rows:
+
+    # growable int matrix, -1 marks a "don't care" cell
+
+    def __init__(self, initial, width):
+
+        self.data = np.full((max(len(initial), 16), width), -1, dtype=np.int64)
+        self.data[:len(initial), :initial.shape[1]] = initial
+        self.count = len(initial)
+
+    def view(self):
+
+        return self.data[:self.count]
+
+    def append(self):
+
+        if self.count == len(self.data):
+            grown = np.full((2 * len(self.data), self.data.shape[1]), -1, dtype=np.int64)
+            grown[:self.count] = self.data
+            self.data = grown
+        self.count += 1
+        return self.count - 1
+
+
+"""
+Greedy in-parameter-order (IPOG) covering array for mixed levels.
+
+Starts from every combination of the first t factors, then adds one
+factor at a time: each existing row gets the value covering the most
+new t-way combinations (horizontal growth), and combinations still
+missing are placed in rows whose cells are free or added as new rows
+(vertical growth). The t-way combinations of the new factor are kept
+in one flat boolean array so both steps are NumPy operations over all
+combinations at once.
+
+Free cells left at the end are 0, or random values when seed is given.
+"""
+def ipog(levels, strength=2, seed=None):
+
+    levels = [int(v) for v in levels]
+    k = len(levels)
+    t = min(strength, k)
+    if t < 1 or any(v < 1 for v in levels):
+        raise ValueError(f"Need strength >= 1 and at least one level per factor, got t={strength}, levels={levels}")
+
+    start = np.array(list(itertools.product(*(range(v) for v in levels[:t]))), dtype=np.int64).reshape(-1, t)
+    rows = _Rows(start, k)
+    level_array = np.array(levels, dtype=np.int64)
+
+    for i in range(t, k):
+        v = levels[i]
+        values = np.arange(v)
+        combos = np.array(list(itertools.combinations(range(i), t - 1)), dtype=np.intp).reshape(-1, t - 1)
+        combo_levels = level_array[combos]
+
+        # flat index of (combo, previous values, new value) is offset + previous values . weights + new value
+        weights = np.ones_like(combo_levels) * v
+        for p in range(t - 3, -1, -1):
+            weights[:, p] = weights[:, p + 1] * combo_levels[:, p + 1]
+        sizes = combo_levels.prod(axis=1) * v
+        offsets = np.concatenate(([0], np.cumsum(sizes)[:-1]))
+        uncovered = np.ones(int(sizes.sum()), dtype=bool)
+
+        def bases(row):
+
+            previous = row[combos]
+            specified = (previous >= 0).all(axis=1)
+            return (offsets + (previous * weights).sum(axis=1))[specified]
+
+        # horizontal growth
+        data = rows.view()
+        for r in range(len(data)):
+            base = bases(data[r])
+            gains = uncovered[base[:, None] + values].sum(axis=0)
+            if gains.max() > 0:
+                best = int(gains.argmax())
+                data[r, i] = best
+                uncovered[base + best] = False
+
+        # vertical growth
+        for flat in np.flatnonzero(uncovered):
+            if not uncovered[flat]:
+                continue
+            j = int(np.searchsorted(offsets, flat, side="right")) - 1
+            remainder = int(flat - offsets[j])
+            tuple_values = [remainder % v]
+            remainder //= v
+            for p in range(t - 2, -1, -1):
+                tuple_values.append(remainder % combo_levels[j, p])
+                remainder //= combo_levels[j, p]
+            columns = list(combos[j]) + [i]
+            tuple_values = np.array(tuple_values[::-1], dtype=np.int64)
+
+            cells = rows.view()[:, columns]
+            fits = ((cells == tuple_values) | (cells < 0)).all(axis=1)
+            r = int(fits.argmax()) if fits.any() else rows.append()
+            row = rows.view()[r]
+            row[columns] = tuple_values
+            if row[i] >= 0:
+                uncovered[bases(row) + row[i]] = False
+
+    result = rows.view().copy()
+    free = result < 0
+    if free.any():
+        if seed is None:
+            result[free] = 0
+        else:
+            rng = random.Random(seed)
+            for r, c in zip(*np.nonzero(free)):
+                result[r, c] = rng.randrange(levels[c])
+    return result
+
+
+"""
+Covering array of the given strength for factors with the given number
+of levels, as an int array of shape (rows, len(levels)). Uses bush() or
+latin_square() when all factors have the same number of levels and one
+applies, ipog() otherwise.
+"""
+def covering_array(levels, strength=2, seed=None):
+
+    levels = [int(v) for v in levels]
+    k = len(levels)
+    if k == 0:
+        return np.empty((0, 0), dtype=np.int64)
+
+    if strength >= k:
+        return np.array(list(itertools.product(*(range(v) for v in levels))), dtype=np.int64).reshape(-1, k)
+
+    q = levels[0]
+    if all(v == q for v in levels):
+        if prime_power(q) and strength <= q and k <= q + 1:
+            return bush(q, strength, k)
+        if strength == 2 and k <= 3:
+            return latin_square(q)[:, :k]
+    return ipog(levels, strength, seed)
+
+
+def missing_combinations(array, levels, strength=2):
+
+    # number of t-way value combinations not covered by array, 0 for a covering array
+    array = np.asarray(array, dtype=np.int64)
+    missing = 0
+    for columns in itertools.combinations(range(len(levels)), strength):
+        index = np.zeros(len(array), dtype=np.int64)
+        total = 1
+        for c in columns:
+            index = index * levels[c] + array[:, c]
+            total *= levels[c]
+        missing += total - len(np.unique(index))
+    return missing
@@ -0,0 +1,103 @@
+import sys
+import pathlib
+import argparse
+import contextlib
+import importlib
+import io
+import os
+import time
+
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+sys.path.insert(0, str(pathlib.Path(__file__).resolve().parents[1]))
+sys.path.insert(0, str(pathlib.Path(__file__).resolve().parent))
+
+
+# name -> (module, generate function); each module also has OUTPUT_FILE and main(output_file, force)
+GENERATORS = {
+    "all_combinations": ("Generate_All_Combinations_Test_Set", "generate_all_combinations_tests"),
+    "base": ("Generate_Base_Test_Set", "generate_base_tests"),
+    "metamorphic": ("Generate_Metamorphic_Test_Set", "generate_metamorphic_tests"),
+    "pairwise": ("Generate_Pair_Wise_Test_Set", "generate_pairwise_tests"),
+}
+
+
+"""
+Generate, solve and write one test set (CSV, binary and manifest)
+unless its manifest shows it is up to date; force=True always
+regenerates. output_dir replaces the directory of the generator's
+OUTPUT_FILE when given.
+
+Returns a dict with name, rows, path, regenerated, seconds and output
+(what the generator printed).
+"""
+def run_generator(name, output_dir=None, force=False):
+
+    module_name, generate_name = GENERATORS[name]
+    start = time.perf_counter()
+
+    module = importlib.import_module(module_name)
+    output_file = module.OUTPUT_FILE if output_dir is None else Path(output_dir) / module.OUTPUT_FILE.name
+
+    output = io.StringIO()
+    with contextlib.redirect_stdout(output):
+        rows, regenerated = module.main(output_file, force)
+
+    return {
+        "name": name,
+        "rows": rows,
+        "path": str(output_file),
+        "regenerated": regenerated,
+        "seconds": time.perf_counter() - start,
+        "output": output.getvalue(),
+    }
+
+
+"""
+Run the generators in names (all by default) concurrently in a process
+pool of `workers` processes (None = one per generator, up to the CPU
+count; 1 runs them one after another in this process). Test sets whose
+manifest is current are skipped unless force is set. Returns the
+run_generator results in the order of names.
+"""
+def generate_all(names=None, output_dir=None, workers=None, force=False):
+
+    names = list(GENERATORS) if names is None else list(names)
+    unknown = [name for name in names if name not in GENERATORS]
+    if unknown:
+        raise ValueError(f"Unknown generator(s): {', '.join(unknown)}")
+
+    if workers is None:
+        workers = min(len(names), os.cpu_count() or 1)
+    if workers <= 1 or len(names) <= 1:
+        return [run_generator(name, output_dir, force) for name in names]
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        futures = [executor.submit(run_generator, name, output_dir, force) for name in names]
+        return [future.result() for future in futures]
+
+
+def main(argv=None):
+
+    parser = argparse.ArgumentParser(description="Generate all quadratic test sets in parallel")
+    parser.add_argument("--only", nargs="+", choices=list(GENERATORS), help="Generators to run (default: all)")
+    parser.add_argument("--output-dir", default=None, help="Directory for the test sets (default: TestSets)")
+    parser.add_argument("--workers", type=int, default=None,
+                        help="Process pool size, 1 runs serially (default: one per generator)")
+    parser.add_argument("--force", action="store_true", help="Regenerate even if the manifests are up to date")
+    args = parser.parse_args(argv)
+
+    start = time.perf_counter()
+    results = generate_all(args.only, args.output_dir, args.workers, args.force)
+    total = time.perf_counter() - start
+
+    for result in results:
+        status = "" if result["regenerated"] else ", up to date"
+        print(f"{result['name']}: {result['rows']} rows -> {result['path']} ({result['seconds']:.3f}s{status})")
+    print(f"Generated {sum(result['rows'] for result in results)} rows in {total:.3f}s")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
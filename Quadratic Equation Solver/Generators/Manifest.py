@@ -0,0 +1,98 @@
+import hashlib
+import inspect
+import json
+
+from pathlib import Path
+
+
+"""
+Manifests for incremental test set regeneration.
+
+A generator's fingerprint is a SHA-256 over the code it depends on (its
+own source, the engine modules and the function under test) and its
+parameters (strategy, partitions, samples, seed ...). Code is given as
+files, or as functions and constants of a module that also holds code
+the outputs do not depend on. After writing a
+test set the generator stores the fingerprint, the row count and the
+SHA-256 of every output file in a manifest next to the CSV, e.g.
+TestSets/AllCombinations.manifest.json. If a later run computes the same
+fingerprint and the outputs are unchanged, it can skip regeneration and
+leave the files (and their timestamps) alone.
+
+Line endings of the sources are normalised before hashing so a checkout
+with different line endings does not count as a change.
+"""
+
+
+def manifest_path(output_file):
+
+    # TestSets/AllCombinations.csv -> TestSets/AllCombinations.manifest.json
+    return Path(output_file).with_suffix(".manifest.json")
+
+
+def file_digest(path):
+
+    return hashlib.sha256(Path(path).read_bytes()).hexdigest()
+
+
+def source_text(source):
+
+    # (name, text) of a source file, a function (its source) or a constant (its repr)
+    if isinstance(source, (str, Path)):
+        return Path(source).name, Path(source).read_bytes().replace(b"\r\n", b"\n")
+    if inspect.isfunction(source):
+        return f"{source.__module__}.{source.__qualname__}", inspect.getsource(source).encode()
+    return type(source).__name__, repr(source).encode()
+
+
+def fingerprint(sources, parameters):
+
+    digest = hashlib.sha256()
+    for source in sources:
+        name, text = source_text(source)
+        digest.update(name.encode())
+        digest.update(b"\0")
+        digest.update(text)
+        digest.update(b"\0")
+    digest.update(json.dumps(parameters, sort_keys=True, default=repr).encode())
+    return digest.hexdigest()
+
+
+def read_manifest(output_file):
+
+    try:
+        with open(manifest_path(output_file), "r") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+"""
+True when the manifest of outputs[0] has this fingerprint and every file
+in outputs exists with the content recorded in the manifest.
+"""
+def is_up_to_date(outputs, fingerprint_digest):
+
+    manifest = read_manifest(outputs[0])
+    if manifest is None or manifest.get("fingerprint") != fingerprint_digest:
+        return False
+
+    recorded = manifest.get("outputs", {})
+    for output in outputs:
+        path = Path(output)
+        if not path.exists() or recorded.get(path.name) != file_digest(path):
+            return False
+    return True
+
+
+def write_manifest(outputs, fingerprint_digest, rows):
+
+    manifest = {
+        "fingerprint": fingerprint_digest,
+        "rows": rows,
+        "outputs": {Path(output).name: file_digest(output) for output in outputs},
+    }
+    with open(manifest_path(outputs[0]), "w", newline="\n") as f:
+        json.dump(manifest, f, indent=2, sort_keys=True)
+        f.write("\n")
+    return manifest
@@ -0,0 +1,322 @@
+import argparse
+import itertools
+import sys
+import time
+
+import numpy as np
+
+from collections import namedtuple
+from pathlib import Path
+
+from Solver_Batch import CASE_CODES, CASE_NAMES, DEFAULT_CHUNK_ROWS, solve_quadratic_batch
+from TestSetIO import RootArrays, batch_arrays, compare_roots, load_test_set
+
+sys.path.insert(0, str(Path(__file__).resolve().parent / "Generators"))
+
+from Block_Space import generate
+
+
+"""
+Metamorphic relation engine for solve_quadratic.
+
+A relation is declared once as a Relation and checked against any source
+rows of (a, b, c) coefficients: an iterable (e.g. a Block_Space strategy,
+which generates rows lazily) or an (n, 3) array. Sources are read
+DEFAULT_CHUNK_ROWS rows at a time, each chunk is solved once with
+solve_quadratic_batch, and the follow-up rows of every relation and
+parameter are derived from the chunk as arrays and solved in the same
+way, so follow-ups are never written to a CSV or held beyond their chunk.
+"""
+
+
+"""
+A metamorphic relation:
+    - name         as used on the command line
+    - parameters   values the relation is instantiated with, every source
+                   row gives one follow-up per parameter
+    - follow_up    (a, b, c, p) -> follow-up coefficient arrays
+    - expected     (source RootArrays, p) -> RootArrays the follow-ups must give
+    - applies      (source RootArrays, a, b, c, p) -> bool mask of the source
+                   rows the relation holds for in floating point
+    - tolerance    (source RootArrays, p) -> absolute root tolerance per row
+                   on top of the relative one, or None
+"""
+Relation = namedtuple("Relation", ["name", "parameters", "follow_up", "expected", "applies", "tolerance"])
+
+# one relation instance that does not hold
+Violation = namedtuple("Violation", ["relation", "parameter", "source", "follow_up", "expected", "actual"])
+
+# scalars of the metamorphic test set and test_metamorphic_relation.py
+SCALARS = (2.0, 0.5, 10.0, -1.0, -0.1)
+
+# shifts of the roots by the substitution x = y + h
+SHIFTS = (1.0, -0.5, 3.0)
+
+QUADRATIC_CASES = [CASE_CODES[name] for name in ("quadratic_two_real", "quadratic_one_real", "quadratic_two_complex")]
+TWO_ROOT_CASES = [CASE_CODES["quadratic_two_real"], CASE_CODES["quadratic_two_complex"]]
+NUMERIC_CASES = [code for name, code in CASE_CODES.items() if name not in ("incorrect_type", "overflow")]
+
+# smallest |4ac| / b^2, and largest relative change of the discriminant, where the textbook formula
+# and shifted coefficients are still accurate to the default tolerance
+CANCELLATION = 1e-9
+
+
+def discriminant(a, b, c):
+
+    with np.errstate(all="ignore"):
+        return b * b - 4 * a * c
+
+
+def settled(a, b, c):
+
+    # rows whose discriminant is zero or clear of it, so a relation computed with rounding keeps the case
+    with np.errstate(all="ignore"):
+        disc = discriminant(a, b, c)
+        margin = 16 * np.finfo(np.float64).eps * np.maximum(b * b, np.abs(4 * a * c))
+    return (disc == 0) | (np.abs(disc) > margin)
+
+
+def without_cancellation(a, b, c):
+
+    # rows where -b +/- sqrt(disc) keeps both real roots to about 6 digits: it loses the smaller one
+    # to cancellation when b * b is far larger than 4ac (solve_quadratic_stable avoids that)
+    with np.errstate(all="ignore"):
+        return (discriminant(a, b, c) < 0) | (np.abs(4 * a * c) >= CANCELLATION * b * b)
+
+
+def _shifted(a, b, c, h):
+
+    # a (y + h)^2 + b (y + h) + c
+    return a, 2 * a * h + b, a * h * h + b * h + c
+
+
+def _shift_applies(source, a, b, c, h):
+
+    # two roots, and the shifted coefficients keep the discriminant: rounding them can lose
+    # the small terms of a h^2 + b h + c next to large ones
+    fa, fb, fc = _shifted(a, b, c, h)
+    disc = discriminant(a, b, c)
+    with np.errstate(all="ignore"):
+        kept = np.abs(discriminant(fa, fb, fc) - disc) <= CANCELLATION * np.abs(disc)
+    return np.isin(source.cases, TWO_ROOT_CASES) & settled(a, b, c) & kept & without_cancellation(fa, fb, fc)
+
+
+def _scale_applies(source, a, b, c, k):
+
+    # numeric cases that keep their case; unless k is a power of two (an exact scaling), also real roots the
+    # textbook formula gives accurately: rounding k * c moves a root lost to cancellation far beyond the tolerance
+    applies = np.isin(source.cases, NUMERIC_CASES) & settled(a, b, c)
+    if abs(np.frexp(k)[0]) == 0.5:
+        return applies
+    return applies & (~np.isin(source.cases, QUADRATIC_CASES) | without_cancellation(a, b, c))
+
+
+def _same_roots(source, p):
+
+    return source
+
+
+def _negated_roots(source, p):
+
+    return source._replace(roots=-source.roots + 0.0)
+
+
+def _reciprocal_roots(source, p):
+
+    with np.errstate(all="ignore"):
+        return source._replace(roots=1.0 / source.roots + 0.0)
+
+
+def _shifted_roots(source, p):
+
+    return source._replace(roots=source.roots - p + 0.0)
+
+
+# relations by name, in the order they are checked
+RELATIONS = {relation.name: relation for relation in [
+    # MR1: k * (a, b, c) has the same case and roots for any k != 0
+    Relation("scale", SCALARS,
+             lambda a, b, c, k: (k * a, k * b, k * c),
+             _same_roots,
+             _scale_applies,
+             None),
+    # MR2: negating b negates the roots, exactly
+    Relation("negate_b", (None,),
+             lambda a, b, c, p: (a, -b, c),
+             _negated_roots,
+             lambda source, a, b, c, p: np.ones(len(a), dtype=bool),
+             None),
+    # MR3: swapping a and c (c != 0) gives the reciprocal roots; the discriminant is the same
+    Relation("swap_a_c", (None,),
+             lambda a, b, c, p: (c, b, a),
+             _reciprocal_roots,
+             lambda source, a, b, c, p: np.isin(source.cases, QUADRATIC_CASES) & (c != 0)
+                 & without_cancellation(a, b, c),
+             None),
+    # MR4: substituting x = y + h, a y^2 + (2ah + b) y + (ah^2 + bh + c), shifts the roots by -h
+    Relation("shift", SHIFTS,
+             _shifted,
+             _shifted_roots,
+             _shift_applies,
+             lambda source, h: abs(h)),
+]}
+
+
+def chunks(rows, chunk_rows=DEFAULT_CHUNK_ROWS):
+
+    # (a, b, c) float arrays of up to chunk_rows source rows at a time, without reading rows ahead
+    if isinstance(rows, np.ndarray):
+        rows = np.asarray(rows, dtype=np.float64).reshape(-1, 3)
+        for start in range(0, len(rows), chunk_rows):
+            chunk = rows[start:start + chunk_rows]
+            yield chunk[:, 0], chunk[:, 1], chunk[:, 2]
+        return
+
+    rows = iter(rows)
+    while True:
+        chunk = np.array(list(itertools.islice(rows, chunk_rows)), dtype=np.float64).reshape(-1, 3)
+        if not len(chunk):
+            return
+        yield chunk[:, 0], chunk[:, 1], chunk[:, 2]
+
+
+def solve_arrays(solve, a, b, c):
+
+    return batch_arrays(*solve(a, b, c))
+
+
+def _result(arrays, i):
+
+    # (case, [root1, root2]) of row i, "N/A" where there is no root
+    return CASE_NAMES[arrays.cases[i]], ["N/A" if na else complex(root) for root, na in zip(arrays.roots[i], arrays.na[i])]
+
+
+"""
+Follow-up rows of a relation for every source row, lazily, as
+(source, parameter, follow_up) tuples of (a, b, c) rows, whether or not
+the relation applies to the source. For writing a metamorphic test set
+or looking at a few instances; check_relations does not need it.
+"""
+def follow_ups(rows, relation, chunk_rows=DEFAULT_CHUNK_ROWS):
+
+    for a, b, c in chunks(rows, chunk_rows):
+        follow = [relation.follow_up(a, b, c, p) for p in relation.parameters]
+        for i in range(len(a)):
+            for p, (fa, fb, fc) in zip(relation.parameters, follow):
+                yield (a[i], b[i], c[i]), p, (float(fa[i]), float(fb[i]), float(fc[i]))
+
+
+"""
+Check relations (default: every one in RELATIONS) against the source rows.
+
+Each chunk of sources is solved once; for every relation and parameter
+the follow-ups of the sources it applies to are solved in one batch and
+compared with compare_roots at a relative tolerance of rtol (plus the
+relation's absolute tolerance). Instances whose follow-up coefficients
+are not finite, or overflow while the source did not, are skipped: they
+leave the floating point range rather than break the relation.
+
+solve is the batch solver under test, solve_quadratic_batch by default.
+Returns {relation name: {"checked", "skipped", "violated", "violations"}},
+with at most `limit` Violation records per relation.
+"""
+def check_relations(rows, relations=None, rtol=1e-5, chunk_rows=DEFAULT_CHUNK_ROWS, limit=20,
+                    solve=solve_quadratic_batch):
+
+    relations = list(RELATIONS.values()) if relations is None else list(relations)
+    results = {relation.name: {"checked": 0, "skipped": 0, "violated": 0, "violations": []} for relation in relations}
+
+    for a, b, c in chunks(rows, chunk_rows):
+        source = solve_arrays(solve, a, b, c)
+
+        for relation in relations:
+            result = results[relation.name]
+            for p in relation.parameters:
+                with np.errstate(all="ignore"):
+                    fa, fb, fc = relation.follow_up(a, b, c, p)
+                    applies = relation.applies(source, a, b, c, p) \
+                        & np.isfinite(fa) & np.isfinite(fb) & np.isfinite(fc)
+                applies = np.flatnonzero(applies)
+                applied = RootArrays(source.cases[applies], source.roots[applies], source.na[applies])
+                fa, fb, fc = fa[applies], fb[applies], fc[applies]
+                follow = solve_arrays(solve, fa, fb, fc)
+                expected = relation.expected(applied, p)
+
+                # a follow-up that overflows where its source did not has left the floating point range
+                in_range = (follow.cases != CASE_CODES["overflow"]) | (applied.cases == CASE_CODES["overflow"])
+                result["checked"] += int(np.count_nonzero(in_range))
+                result["skipped"] += len(a) - int(np.count_nonzero(in_range))
+
+                atol = 0.0 if relation.tolerance is None else rtol * relation.tolerance(applied, p)
+                indexes = [i for i in compare_roots(follow, expected, rtol, atol=atol) if in_range[i]]
+                result["violated"] += len(indexes)
+                for i in indexes[:max(0, limit - len(result["violations"]))]:
+                    j = applies[i]
+                    result["violations"].append(Violation(
+                        relation.name, p, (float(a[j]), float(b[j]), float(c[j])),
+                        (float(fa[i]), float(fb[i]), float(fc[i])), _result(expected, i), _result(follow, i)))
+
+    return results
+
+
+def rows_of_test_sets(names):
+
+    # (a, b, c) of the rows of CSV test sets with numeric coefficients
+    for name in names:
+        for row in load_test_set(name):
+            if None not in row.coefficients:
+                yield row.coefficients
+
+
+def block_rows(strategy, partitions, samples, seed):
+
+    # rows of a Block_Space strategy, generated as they are checked
+    return generate(strategy, partitions, samples, seed)
+
+
+def print_results(results, seconds):
+
+    for name, result in results.items():
+        print(f"{name}: {result['checked']} checked, {result['skipped']} skipped, {result['violated']} violated")
+        for violation in result["violations"]:
+            print(f"    {violation.source} -> {violation.follow_up} (p={violation.parameter}): "
+                  f"expected {violation.expected}, got {violation.actual}")
+    checked = sum(result["checked"] for result in results.values())
+    rate = checked / seconds * 60 if seconds else 0.0
+    print(f"{checked} relation instances in {seconds:.2f}s ({rate:.0f}/min)")
+
+
+def main(argv=None):
+
+    parser = argparse.ArgumentParser(description="Check metamorphic relations of solve_quadratic in batches")
+    parser.add_argument("test_sets", nargs="*", help="Source test set CSVs (default: AllCombinations.csv)")
+    parser.add_argument("--strategy", help="Generate the sources with this Block_Space strategy instead")
+    parser.add_argument("--partitions", type=int, default=5, help="Blocks per coefficient, odd (default: 5)")
+    parser.add_argument("--samples", type=int, default=1, help="Random representatives per block (default: 1)")
+    parser.add_argument("--seed", type=int, default=101, help="Random seed (default: 101)")
+    parser.add_argument("--relation", action="append", dest="relations", choices=list(RELATIONS),
+                        help="Only check this relation, may be repeated (default: all)")
+    parser.add_argument("--rtol", type=float, default=1e-5, help="Relative root tolerance (default: 1e-5)")
+    parser.add_argument("--chunk-rows", type=int, default=DEFAULT_CHUNK_ROWS,
+                        help=f"Source rows per batch (default: {DEFAULT_CHUNK_ROWS})")
+    parser.add_argument("--limit", type=int, default=20, help="Violations listed per relation (default: 20)")
+    args = parser.parse_args(argv)
+
+    relations = [RELATIONS[name] for name in args.relations] if args.relations else None
+    start = time.perf_counter()
+    try:
+        if args.strategy:
+            rows = block_rows(args.strategy, args.partitions, args.samples, args.seed)
+        else:
+            rows = rows_of_test_sets(args.test_sets or ["AllCombinations.csv"])
+        results = check_relations(rows, relations, args.rtol, args.chunk_rows, args.limit)
+    except (OSError, ValueError) as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
+
+    print_results(results, time.perf_counter() - start)
+    return 1 if any(result["violated"] for result in results.values()) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
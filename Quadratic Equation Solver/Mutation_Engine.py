@@ -0,0 +1,397 @@
+import argparse
+import ast
+import signal
+import sys
+import threading
+import time
+import types
+
+from collections import namedtuple
+from pathlib import Path
+
+
+"""
+In-process mutation testing for small modules like Solver.py.
+
+The module is parsed once. Every mutation point inside its functions
+(comparison, arithmetic and boolean operators, `not` and unary minus,
+numeric, string and boolean constants, break/continue) is one mutant. A
+mutant is made by changing that one AST node, compiling the tree into a
+fresh module object and changing the node back, so nothing is written to
+disk and no interpreter or pytest process is started. Top level
+statements are compiled one by one and cached, so a mutant only costs
+compiling the function or class it changes.
+
+Each mutant is checked by an oracle: a callable taking the mutant module
+and returning None when every check passes, or a description of the
+first failing check. The oracle holds its test data in memory (see
+solver_oracle), so it is loaded once for all mutants. An exception from
+the mutant or the oracle kills the mutant too.
+
+Mutants that loop forever are stopped after `timeout` seconds with
+SIGALRM, where available (Unix, main thread).
+"""
+
+
+Mutation = namedtuple("Mutation", ["index", "function", "line", "description"])
+
+# operator replacements, as mutmut makes them
+COMPARE_SWAPS = {
+    ast.Lt: ast.LtE, ast.LtE: ast.Lt, ast.Gt: ast.GtE, ast.GtE: ast.Gt,
+    ast.Eq: ast.NotEq, ast.NotEq: ast.Eq, ast.Is: ast.IsNot, ast.IsNot: ast.Is,
+    ast.In: ast.NotIn, ast.NotIn: ast.In,
+}
+BINOP_SWAPS = {
+    ast.Add: ast.Sub, ast.Sub: ast.Add, ast.Mult: ast.Div, ast.Div: ast.Mult,
+    ast.FloorDiv: ast.Div, ast.Mod: ast.Div, ast.Pow: ast.Mult,
+    ast.LShift: ast.RShift, ast.RShift: ast.LShift,
+    ast.BitAnd: ast.BitOr, ast.BitOr: ast.BitAnd, ast.BitXor: ast.BitAnd,
+}
+BOOLOP_SWAPS = {ast.And: ast.Or, ast.Or: ast.And}
+SYMBOLS = {
+    ast.Lt: "<", ast.LtE: "<=", ast.Gt: ">", ast.GtE: ">=", ast.Eq: "==", ast.NotEq: "!=",
+    ast.Is: "is", ast.IsNot: "is not", ast.In: "in", ast.NotIn: "not in",
+    ast.Add: "+", ast.Sub: "-", ast.Mult: "*", ast.Div: "/", ast.FloorDiv: "//", ast.Mod: "%",
+    ast.Pow: "**", ast.LShift: "<<", ast.RShift: ">>", ast.BitAnd: "&", ast.BitOr: "|", ast.BitXor: "^",
+    ast.And: "and", ast.Or: "or",
+}
+
+
+class MutantTimeout(BaseException):
+
+    # BaseException so `except Exception` in the mutant cannot swallow it
+    pass
+
+
+def _mutated_constant(value):
+
+    # (replacement, description) for a constant, None if it is not mutated
+    if isinstance(value, bool):
+        return not value, f"{value} -> {not value}"
+    if isinstance(value, (int, float)):
+        return value + 1, f"{value!r} -> {value + 1!r}"
+    if isinstance(value, str):
+        return f"XX{value}XX", f"{value!r} -> 'XX{value}XX'"
+    return None
+
+
+def _docstring(body):
+
+    # the docstring node of a module, class or function body, if any
+    if body and isinstance(body[0], ast.Expr) and isinstance(body[0].value, ast.Constant) \
+            and isinstance(body[0].value.value, str):
+        return body[0].value
+    return None
+
+
+"""
+Every mutation point of the functions in tree, as (Mutation, edit) pairs.
+An edit is (target, key, new): target is an AST node and key an
+attribute name, or target is a list of the tree and key an index.
+
+Only function bodies are mutated (like mutmut), without their
+docstrings, decorators, annotations and f-string text. functions limits
+the mutants to functions with these names or qualified names (a method
+by "name" or "Class.name").
+"""
+def find_mutations(tree, functions=None):
+
+    found = []
+
+    def add(function, node, description, target, key, new):
+
+        found.append((Mutation(len(found), function, node.lineno, description), (target, key, new)))
+
+    def visit(node, function, skip, scope=""):
+
+        for field, value in ast.iter_fields(node):
+            if field in ("decorator_list", "returns", "annotation", "type_comment"):
+                continue
+            children = value if isinstance(value, list) else [value]
+            for index, child in enumerate(children):
+                if not isinstance(child, ast.AST):
+                    continue
+                target, key = (value, index) if isinstance(value, list) else (node, field)
+                visit_child(child, function, skip, scope, target, key)
+
+    def visit_child(node, function, skip, scope, target, key):
+
+        if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+            name = scope + node.name
+            inner = name if functions is None or node.name in functions or name in functions else None
+            visit(node, inner, {id(_docstring(node.body))}, name + ".")
+            return
+        if isinstance(node, ast.ClassDef):
+            visit(node, None, {id(_docstring(node.body))}, scope + node.name + ".")
+            return
+        if function is None or id(node) in skip or isinstance(node, ast.JoinedStr):
+            if not isinstance(node, ast.JoinedStr):
+                visit(node, function, skip, scope)
+            return
+
+        if isinstance(node, ast.Compare):
+            for i, op in enumerate(node.ops):
+                if type(op) in COMPARE_SWAPS:
+                    new = COMPARE_SWAPS[type(op)]
+                    add(function, node, f"{SYMBOLS[type(op)]} -> {SYMBOLS[new]}", node.ops, i, new())
+        elif isinstance(node, (ast.BinOp, ast.AugAssign)) and type(node.op) in BINOP_SWAPS:
+            new = BINOP_SWAPS[type(node.op)]
+            add(function, node, f"{SYMBOLS[type(node.op)]} -> {SYMBOLS[new]}", node, "op", new())
+        elif isinstance(node, ast.BoolOp):
+            new = BOOLOP_SWAPS[type(node.op)]
+            add(function, node, f"{SYMBOLS[type(node.op)]} -> {SYMBOLS[new]}", node, "op", new())
+        elif isinstance(node, ast.UnaryOp) and isinstance(node.op, (ast.Not, ast.USub)):
+            add(function, node, "not removed" if isinstance(node.op, ast.Not) else "unary - removed",
+                target, key, node.operand)
+        elif isinstance(node, ast.Constant):
+            mutated = _mutated_constant(node.value)
+            if mutated is not None:
+                add(function, node, mutated[1], node, "value", mutated[0])
+        elif isinstance(node, ast.Break):
+            add(function, node, "break -> continue", target, key, ast.Continue(lineno=node.lineno))
+        elif isinstance(node, ast.Continue):
+            add(function, node, "continue -> break", target, key, ast.Break(lineno=node.lineno))
+
+        visit(node, function, skip, scope)
+
+    visit(tree, None, {id(_docstring(tree.body))})
+    return found
+
+
+def _set(target, key, value):
+
+    if isinstance(target, list):
+        target[key] = value
+    else:
+        setattr(target, key, value)
+
+
+def _get(target, key):
+
+    return target[key] if isinstance(target, list) else getattr(target, key)
+
+
+"""
+The mutants of one module source file.
+
+engine.mutations lists them; engine.module(index) executes mutant index
+(None for the original) as a fresh module object, and engine.run(oracle)
+checks all of them.
+"""
+class MutationEngine:
+
+    def __init__(self, path, functions=None, module_name=None):
+
+        self.path = Path(path)
+        self.module_name = module_name or self.path.stem
+        self.source = self.path.read_text()
+        self.tree = ast.parse(self.source, filename=str(self.path))
+        found = find_mutations(self.tree, functions)
+        self.mutations = [mutation for mutation, _ in found]
+        self._edits = [edit for _, edit in found]
+
+        # __future__ imports apply to the whole module, which then has to be compiled as one
+        future = any(isinstance(stmt, ast.ImportFrom) and stmt.module == "__future__" for stmt in self.tree.body)
+        self._statements = [self.tree] if future else self.tree.body
+        self._compiled = [self._compile(stmt) for stmt in self._statements]
+
+    def _compile(self, statement):
+
+        body = statement.body if isinstance(statement, ast.Module) else [statement]
+        return compile(ast.fix_missing_locations(ast.Module(body=body, type_ignores=[])), str(self.path), "exec")
+
+    def _statement(self, line):
+
+        # index of the top level statement containing line
+        for i, stmt in enumerate(self._statements):
+            if getattr(stmt, "lineno", 0) <= line <= getattr(stmt, "end_lineno", line):
+                return i
+        return 0
+
+    def code(self, index=None):
+
+        # compiled top level statements of mutant index, the original for None
+        if index is None:
+            return self._compiled
+
+        target, key, new = self._edits[index]
+        i = self._statement(self.mutations[index].line)
+        old = _get(target, key)
+        _set(target, key, new)
+        try:
+            mutated = self._compile(self._statements[i])
+        finally:
+            _set(target, key, old)
+        return self._compiled[:i] + [mutated] + self._compiled[i + 1:]
+
+    def module(self, index=None):
+
+        # module object running code(index); registered in sys.modules only while it is executed
+        module = types.ModuleType(self.module_name)
+        module.__file__ = str(self.path)
+        previous = sys.modules.get(self.module_name)
+        sys.modules[self.module_name] = module
+        try:
+            for code in self.code(index):
+                exec(code, module.__dict__)
+        finally:
+            if previous is None:
+                del sys.modules[self.module_name]
+            else:
+                sys.modules[self.module_name] = previous
+        return module
+
+    """
+    Check mutants (all, or those in indexes) with oracle. Returns one
+    dict per mutant with mutant (its Mutation), status (killed, survived
+    or timeout), failure (what killed it) and seconds.
+
+    Raises ValueError if the oracle fails on the original module.
+    """
+    def run(self, oracle, indexes=None, timeout=1.0):
+
+        failure = oracle(self.module())
+        if failure is not None:
+            raise ValueError(f"The oracle fails on the original {self.path.name}: {failure}")
+
+        indexes = range(len(self.mutations)) if indexes is None else indexes
+        return [self.run_mutant(index, oracle, timeout) for index in indexes]
+
+    def run_mutant(self, index, oracle, timeout=1.0):
+
+        start = time.perf_counter()
+        status, failure = "killed", None
+        try:
+            with _time_limit(timeout):
+                failure = oracle(self.module(index))
+            if failure is None:
+                status = "survived"
+        except MutantTimeout:
+            status, failure = "timeout", f"no result after {timeout}s"
+        except Exception as e:
+            failure = f"{type(e).__name__}: {e}"
+
+        return {
+            "mutant": self.mutations[index],
+            "status": status,
+            "failure": failure,
+            "seconds": time.perf_counter() - start,
+        }
+
+
+class _time_limit:
+
+    # raises MutantTimeout in the with block after `seconds`, if SIGALRM can be used here
+
+    def __init__(self, seconds):
+
+        self.seconds = seconds
+        self.active = bool(seconds) and hasattr(signal, "setitimer") \
+            and threading.current_thread() is threading.main_thread()
+
+    def __enter__(self):
+
+        if self.active:
+            self.previous = signal.signal(signal.SIGALRM, self._expired)
+            signal.setitimer(signal.ITIMER_REAL, self.seconds)
+
+    def __exit__(self, *exc):
+
+        if self.active:
+            signal.setitimer(signal.ITIMER_REAL, 0)
+            signal.signal(signal.SIGALRM, self.previous)
+        return False
+
+    def _expired(self, signum, frame):
+
+        raise MutantTimeout()
+
+
+"""
+Oracle for Solver.py mutants: every row of the given test set CSVs,
+checked the way the test modules check them, with TestSetIO's
+comparison kernel (case equal, roots equal to 6 significant digits, or
+COMPARED_DIGITS, in either order, "N/A" where the case has no roots,
+linear and one-real roots given as floats).
+The rows are loaded and their expected roots turned into arrays once,
+when the oracle is built; a mutant's results are compared a test set at
+a time.
+"""
+def solver_oracle(test_set_paths):
+
+    from TestSetIO import COMPARED_DIGITS, compare_results, expected_arrays, load_test_set
+
+    test_sets = []
+    for path in test_set_paths:
+        rows = load_test_set(Path(path).resolve())
+        rtol = 10.0 ** (1 - COMPARED_DIGITS.get(Path(path).name, 6))
+        test_sets.append((rows, expected_arrays(rows), rtol))
+
+    def oracle(module):
+
+        solve = module.solve_quadratic
+        for rows, expected, rtol in test_sets:
+            results = [solve([row.a, row.b, row.c]) for row in rows]
+            indexes = compare_results(results, expected, rtol)
+            if len(indexes):
+                row = rows[indexes[0]]
+                case, roots = results[indexes[0]]
+                return f"{row.a},{row.b},{row.c}: {case} {roots}, expected {row.case} {list(row.roots)}"
+        return None
+
+    oracle.rows = sum(len(rows) for rows, _, _ in test_sets)
+    return oracle
+
+
+def summarize(results, seconds):
+
+    counts = {"killed": 0, "survived": 0, "timeout": 0}
+    for result in results:
+        counts[result["status"]] += 1
+    rate = len(results) / seconds * 60 if seconds else 0.0
+    return (f"{len(results)} mutants in {seconds:.2f}s ({rate:.0f}/min): "
+            + ", ".join(f"{count} {status}" for status, count in counts.items()))
+
+
+def print_results(results, seconds):
+
+    for result in results:
+        if result["status"] != "killed":
+            mutant = result["mutant"]
+            print(f"    {mutant.index}: {mutant.function} line {mutant.line}: {mutant.description}: {result['status']}")
+    print(summarize(results, seconds))
+
+
+def main(argv=None):
+
+    test_sets = Path(__file__).resolve().parent / "TestSets"
+    parser = argparse.ArgumentParser(description="Mutation test Solver.py in process against the CSV test sets")
+    parser.add_argument("test_sets", nargs="*", help="Test set CSVs the mutants are checked against (default: all in TestSets/)")
+    parser.add_argument("--module", default=str(Path(__file__).resolve().with_name("Solver.py")), help="Module to mutate")
+    parser.add_argument("--function", action="append", dest="functions",
+                        help="Only mutate this function, may be repeated (default: solve_quadratic)")
+    parser.add_argument("--timeout", type=float, default=1.0, help="Seconds per mutant (default: 1)")
+    parser.add_argument("--list", action="store_true", help="List the mutants without running them")
+    args = parser.parse_args(argv)
+
+    engine = MutationEngine(args.module, args.functions or ["solve_quadratic"])
+    if args.list:
+        for mutant in engine.mutations:
+            print(f"{mutant.index}: {mutant.function} line {mutant.line}: {mutant.description}")
+        return 0
+
+    paths = args.test_sets or sorted(test_sets.glob("*.csv"))
+    try:
+        oracle = solver_oracle(paths)
+        start = time.perf_counter()
+        results = engine.run(oracle, timeout=args.timeout)
+    except (OSError, ValueError) as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
+
+    print_results(results, time.perf_counter() - start)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,500 @@
+import argparse
+import fnmatch
+import json
+import multiprocessing
+import os
+import re
+import select
+import shutil
+import signal
+import subprocess
+import sys
+import tempfile
+import time
+
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+
+
+"""
+Parallel runner for mutants generated by mutmut.
+
+`mutmut run` writes a mutants/ directory with the mutated sources (every
+mutant is a function `x_<name>__mutmut_<n>` picked at call time through
+the MUTANT_UNDER_TEST environment variable), a copy of the tests and
+mutmut-stats.json, whose tests_by_mangled_function_name maps every
+mutated function to the tests that call it.
+
+Instead of running the configured test suite once per mutant, this runner
+    - runs only the tests that call the mutated function, fastest first
+      (by duration_by_test),
+    - stops at the first failing test (pytest -x), which kills the mutant,
+    - runs mutants in a process pool. Each worker imports pytest and
+      collects the tests once, then forks a child per mutant, so a mutant
+      costs its tests and not an interpreter start. Where os.fork is not
+      available (Windows) every mutant gets a new pytest process.
+
+Results are written back to the .meta files as mutmut does, so
+`mutmut results` and `mutmut browse` show them. mutmut 2's
+.mutmut-cache is read too, see cached_mutants. Only a failing test
+kills a mutant; runs that were interrupted or stopped on a usage error
+are reported as such, not as kills.
+"""
+
+
+# exit codes stored in the .meta files, as used by mutmut: pytest's own exit code when the tests ran
+EXIT_SURVIVED = 0
+EXIT_KILLED = 1
+EXIT_INTERRUPTED = 2
+EXIT_INTERNAL_ERROR = 3
+EXIT_USAGE_ERROR = 4
+EXIT_NO_TESTS_COLLECTED = 5
+EXIT_NO_TESTS = 33
+EXIT_TIMEOUT = 36
+
+# statuses as mutmut reports them; only failing tests (1) or a pytest internal error (3) kill a mutant,
+# an interrupted run or a usage error (a test id that is not found, a broken config) does not
+STATUS_BY_EXIT_CODE = {
+    EXIT_SURVIVED: "survived",
+    EXIT_KILLED: "killed",
+    EXIT_INTERRUPTED: "interrupted",
+    EXIT_INTERNAL_ERROR: "killed",
+    EXIT_USAGE_ERROR: "usage error",
+    EXIT_NO_TESTS_COLLECTED: "no tests",
+    EXIT_NO_TESTS: "no tests",
+    EXIT_TIMEOUT: "timeout",
+    -9: "segfault",
+    -11: "segfault",
+}
+
+# statuses main always counts, others only when a mutant has them
+REPORTED_STATUSES = ("killed", "survived", "no tests", "timeout")
+
+# statuses that mean the tests did not run to a verdict, which main reports as a failed run
+ERROR_STATUSES = ("interrupted", "usage error", "segfault", "error")
+
+# mutmut 2 cache statuses of the statuses that decide a mutant, the others leave it untested
+MUTMUT2_STATUS = {"killed": "ok_killed", "survived": "bad_survived", "timeout": "bad_timeout"}
+
+# a mutmut 2 mutant: its primary key in .mutmut-cache (the id `mutmut show` takes), the source file and
+# mutmut's mutation id, the text and 0-based number of the mutated line and the mutation's index on it
+CachedMutant = namedtuple("CachedMutant", ["pk", "filename", "line", "line_number", "index"])
+
+MUTANT_DEF = re.compile(r"^def (x_\w+?__mutmut_\d+)\(", re.MULTILINE)
+
+
+def load_stats(mutants_dir):
+
+    with open(Path(mutants_dir) / "mutmut-stats.json", "r") as f:
+        stats = json.load(f)
+    return stats.get("tests_by_mangled_function_name", {}), stats.get("duration_by_test", {})
+
+
+def function_name(mutant):
+
+    # Solver.x_solve_quadratic__mutmut_10 -> Solver.x_solve_quadratic
+    return mutant.rpartition("__mutmut_")[0]
+
+
+def module_name(source, mutants_dir):
+
+    # mutants/pkg/mod.py -> pkg.mod
+    return ".".join(Path(source).relative_to(mutants_dir).with_suffix("").parts)
+
+
+"""
+Names of every mutant in mutants_dir, e.g. Solver.x_solve_quadratic__mutmut_10,
+in the order they appear in the mutated sources. Sources are found through
+their .meta files; the tests directory copy is not searched.
+"""
+def find_mutants(mutants_dir):
+
+    mutants_dir = Path(mutants_dir)
+    mutants = []
+    for meta in sorted(mutants_dir.rglob("*.py.meta")):
+        source = meta.with_suffix("")
+        module = module_name(source, mutants_dir)
+        for name in MUTANT_DEF.findall(source.read_text()):
+            mutants.append(f"{module}.{name}")
+    return mutants
+
+
+"""
+The tests to run against a mutant: those that call its function
+according to the stats, fastest first so a killing test is found sooner.
+"""
+def select_tests(mutant, tests_by_function, duration_by_test):
+
+    tests = tests_by_function.get(function_name(mutant), [])
+    return sorted(set(tests), key=lambda test: (duration_by_test.get(test, 0.0), test))
+
+
+def pytest_command(tests):
+
+    # run in the mutants directory; the project's addopts only choose which suite mutmut runs,
+    # the tests are given explicitly here
+    return [sys.executable, "-m", "pytest", "-x", "-q", "-p", "no:cacheprovider", "-o", "addopts=",
+            "--rootdir", ".", *tests]
+
+
+class _FirstFailure:
+
+    # pytest plugin remembering the first failing test or collector
+
+    def __init__(self):
+
+        self.nodeid = None
+
+    def pytest_runtest_logreport(self, report):
+
+        if report.failed and self.nodeid is None:
+            self.nodeid = report.nodeid
+
+    def pytest_collectreport(self, report):
+
+        if report.failed and self.nodeid is None:
+            self.nodeid = report.nodeid
+
+
+"""
+Process pool initializer: import pytest and collect `tests` once in the
+mutants directory, so the test modules, the mutated sources and their
+imports are already loaded in every child forked by _run_forked.
+"""
+def _warm_up(mutants_dir, tests):
+
+    os.chdir(mutants_dir)
+    os.environ["MUTANT_UNDER_TEST"] = ""
+    if not hasattr(os, "fork") or not tests:
+        return
+
+    import pytest
+    with open(os.devnull, "w") as devnull:
+        stdout, stderr = sys.stdout, sys.stderr
+        sys.stdout = sys.stderr = devnull
+        try:
+            pytest.main(["--collect-only", *pytest_command(tests)[4:]])
+        finally:
+            sys.stdout, sys.stderr = stdout, stderr
+
+
+def _run_forked(mutant, tests, timeout):
+
+    # (exit code, failing test) of the tests run in a forked child with the mutant active
+    import pytest
+
+    read_fd, write_fd = os.pipe()
+    pid = os.fork()
+    if pid == 0:
+        code = 2
+        try:
+            os.close(read_fd)
+            devnull = os.open(os.devnull, os.O_WRONLY)
+            os.dup2(devnull, 1)
+            os.dup2(devnull, 2)
+            os.environ["MUTANT_UNDER_TEST"] = mutant
+            failure = _FirstFailure()
+            code = int(pytest.main(pytest_command(tests)[3:], plugins=[failure]))
+            os.write(write_fd, (failure.nodeid or "").encode())
+        finally:
+            os._exit(code)
+
+    os.close(write_fd)
+    output = b""
+    deadline = time.monotonic() + timeout
+    try:
+        while True:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0 or not select.select([read_fd], [], [], remaining)[0]:
+                os.kill(pid, signal.SIGKILL)
+                os.waitpid(pid, 0)
+                return None, None
+            chunk = os.read(read_fd, 4096)
+            if not chunk:
+                break
+            output += chunk
+    finally:
+        os.close(read_fd)
+
+    _, status = os.waitpid(pid, 0)
+    return os.waitstatus_to_exitcode(status), output.decode() or None
+
+
+def _run_subprocess(mutant, tests, mutants_dir, timeout):
+
+    # same as _run_forked with a new pytest process
+    env = dict(os.environ, MUTANT_UNDER_TEST=mutant)
+    try:
+        process = subprocess.run(pytest_command(tests), cwd=mutants_dir, env=env, capture_output=True,
+                                 text=True, timeout=timeout)
+    except subprocess.TimeoutExpired:
+        return None, None
+
+    for line in process.stdout.splitlines():
+        if line.startswith(("FAILED ", "ERROR ")):
+            return process.returncode, line.split(" ")[1]
+    return process.returncode, None
+
+
+"""
+Run the selected tests against one mutant, in a child forked from this
+process when os.fork is available and the process was set up by
+_warm_up, in a new pytest process otherwise.
+
+The timeout is timeout_base seconds plus timeout_factor times the
+recorded duration of the tests. Returns a dict with mutant, exit_code,
+status, tests (how many were selected), killed_by (the first failing
+test, if known) and seconds.
+"""
+def run_mutant(mutant, tests, mutants_dir, duration=0.0, timeout_factor=10.0, timeout_base=30.0):
+
+    start = time.perf_counter()
+    result = {"mutant": mutant, "tests": len(tests), "killed_by": None}
+    timeout = timeout_base + timeout_factor * duration
+
+    if not tests:
+        exit_code = EXIT_NO_TESTS
+    else:
+        if hasattr(os, "fork") and "pytest" in sys.modules and Path.cwd() == Path(mutants_dir):
+            code, result["killed_by"] = _run_forked(mutant, tests, timeout)
+        else:
+            code, result["killed_by"] = _run_subprocess(mutant, tests, mutants_dir, timeout)
+
+        # pytest's exit code is kept as it is, STATUS_BY_EXIT_CODE says whether it kills the mutant
+        exit_code = EXIT_TIMEOUT if code is None else code
+
+    result["exit_code"] = exit_code
+    result["status"] = STATUS_BY_EXIT_CODE.get(exit_code, "error")
+    result["seconds"] = time.perf_counter() - start
+    return result
+
+
+"""
+Run every mutant in mutants_dir (or those matching one of the fnmatch
+patterns) with its selected tests, in a pool of `workers` processes
+(None = one per CPU). The workers are spawned, not forked, so modules
+the calling process already imported (the real Solver, for one) cannot
+shadow the mutated ones, and the pool is used even for one worker so
+the calling process is not changed by _warm_up.
+
+Returns the run_mutant results in the order of find_mutants. With
+write_meta=True the exit codes and durations are stored in the .meta
+files.
+"""
+def run_mutants(mutants_dir, patterns=None, workers=None, timeout_factor=10.0, timeout_base=30.0, write_meta=True):
+
+    mutants_dir = Path(mutants_dir).resolve()
+    tests_by_function, duration_by_test = load_stats(mutants_dir)
+
+    mutants = find_mutants(mutants_dir)
+    if patterns:
+        mutants = [m for m in mutants if any(fnmatch.fnmatchcase(m, pattern) for pattern in patterns)]
+
+    jobs = []
+    for mutant in mutants:
+        tests = select_tests(mutant, tests_by_function, duration_by_test)
+        duration = sum(duration_by_test.get(test, 0.0) for test in tests)
+        jobs.append((mutant, tests, str(mutants_dir), duration, timeout_factor, timeout_base))
+
+    results = []
+    if jobs:
+        all_tests = sorted({test for job in jobs for test in job[1]})
+        workers = workers or os.cpu_count() or 1
+        with ProcessPoolExecutor(max_workers=max(1, min(workers, len(jobs))),
+                                 mp_context=multiprocessing.get_context("spawn"),
+                                 initializer=_warm_up, initargs=(str(mutants_dir), all_tests)) as executor:
+            results = list(executor.map(run_mutant, *zip(*jobs)))
+
+    if write_meta:
+        write_results(mutants_dir, results)
+    return results
+
+
+def write_results(mutants_dir, results):
+
+    # exit_code_by_key and durations_by_key of each source's .meta file, other keys are kept
+    by_module = {}
+    for result in results:
+        module = function_name(result["mutant"]).rpartition(".")[0]
+        by_module.setdefault(module, []).append(result)
+
+    for module, module_results in by_module.items():
+        meta_path = Path(mutants_dir, *module.split(".")).with_suffix(".py.meta")
+        with open(meta_path, "r") as f:
+            meta = json.load(f)
+        for result in module_results:
+            meta.setdefault("exit_code_by_key", {})[result["mutant"]] = result["exit_code"]
+            meta.setdefault("durations_by_key", {})[result["mutant"]] = result["seconds"]
+        with open(meta_path, "w") as f:
+            json.dump(meta, f, indent=4)
+
+
+"""
+mutmut 2, which DateConverterValidation pins, has no mutants/ directory:
+`mutmut run` keeps the mutants in .mutmut-cache, an SQLite database of
+source lines and (line, index) mutation ids, and writes every mutant over
+the source file in turn. The mutants of `paths` are listed and registered
+in the cache of the current directory the way `mutmut run` does it, with
+mutmut's own functions, so the ids match `mutmut show`.
+"""
+def cached_mutants(paths):
+
+    try:
+        from mutmut import Context, list_mutations
+        from mutmut.cache import Line, Mutant, SourceFile, cached_mutation_status, db_session, hash_of_tests, \
+            update_line_numbers
+    except ImportError:
+        raise ValueError("--mutmut2 needs mutmut 2 (pip install mutmut==2.4.4)") from None
+
+    mutants = []
+    for path in paths:
+        update_line_numbers(path)
+        mutation_ids = list_mutations(Context(source=Path(path).read_text(), filename=path))
+        tests_hash = hash_of_tests(_tests_dirs())
+        for mutation_id in mutation_ids:
+            # registers the mutant, as mutmut run does before running it
+            cached_mutation_status(path, mutation_id, tests_hash)
+        with db_session:
+            source = SourceFile.get(filename=path)
+            for mutation_id in mutation_ids:
+                line = Line.get(sourcefile=source, line=mutation_id.line, line_number=mutation_id.line_number)
+                pk = Mutant.get(line=line, index=mutation_id.index).id
+                mutants.append(CachedMutant(pk, path, mutation_id.line, mutation_id.line_number, mutation_id.index))
+    return mutants
+
+
+def _tests_dirs():
+
+    # mutmut 2's default tests_dir, tests/:test/
+    return [name for name in ("tests/", "test/") if os.path.isdir(name)]
+
+
+def _copy_project(project_dir):
+
+    # process pool initializer: every worker writes its mutants into its own copy of the project
+    copy = Path(tempfile.mkdtemp(prefix="mutmut2-")) / "project"
+    shutil.copytree(project_dir, copy, ignore=shutil.ignore_patterns(
+        ".mutmut-cache", "mutants", "html", ".git", "__pycache__", "*.bak"))
+    os.chdir(copy)
+
+
+"""
+Write one mutmut 2 mutant over its source file in the current directory
+(a copy made by _copy_project), run the whole test suite on it in a new
+pytest process (mutmut 2 records no tests per function) and put the
+source back. Returns the run_mutant result dict, tests being None.
+"""
+def run_cached_mutant(mutant, timeout):
+
+    from mutmut import Context, RelativeMutationID, mutate
+
+    start = time.perf_counter()
+    result = {"mutant": str(mutant.pk), "tests": None}
+    path = Path(mutant.filename)
+    original = path.read_text()
+    mutation_id = RelativeMutationID(mutant.line, mutant.index, mutant.line_number)
+    mutated, _ = mutate(Context(source=original, mutation_id=mutation_id, filename=mutant.filename))
+    try:
+        path.write_text(mutated)
+        code, result["killed_by"] = _run_subprocess(str(mutant.pk), [], ".", timeout)
+    finally:
+        path.write_text(original)
+
+    result["exit_code"] = EXIT_TIMEOUT if code is None else code
+    result["status"] = STATUS_BY_EXIT_CODE.get(result["exit_code"], "error")
+    result["seconds"] = time.perf_counter() - start
+    return result
+
+
+"""
+Run the mutmut 2 mutants of `paths`, from .mutmut-cache in the current
+directory, in a pool of `workers` processes with a copy of the project
+each. The unmutated test suite is run once first, to check that it
+passes and to time it; a mutant's timeout is timeout_base plus
+timeout_factor times that. patterns select mutants by their cache id.
+
+Returns the results in cache id order. With write_cache=True the
+statuses are stored in the cache as mutmut 2 stores them.
+"""
+def run_cached_mutants(paths, patterns=None, workers=None, timeout_factor=10.0, timeout_base=30.0,
+                       write_cache=True):
+
+    mutants = sorted(cached_mutants(paths))
+    if patterns:
+        mutants = [m for m in mutants if any(fnmatch.fnmatchcase(str(m.pk), pattern) for pattern in patterns)]
+
+    start = time.perf_counter()
+    baseline = subprocess.run(pytest_command([]), capture_output=True, text=True)
+    if baseline.returncode != 0:
+        raise ValueError(f"The tests fail on the unmutated sources (pytest exit code {baseline.returncode})")
+    timeout = timeout_base + timeout_factor * (time.perf_counter() - start)
+
+    results = []
+    if mutants:
+        workers = workers or os.cpu_count() or 1
+        with ProcessPoolExecutor(max_workers=max(1, min(workers, len(mutants))),
+                                 mp_context=multiprocessing.get_context("spawn"),
+                                 initializer=_copy_project, initargs=(os.getcwd(),)) as executor:
+            results = list(executor.map(run_cached_mutant, mutants, [timeout] * len(mutants)))
+
+    if write_cache:
+        from mutmut import RelativeMutationID
+        from mutmut.cache import hash_of_tests, update_mutant_status
+
+        tests_hash = hash_of_tests(_tests_dirs())
+        for mutant, result in zip(mutants, results):
+            if result["status"] in MUTMUT2_STATUS:
+                mutation_id = RelativeMutationID(mutant.line, mutant.index, mutant.line_number)
+                update_mutant_status(mutant.filename, mutation_id, MUTMUT2_STATUS[result["status"]], tests_hash)
+    return results
+
+
+def main(argv=None):
+
+    parser = argparse.ArgumentParser(description="Run mutmut mutants in parallel against the tests that cover them")
+    parser.add_argument("mutants", nargs="*", help="fnmatch patterns of mutants to run (default: all)")
+    parser.add_argument("--mutants-dir", default="mutants", help="Directory written by mutmut run (default: mutants)")
+    parser.add_argument("--workers", type=int, default=None, help="Process pool size (default: one per CPU)")
+    parser.add_argument("--timeout-factor", type=float, default=10.0,
+                        help="Timeout as a multiple of the recorded test durations (default: 10)")
+    parser.add_argument("--timeout-base", type=float, default=30.0, help="Seconds added to every timeout (default: 30)")
+    parser.add_argument("--no-write", action="store_true",
+                        help="Do not store the results in the .meta files (or .mutmut-cache)")
+    parser.add_argument("--mutmut2", action="append", dest="paths_to_mutate", metavar="PATH",
+                        help="Run the mutmut 2 mutants of this source file from .mutmut-cache in the current "
+                             "directory instead of a mutants/ directory, may be repeated; patterns are cache ids")
+    args = parser.parse_args(argv)
+
+    start = time.perf_counter()
+    try:
+        if args.paths_to_mutate:
+            results = run_cached_mutants(args.paths_to_mutate, args.mutants, args.workers, args.timeout_factor,
+                                         args.timeout_base, write_cache=not args.no_write)
+        else:
+            results = run_mutants(args.mutants_dir, args.mutants, args.workers, args.timeout_factor,
+                                  args.timeout_base, write_meta=not args.no_write)
+    except (OSError, ValueError) as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
+    total = time.perf_counter() - start
+
+    for result in results:
+        if result["status"] != "killed":
+            print(f"    {result['mutant']}: {result['status']} (exit code {result['exit_code']})")
+
+    counts = {status: 0 for status in REPORTED_STATUSES}
+    for result in results:
+        counts[result["status"]] = counts.get(result["status"], 0) + 1
+    print(f"{len(results)} mutants in {total:.1f}s: " + ", ".join(f"{count} {status}" for status, count in counts.items()))
+
+    errors = sum(counts.get(status, 0) for status in ERROR_STATUSES)
+    if errors:
+        print(f"Error: the tests of {errors} mutants did not run to a verdict, check the test configuration",
+              file=sys.stderr)
+        return 1
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -57,6 +57,99 @@ def solve_quadratic(row):
         x1 = (-b + sqrt_d) / (2 * a)
         x2 = (-b - sqrt_d) / (2 * a)
         return "quadratic_two_complex", [x1, x2]
-	
 
 
+
+
+# Shared "no root" results so solve_quadratic_stable allocates nothing for these cases
+NA_ROOTS = ("N/A", "N/A")
+INCORRECT_TYPE = ("incorrect_type", NA_ROOTS)
+INFINITE_SOLUTIONS = ("infinite_solutions", NA_ROOTS)
+NO_SOLUTION = ("no_solution", NA_ROOTS)
+OVERFLOW = ("overflow", NA_ROOTS)
+
+
+def _ldexp(x, exponent):
+
+    # math.ldexp, giving +/-inf where it overflows as float arithmetic would
+    try:
+        return math.ldexp(x, exponent)
+    except OverflowError:
+        return math.copysign(math.inf, x)
+
+
+"""
+Numerically stable variant of solve_quadratic.
+
+Same cases and root order as solve_quadratic, but:
+    - the roots are computed for the substitution x = 2**t * y, with t
+      chosen so that the y**2 and constant coefficients have about the
+      same exponent, and all three coefficients scaled by one more power
+      of two so that the largest is below 1. Powers of two are exact, so
+      no coefficient underflows and b*b - 4*a*c cannot leave the float64
+      range: only inf/NaN coefficients report 'overflow'
+    - where 4*a*c is negligible next to b*b (or c == 0), the roots are
+      -b/a and -c/b, which holds even when a or c is too small to scale
+    - real roots use q = -(b + copysign(sqrt(disc), b)) / 2, x = q/a and
+      x = c/q, which avoids the cancellation in -b + sqrt(disc) that turns
+      small roots into 0.0 / -0.0
+    - roots are returned as a tuple, and the N/A results are shared constants
+
+Returns (case, (root1, root2)) with the same "N/A" convention.
+"""
+def solve_quadratic_stable(row):
+
+    try:
+        a = float(row[0])
+        b = float(row[1])
+        c = float(row[2])
+    except (ValueError, TypeError):
+        return INCORRECT_TYPE
+
+    if a == 0.0:
+        if b == 0.0:
+            if c == 0.0:
+                return INFINITE_SOLUTIONS
+            return NO_SOLUTION
+        return "linear", (-c / b, "N/A")
+
+    if math.isinf(a) or math.isinf(b) or math.isinf(c) or math.isnan(a) or math.isnan(b) or math.isnan(c):
+        return OVERFLOW
+
+    # -b / (2a), without 2a overflowing
+    vertex = -b / (2.0 * a) if abs(a) < 1.0 else -(0.5 * b) / a
+
+    if b == 0.0 and c == 0.0:
+        return "quadratic_one_real", (vertex, "N/A")
+
+    ea = math.frexp(a)[1]
+    eb = math.frexp(b)[1]
+    ec = math.frexp(c)[1]
+
+    # |4ac| / b^2 below 2**-106: disc rounds to b*b, q to -b
+    if b != 0.0 and (c == 0.0 or 2 * eb > ea + ec + 110):
+        if b < 0:
+            return "quadratic_two_real", (-b / a, -c / b)
+        return "quadratic_two_real", (-c / b, -b / a)
+
+    # x = 2**t * y balances a and c; b is then at most 2**56 times larger than them, so none underflows
+    t = (ec - ea) // 2
+    scale = -max(ea + 2 * t, eb + t if b != 0.0 else ec, ec)
+    a = math.ldexp(a, 2 * t + scale)
+    b = math.ldexp(b, t + scale)
+    c = math.ldexp(c, scale)
+
+    disc = b * b - 4.0 * a * c
+
+    if disc > 0:
+        sqrt_d = math.copysign(math.sqrt(disc), b)
+        q = -0.5 * (b + sqrt_d)
+        # keep solve_quadratic's order: root1 uses +sqrt(disc), root2 -sqrt(disc)
+        if sqrt_d < 0:
+            return "quadratic_two_real", (_ldexp(q / a, t), _ldexp(c / q, t))
+        return "quadratic_two_real", (_ldexp(c / q, t), _ldexp(q / a, t))
+    elif disc == 0:
+        return "quadratic_one_real", (vertex, "N/A")
+    else:
+        imag = _ldexp(math.sqrt(-disc) / (2.0 * a), t)
+        return "quadratic_two_complex", (complex(vertex, imag), complex(vertex, -imag))
@@ -0,0 +1,281 @@
+import argparse
+import csv
+import sys
+
+import numpy as np
+
+
+# Case names in the order used for the integer case codes of solve_quadratic_batch
+CASE_NAMES = (
+    "quadratic_two_real",
+    "quadratic_one_real",
+    "quadratic_two_complex",
+    "linear",
+    "no_solution",
+    "infinite_solutions",
+    "incorrect_type",
+    "overflow",
+)
+CASE_CODES = {name: code for code, name in enumerate(CASE_NAMES)}
+
+# Number of roots that are not "N/A" for each case code
+ROOT_COUNTS = (2, 1, 2, 1, 0, 0, 0, 0)
+
+# Smallest positive normal float; cmath.sqrt scales discriminants below it up by 2**53
+DBL_MIN = sys.float_info.min
+
+# Python 3.14 divides complex by float component-wise, older versions
+# promote the float to complex and use Smith's algorithm, which can flip
+# the sign of zero parts; the batch solver reproduces whichever applies
+COMPONENTWISE_COMPLEX_DIVISION = sys.version_info >= (3, 14)
+
+
+def to_float_array(values):
+
+    # numeric arrays convert directly, anything else element by element like float(row[i])
+    values = np.asarray(values)
+    if values.dtype.kind in "biuf":
+        return values.astype(np.float64), np.zeros(values.shape, dtype=bool)
+    if values.dtype.kind in "SU":
+        try:
+            return values.astype(np.float64), np.zeros(values.shape, dtype=bool)
+        except ValueError:
+            pass
+
+    flat = values.reshape(-1)
+    result = np.empty(flat.shape, dtype=np.float64)
+    bad = np.zeros(flat.shape, dtype=bool)
+    for i, value in enumerate(flat):
+        try:
+            result[i] = float(value)
+        except (ValueError, TypeError):
+            result[i] = np.nan
+            bad[i] = True
+    return result.reshape(values.shape), bad.reshape(values.shape)
+
+
+"""
+Vectorised solve_quadratic over arrays of coefficients.
+
+a, b and c are broadcast together. Returns (cases, root1, root2) where
+cases is a uint8 array of indexes into CASE_NAMES and root1/root2 hold the
+roots, complex128 if any equation is quadratic_two_complex and float64
+otherwise. Roots that solve_quadratic reports as "N/A" are NaN; which
+roots exist is given by ROOT_COUNTS[case]. Each row is classified with
+the same checks, in the same order, as solve_quadratic, and roots are
+computed with the same floating point operations, down to the scaling
+cmath.sqrt applies to tiny discriminants, so they match bit for bit.
+"""
+def solve_quadratic_batch(a, b, c):
+
+    a, a_bad = to_float_array(a)
+    b, b_bad = to_float_array(b)
+    c, c_bad = to_float_array(c)
+    a, b, c, a_bad, b_bad, c_bad = np.broadcast_arrays(a, b, c, a_bad, b_bad, c_bad)
+
+    cases = np.empty(a.shape, dtype=np.uint8)
+    root1 = np.full(a.shape, np.nan)
+    root2 = np.full(a.shape, np.nan)
+
+    with np.errstate(all="ignore"):
+        incorrect = a_bad | b_bad | c_bad
+        remaining = ~incorrect
+        cases[incorrect] = CASE_CODES["incorrect_type"]
+
+        a_zero = remaining & (a == 0.0)
+        b_zero = a_zero & (b == 0.0)
+        cases[b_zero & (c == 0.0)] = CASE_CODES["infinite_solutions"]
+        cases[b_zero & (c != 0.0)] = CASE_CODES["no_solution"]
+
+        linear = a_zero & ~b_zero
+        cases[linear] = CASE_CODES["linear"]
+        root1[linear] = -c[linear] / b[linear]
+
+        remaining &= ~a_zero
+        disc = b * b - 4 * a * c
+        overflow = remaining & ~np.isfinite(disc)
+        cases[overflow] = CASE_CODES["overflow"]
+        remaining &= ~overflow
+
+        two_real = remaining & (disc > 0)
+        cases[two_real] = CASE_CODES["quadratic_two_real"]
+        sqrt_d = np.sqrt(disc[two_real])
+        root1[two_real] = (-b[two_real] + sqrt_d) / (2 * a[two_real])
+        root2[two_real] = (-b[two_real] - sqrt_d) / (2 * a[two_real])
+
+        one_real = remaining & (disc == 0)
+        cases[one_real] = CASE_CODES["quadratic_one_real"]
+        root1[one_real] = -b[one_real] / (2 * a[one_real])
+
+        two_complex = remaining & (disc < 0)
+        cases[two_complex] = CASE_CODES["quadratic_two_complex"]
+        if not two_complex.any():
+            return cases, root1, root2
+
+        root1 = root1.astype(np.complex128)
+        root2 = root2.astype(np.complex128)
+
+        # (-b +/- sqrt_d) / (2 * a) with sqrt_d = cmath.sqrt(disc) = 0.0 + s*j; s is taken
+        # the way cmath takes it, as 2 * sqrt(|disc| / 8 * 2), or for a subnormal disc as
+        # sqrt(|disc| * 2**53 * 2) * 2**-27, since |disc| / 8 drops bits below 8 * DBL_MIN
+        magnitude = -disc[two_complex]
+        eighth = magnitude / 8
+        s = 2 * np.sqrt(eighth + eighth)
+        subnormal = magnitude < DBL_MIN
+        s[subnormal] = np.ldexp(np.sqrt(2 * np.ldexp(magnitude[subnormal], 53)), -27)
+        minus_b = -b[two_complex]
+        denom = 2 * a[two_complex]
+        for roots, real, imag in ((root1, minus_b + 0.0, s), (root2, minus_b - 0.0, 0.0 - s)):
+            if COMPONENTWISE_COMPLEX_DIVISION:
+                roots.real[two_complex] = real / denom
+                roots.imag[two_complex] = imag / denom
+            else:
+                ratio = 0.0 / denom
+                roots.real[two_complex] = (real + imag * ratio) / denom
+                roots.imag[two_complex] = (imag - real * ratio) / denom
+
+    return cases, root1, root2
+
+
+# Rows solved per solve_quadratic_batch call by the command line interface
+DEFAULT_CHUNK_ROWS = 65536
+
+# Record layout of --output-format binary
+BINARY_RESULT_DTYPE = np.dtype([("case", np.uint8), ("root1", np.complex128), ("root2", np.complex128)])
+
+
+def read_csv_chunks(input_file, chunk_rows):
+
+    # yields lists of [a, b, c] strings, short rows padded so they come out as incorrect_type
+    chunk = []
+    for row in csv.reader(input_file):
+        if not row:
+            continue
+        chunk.append((row + [None, None, None])[:3])
+        if len(chunk) == chunk_rows:
+            yield chunk
+            chunk = []
+    if chunk:
+        yield chunk
+
+
+def read_binary_chunks(input_file, chunk_rows):
+
+    # raw little-endian float64 (a, b, c) triples, yields (n, 3) arrays
+    while True:
+        data = input_file.read(chunk_rows * 3 * 8)
+        if not data:
+            break
+        if len(data) % 24:
+            raise ValueError("Binary input is not a whole number of (a, b, c) float64 triples")
+        yield np.frombuffer(data, dtype="<f8").reshape(-1, 3)
+
+
+def format_root(value, code, k):
+
+    # same text the generators write: str() of a float or complex, "N/A" when missing
+    if k >= ROOT_COUNTS[code]:
+        return "N/A"
+    if code == CASE_CODES["quadratic_two_complex"]:
+        return complex(value)
+    return complex(value).real
+
+
+def write_csv_results(writer, coefficients, cases, root1, root2):
+
+    rows = []
+    for coefficient, code, x1, x2 in zip(coefficients, cases.tolist(), root1.tolist(), root2.tolist()):
+        rows.append([coefficient[0], coefficient[1], coefficient[2], CASE_NAMES[code],
+                     format_root(x1, code, 0), format_root(x2, code, 1)])
+    writer.writerows(rows)
+
+
+"""
+Solve every (a, b, c) row of input_path with solve_quadratic_batch,
+chunk_rows at a time, writing results as they are computed so memory
+stays bounded by the chunk size.
+
+csv input reads the first three columns of each row (so the TestSets
+files work as input), binary input is raw float64 triples. csv output
+has the TestSets layout a,b,c,case,root1,root2; binary output is
+BINARY_RESULT_DTYPE records. '-' means stdin / stdout.
+
+Returns a dict of row counts per case.
+"""
+def solve_file(input_path, output_path, input_format="csv", output_format="csv", chunk_rows=DEFAULT_CHUNK_ROWS):
+
+    counts = dict.fromkeys(CASE_NAMES, 0)
+    binary_in = input_format == "binary"
+    binary_out = output_format == "binary"
+
+    if input_path == "-":
+        input_file = sys.stdin.buffer if binary_in else sys.stdin
+    else:
+        input_file = open(input_path, "rb") if binary_in else open(input_path, "r", newline="")
+    if output_path == "-":
+        output_file = sys.stdout.buffer if binary_out else sys.stdout
+    else:
+        output_file = open(output_path, "wb") if binary_out else open(output_path, "w", newline="")
+
+    try:
+        writer = None if binary_out else csv.writer(output_file, delimiter=",")
+        chunks = read_binary_chunks(input_file, chunk_rows) if binary_in else read_csv_chunks(input_file, chunk_rows)
+
+        for chunk in chunks:
+            if binary_in:
+                a, b, c = chunk[:, 0], chunk[:, 1], chunk[:, 2]
+                coefficients = chunk.tolist()
+            else:
+                # string arrays parse in one call, object arrays keep missing columns as None
+                a, b, c = (np.array(column, dtype=object if None in column else str) for column in zip(*chunk))
+                coefficients = chunk
+
+            cases, root1, root2 = solve_quadratic_batch(a, b, c)
+            for code, count in zip(*np.unique(cases, return_counts=True)):
+                counts[CASE_NAMES[code]] += int(count)
+
+            if binary_out:
+                records = np.empty(cases.shape, dtype=BINARY_RESULT_DTYPE)
+                records["case"] = cases
+                records["root1"] = root1
+                records["root2"] = root2
+                output_file.write(records.tobytes())
+            else:
+                write_csv_results(writer, coefficients, cases, root1, root2)
+    finally:
+        if input_path != "-":
+            input_file.close()
+        if output_path != "-":
+            output_file.close()
+
+    return counts
+
+
+def main(argv=None):
+
+    parser = argparse.ArgumentParser(prog="python -m Solver_Batch", description="Solve a*x^2 + b*x + c = 0 for every row of a file")
+    parser.add_argument("input", help="Input file of a,b,c rows, '-' for stdin")
+    parser.add_argument("output", help="Output file, '-' for stdout")
+    parser.add_argument("--input-format", choices=["csv", "binary"], default="csv",
+                        help="csv rows (first three columns) or raw float64 triples (default: csv)")
+    parser.add_argument("--output-format", choices=["csv", "binary"], default="csv",
+                        help="csv in the TestSets layout or binary records (default: csv)")
+    parser.add_argument("--chunk-rows", type=int, default=DEFAULT_CHUNK_ROWS,
+                        help=f"Rows solved per chunk (default: {DEFAULT_CHUNK_ROWS})")
+    args = parser.parse_args(argv)
+
+    try:
+        counts = solve_file(args.input, args.output, args.input_format, args.output_format, args.chunk_rows)
+    except (OSError, ValueError) as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
+
+    print(f"Solved {sum(counts.values())} rows", file=sys.stderr)
+    for name, count in counts.items():
+        if count:
+            print(f"  {name}: {count}", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,282 @@
+import csv
+import os
+
+import numpy as np
+
+from collections import namedtuple
+from pathlib import Path
+
+from Solver_Batch import CASE_CODES, CASE_NAMES, ROOT_COUNTS
+# the binary format and how generators write it, kept apart so their fingerprints need not cover this module
+from TestSetWriter import TEST_SET_DTYPE, binary_path, results_to_array, write_binary_test_set
+
+
+# where test sets are looked up by name: TestSets/ next to this file, or
+# next to its parent directory for the copy mutmut makes in mutants/
+TEST_SET_DIRS = [
+    Path(__file__).resolve().parent / "TestSets",
+    Path(__file__).resolve().parents[1] / "TestSets",
+]
+
+"""
+One row of a CSV test set.
+
+a, b, c, case, root1 and root2 are the text of the six columns, so a
+ParsedRow still works where a csv row was used (row[0] is a). The
+parsed values are in coefficients, the floats of a, b and c (None where
+the text is not a number, as in incorrect_type rows), and roots, the two
+roots as parse_root returns them.
+"""
+ParsedRow = namedtuple("ParsedRow", ["a", "b", "c", "case", "root1", "root2", "coefficients", "roots"])
+
+# (resolved path, mtime, size) -> tuple of ParsedRow, shared by everything in the process
+_test_set_cache = {}
+
+
+"""
+Load a binary test set. With mmap=True (the default) the records are a
+read-only np.memmap over the file, so nothing is read until it is used.
+"""
+def load_binary_test_set(path, mmap=True):
+
+    records = np.load(path, mmap_mode="r" if mmap else None, allow_pickle=False)
+    if records.dtype != TEST_SET_DTYPE:
+        raise ValueError(f"{path} is not a binary test set (dtype {records.dtype})")
+    return records
+
+
+def record_to_result(record):
+
+    # back to the (case, [root1, root2]) form solve_quadratic returns
+    case = CASE_NAMES[int(record["case"])]
+    roots = []
+    for k, name in enumerate(("root1", "root2")):
+        if record["na"][k]:
+            roots.append("N/A")
+        elif case == "quadratic_two_complex":
+            roots.append(complex(record[name]))
+        else:
+            roots.append(float(record[name].real))
+    return case, roots
+
+
+def parse_root(root_str):
+
+    # "N/A", "1.5" or "(-0.5-0.8660254037844386j)" as written by the generators
+    if root_str == "N/A":
+        return "N/A"
+    try:
+        return float(root_str)
+    except ValueError:
+        return complex(root_str)
+
+
+"""
+Convert an existing CSV test set to the binary format. The coefficients
+and roots are only as precise as their text in the CSV, so test sets
+should be regenerated with their generator where possible.
+"""
+def csv_to_binary(csv_path, npy_path=None):
+
+    with open(csv_path, "r") as f:
+        results = [row[:4] + [parse_root(row[4]), parse_root(row[5])]
+                   for row in csv.reader(f, delimiter=",") if len(row) == 6]
+
+    npy_path = binary_path(csv_path) if npy_path is None else npy_path
+    write_binary_test_set(npy_path, results)
+    return npy_path
+
+
+def find_test_set(name):
+
+    # name (e.g. "AllCombinations.csv") in the first of TEST_SET_DIRS that has it, or a path
+    if os.path.sep in str(name) or Path(name).is_absolute():
+        return Path(name)
+    for directory in TEST_SET_DIRS:
+        path = directory / name
+        if path.exists():
+            return path
+    raise FileNotFoundError(f"Could not find {name} in any of: {[str(d) for d in TEST_SET_DIRS]}")
+
+
+def _parse_coefficient(text):
+
+    try:
+        return float(text)
+    except ValueError:
+        return None
+
+
+def parse_test_set(path):
+
+    with open(path, "r") as f:
+        return tuple(
+            ParsedRow(*row[:6], tuple(_parse_coefficient(text) for text in row[:3]),
+                     (parse_root(row[4]), parse_root(row[5])))
+            for row in csv.reader(f, delimiter=",") if len(row) >= 6
+        )
+
+
+"""
+The rows of a CSV test set as a tuple of ParsedRow, given its name in
+TestSets/ or a path.
+
+Parsed rows are cached for the whole process, keyed by the resolved path
+and the file's modification time and size, so every test module (and a
+mutation run's repeated collections) reads and parses a test set once,
+and an edited or regenerated file is read again.
+"""
+def load_test_set(name):
+
+    path = find_test_set(name).resolve()
+    stat = path.stat()
+    key = (path, stat.st_mtime_ns, stat.st_size)
+    rows = _test_set_cache.get(key)
+    if rows is None:
+        for stale in [k for k in _test_set_cache if k[0] == path]:
+            _expected_cache.pop(id(_test_set_cache.pop(stale)), None)
+        rows = _test_set_cache[key] = parse_test_set(path)
+    return rows
+
+
+def clear_test_set_cache():
+
+    _test_set_cache.clear()
+    _expected_cache.clear()
+
+
+"""
+Cases and roots of a test set or of solve_quadratic results as arrays:
+    - cases   uint8 codes of Solver_Batch.CASE_CODES, 255 for unknown names
+    - roots   complex128 of shape (n, 2), NaN where "N/A", -0.0 made 0.0
+    - na      bool of shape (n, 2), True where the root is "N/A"
+"""
+RootArrays = namedtuple("RootArrays", ["cases", "roots", "na"])
+
+# significant digits the roots of each test set are compared to, 6 for the others
+COMPARED_DIGITS = {"MetamorphicTestSet.csv": 5}
+
+# codes of the cases whose single root solve_quadratic returns as a float
+FLOAT_ROOT_CODES = [CASE_CODES["linear"], CASE_CODES["quadratic_one_real"]]
+
+# expected RootArrays of the rows tuples load_test_set returned, by id (the rows are kept so the id stays theirs)
+_expected_cache = {}
+
+
+def root_arrays(cases, root_pairs):
+
+    # RootArrays from case names and pairs of roots as solve_quadratic returns them
+    na = np.array([[root == "N/A" for root in pair] for pair in root_pairs], dtype=bool).reshape(-1, 2)
+    roots = np.array([[np.nan if root == "N/A" else complex(root) for root in pair] for pair in root_pairs],
+                     dtype=np.complex128).reshape(-1, 2)
+    # adding 0.0 turns -0.0 into 0.0 and leaves everything else as it is
+    roots += 0.0
+    codes = np.array([CASE_CODES.get(case, 255) for case in cases], dtype=np.uint8)
+    return RootArrays(codes, roots, na)
+
+
+def result_arrays(results):
+
+    # RootArrays of a list of solve_quadratic (case, roots) results
+    return root_arrays([case for case, _ in results], [roots for _, roots in results])
+
+
+def batch_arrays(cases, root1, root2):
+
+    # RootArrays of solve_quadratic_batch results
+    counts = np.asarray(ROOT_COUNTS)[cases]
+    na = np.stack([counts < 1, counts < 2], axis=1)
+    roots = np.stack([root1, root2], axis=1).astype(np.complex128) + 0.0
+    roots[na] = np.nan
+    return RootArrays(np.asarray(cases, dtype=np.uint8), roots, na)
+
+
+"""
+RootArrays of the expected cases and roots of ParsedRow rows. They are
+built once for every tuple of rows load_test_set returned, so a test set
+is compared against as arrays without going through its text again.
+"""
+def expected_arrays(rows):
+
+    cached = _expected_cache.get(id(rows))
+    if cached is not None and cached[0] is rows:
+        return cached[1]
+
+    arrays = root_arrays([row.case for row in rows], [row.roots for row in rows])
+    if isinstance(rows, tuple) and any(rows is cached_rows for cached_rows in _test_set_cache.values()):
+        _expected_cache[id(rows)] = (rows, arrays)
+    return arrays
+
+
+def _close(x, y, rtol, ulps, atol):
+
+    # elementwise |x - y| within rtol of the larger magnitude, ulps units in the last place of it, or atol;
+    # NaN roots (of NaN coefficients) are equal to each other
+    scale = np.maximum(np.abs(x), np.abs(y))
+    with np.errstate(invalid="ignore"):
+        tolerance = np.maximum(np.maximum(rtol * scale, ulps * np.spacing(scale)), atol)
+        return (x == y) | (np.abs(x - y) <= tolerance) | (np.isnan(x) & np.isnan(y))
+
+
+"""
+Indexes of the rows where the actual RootArrays differ from the expected
+ones, as an array.
+
+The case must be equal, and so must the "N/A" masks. Real and imaginary
+parts of the other roots are equal within a relative tolerance rtol of
+the larger one, within ulps units in the last place of it, or within
+atol (a number, or one per row). Two roots may come in either order; a
+single root must be where it is expected, next to its N/A.
+"""
+def compare_roots(actual, expected, rtol=1e-5, ulps=0, atol=0.0):
+
+    atol = np.reshape(atol, (-1, 1)) if np.ndim(atol) == 1 else atol
+
+    def same(roots, na):
+
+        close = _close(roots.real, expected.roots.real, rtol, ulps, atol) \
+            & _close(roots.imag, expected.roots.imag, rtol, ulps, atol)
+        return ((na == expected.na) & (na | close)).all(axis=1)
+
+    matches = same(actual.roots, actual.na) \
+        | (~actual.na.any(axis=1) & same(actual.roots[:, ::-1], actual.na[:, ::-1]))
+    return np.flatnonzero((actual.cases != expected.cases) | ~matches)
+
+
+"""
+Rows whose (case, roots) results differ from the expected ParsedRow
+rows, as an array of indexes into rows. Roots are compared with
+compare_roots at a relative tolerance of 10 ** (1 - digits), about what
+comparing them as "{:.{digits}g}" strings allows.
+"""
+def mismatched_rows(rows, results, digits=6, ulps=0):
+
+    return compare_results(results, expected_arrays(rows), 10.0 ** (1 - digits), ulps)
+
+
+"""
+compare_roots of a list of solve_quadratic (case, roots) results against
+expected RootArrays. Where a linear or one-real root is expected, the
+root given must also be a float instance, not a complex of the same
+value.
+"""
+def compare_results(results, expected, rtol=1e-5, ulps=0):
+
+    indexes = compare_roots(result_arrays(results), expected, rtol, ulps)
+    single = np.flatnonzero(np.isin(expected.cases, FLOAT_ROOT_CODES))
+    not_float = [i for i in single.tolist() if not isinstance(results[i][1][0], float)]
+    return np.union1d(indexes, np.array(not_float, dtype=np.intp))
+
+
+def mismatch_report(rows, results, indexes, first_row=0, limit=50):
+
+    # failure message listing the mismatching rows, first_row being the number of rows[0] in its test set
+    lines = [f"{len(indexes)} of {len(rows)} rows do not match:"]
+    for i in indexes[:limit]:
+        row = rows[i]
+        case, roots = results[i]
+        lines.append(f"  row {first_row + i} ({row.a}, {row.b}, {row.c}): expected {row.case} {list(row.roots)}, "
+                     f"got {case} {roots}")
+    if len(indexes) > limit:
+        lines.append(f"  ... and {len(indexes) - limit} more")
+    return "\n".join(lines)
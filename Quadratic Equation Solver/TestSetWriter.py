@@ -0,0 +1,96 @@
+import itertools
+import os
+import shutil
+
+import numpy as np
+
+from pathlib import Path
+
+from Solver_Batch import CASE_CODES, DEFAULT_CHUNK_ROWS, to_float_array
+
+
+"""
+Binary test set format.
+
+A test set is saved with np.save as a structured array with one record
+per test case:
+    - a, b, c   float64 coefficients, exactly as passed to solve_quadratic
+    - case      uint8 index into Solver_Batch.CASE_NAMES
+    - root1     complex128, real roots have a zero imaginary part
+    - root2     complex128
+    - na        two booleans, True where the root is "N/A"
+
+The file sits next to the CSV with the same name and a .npy suffix and
+is loaded with np.load(..., mmap_mode='r'), so opening it costs nothing
+however many rows it has and no float goes through a string.
+"""
+TEST_SET_DTYPE = np.dtype([
+    ("a", "<f8"), ("b", "<f8"), ("c", "<f8"),
+    ("case", "u1"),
+    ("root1", "<c16"), ("root2", "<c16"),
+    ("na", "?", (2,)),
+])
+
+
+def binary_path(csv_path):
+
+    # TestSets/AllCombinations.csv -> TestSets/AllCombinations.npy
+    return Path(csv_path).with_suffix(".npy")
+
+
+"""
+Build a TEST_SET_DTYPE array from generator results, rows of
+[a, b, c, case, root1, root2] where the roots are floats, complex
+numbers or "N/A" as returned by solve_quadratic.
+"""
+def results_to_array(results):
+
+    records = np.zeros(len(results), dtype=TEST_SET_DTYPE)
+    if not len(results):
+        return records
+
+    for i, name in enumerate(("a", "b", "c")):
+        records[name] = to_float_array(np.array([row[i] for row in results], dtype=object))[0]
+    records["case"] = [CASE_CODES[row[3]] for row in results]
+
+    for k, name in enumerate(("root1", "root2")):
+        roots = [row[4 + k] for row in results]
+        missing = np.array([root == "N/A" for root in roots], dtype=bool)
+        records[name] = [np.nan if root == "N/A" else complex(root) for root in roots]
+        records["na"][:, k] = missing
+
+    return records
+
+
+"""
+Write generator results (any iterable of rows, see results_to_array) as
+a binary test set, chunk_rows records at a time, so they are never all
+in memory. The .npy header holds the row count, so the records go to a
+temporary file next to path first and are copied behind the header once
+they are counted; the file is the same as np.save would write.
+
+Returns the number of rows written.
+"""
+def write_binary_test_set(path, results, chunk_rows=DEFAULT_CHUNK_ROWS):
+
+    path = Path(path)
+    records_path = path.with_name(path.name + ".records")
+    rows = 0
+    try:
+        with open(records_path, "wb") as records:
+            results = iter(results)
+            while True:
+                chunk = list(itertools.islice(results, chunk_rows))
+                if not chunk:
+                    break
+                records.write(results_to_array(chunk).tobytes())
+                rows += len(chunk)
+
+        header = {"descr": np.lib.format.dtype_to_descr(TEST_SET_DTYPE), "fortran_order": False, "shape": (rows,)}
+        with open(path, "wb") as f, open(records_path, "rb") as records:
+            np.lib.format.write_array_header_1_0(f, header)
+            shutil.copyfileobj(records, f)
+    finally:
+        if records_path.exists():
+            os.remove(records_path)
+    return rows
@@ -0,0 +1,54 @@
+import sys
+import pathlib
+import pytest
+
+sys.path.insert(0, str(pathlib.Path(__file__).resolve().parents[1]))
+
+from TestSetIO import load_test_set
+
+
+# per-row test modules and the test set each one checks, replaced by tests/extra/test_batched.py in batch mode
+PER_ROW_MODULES = {
+    "test_allcombination.py": "AllCombinations.csv",
+    "test_base.py": "CategoryBaseTestSet.csv",
+    "test_metamorphic.py": "MetamorphicTestSet.csv",
+    "test_pairwise.py": "PairWiseTestSet.csv",
+}
+
+
+def pytest_addoption(parser):
+
+    group = parser.getgroup("test sets")
+    group.addoption("--batch", action="store_true",
+                    help="check every test set in tests/extra/test_batched.py only, one item per test set or chunk, "
+                         "instead of one item per row")
+    group.addoption("--batch-rows", type=int, default=0, metavar="N",
+                    help="rows per tests/extra/test_batched.py item, 0 for the whole test set (default: 0)")
+
+
+def pytest_ignore_collect(collection_path, config):
+
+    # in batch mode the per-row modules are not even imported, so their rows are never parametrized
+    if config.getoption("batch") and collection_path.name in PER_ROW_MODULES:
+        return True
+    return None
+
+
+class _TestSets(dict):
+
+    # test set name -> rows, loaded through the TestSetIO cache on first use
+    def __missing__(self, name):
+
+        rows = self[name] = load_test_set(name if name.endswith(".csv") else name + ".csv")
+        return rows
+
+
+"""
+The CSV test sets as tuples of ParsedRow, e.g. test_sets["AllCombinations"].
+Session scoped and backed by the process wide cache in TestSetIO, so
+each file is read and parsed once however many tests use it.
+"""
+@pytest.fixture(scope="session")
+def test_sets():
+
+    return _TestSets()
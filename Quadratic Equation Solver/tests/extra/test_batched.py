@@ -0,0 +1,41 @@
+import sys
+import pathlib
+import pytest
+
+sys.path.insert(0, str(pathlib.Path(__file__).resolve().parents[2]))
+
+from Solver import solve_quadratic
+from TestSetIO import COMPARED_DIGITS, load_test_set, mismatch_report, mismatched_rows
+
+from conftest import PER_ROW_MODULES
+
+
+# failing rows listed in a report, the rest are counted
+REPORTED_MISMATCHES = 50
+
+
+def pytest_generate_tests(metafunc):
+
+    # one item per test set, or per --batch-rows rows of it
+    if "chunk" not in metafunc.fixturenames:
+        return
+    size = metafunc.config.getoption("batch_rows")
+    chunks, ids = [], []
+    for name in sorted(PER_ROW_MODULES.values()):
+        count = len(load_test_set(name))
+        step = size if size > 0 else max(count, 1)
+        for start in range(0, count, step):
+            stop = min(start + step, count)
+            chunks.append((name, start, stop))
+            ids.append(f"{name[:-4]}[{start}:{stop}]")
+    metafunc.parametrize("chunk", chunks, ids=ids)
+
+
+def test_test_set_batch(chunk):
+
+    name, start, stop = chunk
+    rows = load_test_set(name)[start:stop]
+    results = [solve_quadratic([row.a, row.b, row.c]) for row in rows]
+
+    indexes = mismatched_rows(rows, results, COMPARED_DIGITS.get(name, 6))
+    assert len(indexes) == 0, f"{name}: " + mismatch_report(rows, results, indexes, start, REPORTED_MISMATCHES)
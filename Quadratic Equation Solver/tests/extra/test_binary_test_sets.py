@@ -0,0 +1,123 @@
+import sys
+import pathlib
+import csv
+import pytest
+import numpy as np
+
+from pathlib import Path
+
+sys.path.insert(0, str(pathlib.Path(__file__).resolve().parents[2]))
+
+from Solver import solve_quadratic
+from Solver_Batch import solve_quadratic_batch
+from TestSetIO import (TEST_SET_DTYPE, binary_path, csv_to_binary, load_binary_test_set, parse_root,
+                       record_to_result, results_to_array, write_binary_test_set)
+
+
+TEST_SETS = ["AllCombinations.csv", "CategoryBaseTestSet.csv", "MetamorphicTestSet.csv", "PairWiseTestSet.csv"]
+
+
+def set_path(name):
+
+    return Path(__file__).resolve().parents[2] / "TestSets" / name
+
+
+@pytest.mark.parametrize("name", TEST_SETS)
+def test_loads_as_memmap(name):
+
+    records = load_binary_test_set(binary_path(set_path(name)))
+    assert isinstance(records, np.memmap)
+    assert records.dtype == TEST_SET_DTYPE
+    assert not records.flags.writeable
+
+
+@pytest.mark.parametrize("name", TEST_SETS)
+def test_matches_solve_quadratic_exactly(name):
+
+    # the coefficients are the generator's own floats, so the roots must be identical
+    records = load_binary_test_set(binary_path(set_path(name)))
+    for record in records:
+        expected = solve_quadratic([record["a"], record["b"], record["c"]])
+        assert record_to_result(record) == expected
+
+
+@pytest.mark.parametrize("name", TEST_SETS)
+def test_matches_batch_solver(name):
+
+    records = load_binary_test_set(binary_path(set_path(name)))
+    cases, root1, root2 = solve_quadratic_batch(records["a"], records["b"], records["c"])
+    assert np.array_equal(cases, records["case"])
+    assert np.array_equal(np.isnan(root1), records["na"][:, 0])
+    assert np.array_equal(root1[~records["na"][:, 0]], records["root1"][~records["na"][:, 0]])
+
+
+@pytest.mark.parametrize("name", TEST_SETS)
+def test_agrees_with_csv(name):
+
+    with open(set_path(name), 'r') as f:
+        rows = [row for row in csv.reader(f) if len(row) == 6]
+    records = load_binary_test_set(binary_path(set_path(name)))
+
+    assert len(records) == len(rows)
+    for row, record in zip(rows, records):
+        # the CSV prints float32 coefficients at float32 precision, the binary keeps every bit
+        for value, coefficient in zip(row[:3], (record["a"], record["b"], record["c"])):
+            assert float(value) == coefficient or np.float32(value) == coefficient
+        assert list(record_to_result(record)) == [row[3], [parse_root(row[4]), parse_root(row[5])]]
+
+
+def test_round_trip(tmp_path):
+
+    results = [
+        [1.0, -3.0, 2.0, "quadratic_two_real", 2.0, 1.0],
+        [1.0, 0.0, 1.0, "quadratic_two_complex", 1j, -1j],
+        [0.0, 2.0, -0.0, "linear", 0.0, "N/A"],
+        [0.0, 0.0, 0.0, "infinite_solutions", "N/A", "N/A"],
+    ]
+    path = tmp_path / "set.npy"
+    write_binary_test_set(path, results)
+    records = load_binary_test_set(path)
+
+    assert records["na"].tolist() == [[False, False], [False, False], [False, True], [True, True]]
+    assert [record_to_result(record) for record in records] == [(row[3], row[4:]) for row in results]
+    assert np.signbit(records["c"][2])
+
+
+def test_streamed_in_chunks(tmp_path):
+
+    # rows from a generator, a few at a time, give the file np.save writes for all of them
+    results = [[float(a), 1.0, 0.0, "quadratic_two_real", -1.0 / a, 0.0] for a in range(1, 8)]
+    path = tmp_path / "set.npy"
+    assert write_binary_test_set(path, (row for row in results), chunk_rows=3) == 7
+    np.save(tmp_path / "saved.npy", results_to_array(results), allow_pickle=False)
+    assert path.read_bytes() == (tmp_path / "saved.npy").read_bytes()
+    assert sorted(p.name for p in tmp_path.iterdir()) == ["saved.npy", "set.npy"]
+
+    assert write_binary_test_set(path, iter([])) == 0
+    assert load_binary_test_set(path).shape == (0,)
+
+
+def test_empty_results():
+
+    assert results_to_array([]).shape == (0,)
+
+
+def test_csv_to_binary(tmp_path):
+
+    csv_path = tmp_path / "set.csv"
+    csv_path.write_text("1.0,2.0,1.0,quadratic_one_real,-1.0,N/A\n"
+                        "1.0,0.0,1.0,quadratic_two_complex,(-0+1j),(-0-1j)\n")
+    npy_path = csv_to_binary(csv_path)
+
+    assert npy_path == tmp_path / "set.npy"
+    records = load_binary_test_set(npy_path, mmap=False)
+    assert not isinstance(records, np.memmap)
+    assert record_to_result(records[1]) == ("quadratic_two_complex", [1j, -1j])
+
+
+def test_rejects_other_arrays(tmp_path):
+
+    path = tmp_path / "other.npy"
+    np.save(path, np.zeros(3))
+    with pytest.raises(ValueError):
+        load_binary_test_set(path)
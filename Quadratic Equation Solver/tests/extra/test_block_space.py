@@ -0,0 +1,138 @@
+import sys
+import pathlib
+import csv
+import itertools
+import types
+import pytest
+
+from pathlib import Path
+
+sys.path.insert(0, str(pathlib.Path(__file__).resolve().parents[2]))
+sys.path.insert(0, str(pathlib.Path(__file__).resolve().parents[2] / "Generators"))
+
+from Block_Space import (BlockSpace, STRATEGIES, f32_max, f32_min, generate, main,
+                         make_blocks, solve_rows, write_csv)
+
+
+# the hand-written generators these strategies replaced
+TEST_SETS = {
+    "all_combinations": "AllCombinations.csv",
+    "base_choice": "CategoryBaseTestSet.csv",
+    "metamorphic": "MetamorphicTestSet.csv",
+    "pairwise": "PairWiseTestSet.csv",
+}
+
+
+def load_rows(name):
+
+    path = Path(__file__).resolve().parents[2] / "TestSets" / name
+    with open(path, 'r') as f:
+        return [row for row in csv.reader(f) if len(row) == 6]
+
+
+def test_default_blocks():
+
+    assert make_blocks() == [("B1", f32_min, -1.0), ("B2", -1.0, 0.0), ("B3", 0.0, 0.0),
+                             ("B4", 0.0, 1.0), ("B5", 1.0, f32_max)]
+
+
+@pytest.mark.parametrize("partitions", [3, 7, 21])
+def test_blocks_partition_the_range(partitions):
+
+    blocks = make_blocks(partitions)
+    assert len(blocks) == partitions
+    assert blocks[0].low == f32_min and blocks[-1].high == f32_max
+    assert blocks[partitions // 2] == ("B%d" % (partitions // 2 + 1), 0.0, 0.0)
+    for left, right in zip(blocks, blocks[1:]):
+        assert left.high == right.low
+        assert left.low <= left.high
+
+
+@pytest.mark.parametrize("partitions", [1, 4, 20])
+def test_rejects_even_partitions(partitions):
+
+    with pytest.raises(ValueError):
+        make_blocks(partitions)
+
+
+def test_representatives_inside_blocks():
+
+    space = BlockSpace(partitions=9, samples=4, seed=7)
+    for block in space.blocks:
+        values = space.values[block.name]
+        assert len(values) == (1 if block.low == block.high else 4)
+        assert all(block.low <= value <= block.high for value in values)
+    assert len(space.levels) == 8 * 4 + 1
+
+
+@pytest.mark.parametrize("strategy", sorted(TEST_SETS))
+def test_reproduces_original_test_sets(strategy):
+
+    # same seed and blocks as the old scripts, so the CSV coefficients must match exactly
+    rows = load_rows(TEST_SETS[strategy])
+    tests = list(generate(strategy))
+    assert [[str(value) for value in test] for test in tests] == [row[:3] for row in rows]
+
+
+@pytest.mark.parametrize("strategy", sorted(STRATEGIES))
+def test_strategies_are_lazy(strategy):
+
+    rows = generate(strategy, partitions=21, samples=10)
+    assert isinstance(rows, types.GeneratorType)
+    assert len(list(itertools.islice(rows, 100))) == 100
+
+
+@pytest.mark.parametrize("partitions, samples", [(5, 1), (7, 2), (9, 3)])
+def test_row_counts(partitions, samples):
+
+    n = (partitions - 1) * samples + 1
+    assert sum(1 for _ in generate("all_combinations", partitions, samples)) == n ** 3
+    assert sum(1 for _ in generate("pairwise", partitions, samples)) == n ** 2
+    assert sum(1 for _ in generate("base_choice", partitions, samples)) == 3 * n
+    assert sum(1 for _ in generate("metamorphic", partitions, samples)) == 6 * n ** 3
+
+
+@pytest.mark.parametrize("partitions, samples", [(5, 1), (7, 2), (9, 3)])
+def test_pairwise_covers_every_pair(partitions, samples):
+
+    space = BlockSpace(partitions, samples)
+    levels = set(space.levels)
+    rows = list(generate("pairwise", partitions, samples))
+    for i, j in itertools.combinations(range(3), 2):
+        assert {(row[i], row[j]) for row in rows} == set(itertools.product(levels, repeat=2))
+
+
+def test_base_choice_covers_every_block():
+
+    space = BlockSpace(partitions=7, samples=2, seed=3)
+    rows = list(generate("base_choice", 7, 2, seed=3))
+    for position in range(3):
+        assert {row[position] for row in rows} == set(space.levels)
+
+
+def test_seed_changes_values():
+
+    assert list(generate("pairwise", seed=1)) == list(generate("pairwise", seed=1))
+    assert list(generate("pairwise", seed=1)) != list(generate("pairwise", seed=2))
+
+
+def test_unknown_strategy():
+
+    with pytest.raises(ValueError):
+        generate("random")
+
+
+def test_solve_rows_and_write_csv(tmp_path):
+
+    output = tmp_path / "set.csv"
+    assert write_csv(solve_rows([(1.0, -3.0, 2.0), (0.0, 0.0, 1.0)]), output) == 2
+    assert output.read_text().splitlines() == ["1.0,-3.0,2.0,quadratic_two_real,2.0,1.0",
+                                               "0.0,0.0,1.0,no_solution,N/A,N/A"]
+
+
+def test_main(tmp_path, capsys):
+
+    output = tmp_path / "set.csv"
+    assert main(["pairwise", str(output), "--partitions", "7", "--samples", "2"]) == 0
+    assert len(output.read_text().splitlines()) == 13 ** 2
+    assert "Wrote 169 rows" in capsys.readouterr().out
@@ -0,0 +1,66 @@
+import sys
+import os
+import pathlib
+import pytest
+
+from pathlib import Path
+
+sys.path.insert(0, str(pathlib.Path(__file__).resolve().parents[2]))
+
+import TestSetIO
+
+from TestSetIO import ParsedRow, find_test_set, load_test_set
+
+
+ROWS = "1,-3,2,quadratic_two_real,2.0,1.0\n1,2,5,quadratic_two_complex,(-1+2j),(-1-2j)\nx,1,1,incorrect_type,N/A,N/A\n"
+
+
+def test_parsed_rows(tmp_path):
+
+    path = tmp_path / "Small.csv"
+    path.write_text(ROWS + "short,row\n")
+    rows = load_test_set(path)
+
+    assert len(rows) == 3
+    assert rows[0] == ParsedRow("1", "-3", "2", "quadratic_two_real", "2.0", "1.0", (1.0, -3.0, 2.0), (2.0, 1.0))
+    assert rows[1].roots == ((-1 + 2j), (-1 - 2j))
+    assert rows[2].coefficients == (None, 1.0, 1.0) and rows[2].roots == ("N/A", "N/A")
+
+    # still usable as a csv row
+    assert [rows[0][i] for i in range(6)] == ["1", "-3", "2", "quadratic_two_real", "2.0", "1.0"]
+
+
+def test_cached_until_the_file_changes(tmp_path):
+
+    path = tmp_path / "Small.csv"
+    path.write_text(ROWS)
+    rows = load_test_set(path)
+    assert load_test_set(str(path)) is rows
+
+    path.write_text(ROWS + ROWS)
+    stat = path.stat()
+    os.utime(path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+    reloaded = load_test_set(path)
+    assert len(reloaded) == 6
+    assert sum(key[0] == path.resolve() for key in TestSetIO._test_set_cache) == 1
+
+
+def test_find_by_name():
+
+    assert find_test_set("AllCombinations.csv") == TestSetIO.TEST_SET_DIRS[0] / "AllCombinations.csv"
+    with pytest.raises(FileNotFoundError):
+        find_test_set("Missing.csv")
+
+
+def test_same_rows_for_every_module():
+
+    # test_allcombination and test_metamorphic_relation share one parsed copy
+    assert load_test_set("AllCombinations.csv") is load_test_set(find_test_set("AllCombinations.csv"))
+    assert len(load_test_set("AllCombinations.csv")) == 125
+
+
+def test_session_fixture(test_sets):
+
+    assert test_sets["PairWiseTestSet"] is load_test_set("PairWiseTestSet.csv")
+    assert test_sets["MetamorphicTestSet.csv"] is test_sets["MetamorphicTestSet"]
+    assert all(isinstance(row, ParsedRow) for row in test_sets["CategoryBaseTestSet"])
@@ -0,0 +1,122 @@
+import sys
+import pathlib
+import itertools
+import time
+import pytest
+import numpy as np
+
+sys.path.insert(0, str(pathlib.Path(__file__).resolve().parents[2]))
+sys.path.insert(0, str(pathlib.Path(__file__).resolve().parents[2] / "Generators"))
+
+from Covering_Array import (bose, bush, covering_array, galois_field, ipog, latin_square,
+                            missing_combinations, prime_power)
+from Block_Space import BlockSpace, generate, main
+
+
+def test_prime_power():
+
+    assert [prime_power(q) for q in (2, 4, 9, 12, 25, 27, 1, 0, 31)] == \
+        [(2, 1), (2, 2), (3, 2), None, (5, 2), (3, 3), None, None, (31, 1)]
+
+
+@pytest.mark.parametrize("q", [2, 3, 4, 5, 7, 8, 9, 16])
+def test_galois_field_axioms(q):
+
+    add, mul = galois_field(q)
+    elements = set(range(q))
+    for x in range(q):
+        assert set(add[x]) == elements
+        if x:
+            assert set(mul[x, 1:]) == elements - {0}
+    assert (add == add.T).all() and (mul == mul.T).all()
+    # distributive law over every triple
+    for x, y, z in itertools.product(range(q), repeat=3):
+        assert mul[x, add[y, z]] == add[mul[x, y], mul[x, z]]
+
+
+def test_galois_field_rejects_non_prime_powers():
+
+    with pytest.raises(ValueError):
+        galois_field(6)
+
+
+@pytest.mark.parametrize("q, t", [(2, 2), (3, 2), (3, 3), (4, 2), (4, 3), (4, 4), (5, 2), (5, 3), (8, 2), (8, 3), (9, 2)])
+def test_bush_is_orthogonal_array(q, t):
+
+    array = bush(q, t, q + 1)
+    assert array.shape == (q ** t, q + 1)
+    assert missing_combinations(array, [q] * (q + 1), t) == 0
+    # index 1: every t-way combination exactly once
+    for columns in itertools.combinations(range(q + 1), t):
+        assert len({tuple(row) for row in array[:, columns]}) == q ** t
+
+
+def test_bose_is_bush_strength_two():
+
+    assert (bose(7, 8) == bush(7, 2, 8)).all()
+    with pytest.raises(ValueError):
+        bose(5, 7)
+
+
+@pytest.mark.parametrize("levels, t", [
+    ([2, 3, 4, 5, 6], 2), ([6] * 6, 2), ([10] * 15, 2), ([3] * 10, 3),
+    ([4, 5, 3, 2, 7, 6], 3), ([2] * 12, 4), ([3, 1, 4], 2), ([5], 2),
+])
+def test_ipog_covers(levels, t):
+
+    array = ipog(levels, t)
+    assert array.shape[1] == len(levels)
+    assert ((array >= 0) & (array < np.array(levels))).all()
+    assert missing_combinations(array, levels, min(t, len(levels))) == 0
+
+
+def test_ipog_seed_fills_free_cells_reproducibly():
+
+    first = ipog([3, 4, 5, 6, 2, 3], 2, seed=1)
+    assert (first == ipog([3, 4, 5, 6, 2, 3], 2, seed=1)).all()
+    assert missing_combinations(first, [3, 4, 5, 6, 2, 3], 2) == 0
+
+
+@pytest.mark.parametrize("n", [1, 2, 6, 10, 201])
+def test_latin_square(n):
+
+    array = latin_square(n)
+    assert array.shape == (n * n, 3)
+    assert missing_combinations(array, [n] * 3, 2) == 0
+
+
+def test_covering_array_picks_construction():
+
+    # prime power levels give the orthogonal array, the smallest possible
+    assert covering_array([5, 5, 5, 5], 2).shape == (25, 4)
+    assert covering_array([4] * 5, 3).shape == (64, 5)
+    assert covering_array([6, 6, 6], 2).shape == (36, 3)
+    assert covering_array([6, 6, 6, 6], 2).shape[0] >= 36
+    assert covering_array([2, 3], 2).shape == (6, 2)
+    assert covering_array([], 2).shape == (0, 0)
+
+
+def test_ipog_speed():
+
+    # t = 3 over dozens of parameters should take seconds, not minutes
+    start = time.perf_counter()
+    array = ipog([3] * 40, 3)
+    assert time.perf_counter() - start < 10
+    assert missing_combinations(array, [3] * 40, 3) == 0
+
+
+def test_covering_strategy():
+
+    space = BlockSpace(partitions=7, samples=2)
+    rows = list(generate("covering", 7, 2))
+    levels = set(space.levels)
+    for i, j in itertools.combinations(range(3), 2):
+        assert {(row[i], row[j]) for row in rows} == set(itertools.product(levels, repeat=2))
+    assert len(list(generate("covering", 5, 1, strength=3))) == 125
+
+
+def test_main_covering(tmp_path):
+
+    output = tmp_path / "set.csv"
+    assert main(["covering", str(output), "--partitions", "9", "--strength", "2"]) == 0
+    assert len(output.read_text().splitlines()) == 81
@@ -0,0 +1,141 @@
+import sys
+import pathlib
+import pytest
+import numpy as np
+
+from pathlib import Path
+
+sys.path.insert(0, str(pathlib.Path(__file__).resolve().parents[2]))
+
+from Solver_Batch import CASE_CODES, solve_quadratic_batch
+from Fuzz_Harness import (TEXT_VALUES, TINY, _complexity, check_values, draw, fuzz, main, parse_weights,
+                          shrink)
+from Solver import solve_quadratic_stable
+
+
+def stable_batch(a, b, c):
+
+    # solve_quadratic_stable in the shape of solve_quadratic_batch, for a few rows
+    results = [solve_quadratic_stable(row) for row in zip(a, b, c)]
+    cases = np.array([CASE_CODES[case] for case, _ in results], dtype=np.uint8)
+    roots = [[np.nan if root == "N/A" else root for root in roots] for _, roots in results]
+    root1, root2 = (np.array([pair[k] for pair in roots], dtype=np.complex128) for k in range(2))
+    return cases, root1, root2
+
+
+# distributions solve_quadratic has no known trouble with
+EXACT = {"small_int": 1.0, "signed_zero": 0.3, "special": 0.1, "text": 0.2}
+
+
+def test_draw_is_reproducible():
+
+    first = draw(np.random.default_rng([4, 2]), 1000)
+    second = draw(np.random.default_rng([4, 2]), 1000)
+    assert np.array_equal(first[0], second[0], equal_nan=True)
+    assert [repr(value) for value in first[1].ravel()] == [repr(value) for value in second[1].ravel()]
+
+
+@pytest.mark.parametrize("name,check", [
+    ("subnormal", lambda x: (np.abs(x) < TINY).all()),
+    ("signed_zero", lambda x: (x == 0).all() and np.signbit(x).any() and (~np.signbit(x)).any()),
+    ("special", lambda x: (~np.isfinite(x)).all()),
+    ("small_int", lambda x: (x == np.round(x)).all() and np.abs(x).max() <= 10),
+    ("log_uniform", lambda x: np.isfinite(x).all() and np.abs(x).max() > 1e300 and np.abs(x).min() < 1e-300),
+    ("per_block", lambda x: np.isfinite(x).all() and np.abs(x).max() < 3.5e37),
+])
+def test_distributions(name, check):
+
+    values, text, has_text, rejected = draw(np.random.default_rng(0), 2000, {name: 1.0})
+    assert text is None and not has_text.any() and not rejected.any()
+    assert check(values)
+
+
+def test_text_rows():
+
+    values, text, has_text, rejected = draw(np.random.default_rng(1), 500, {"small_int": 1.0, "text": 1.0})
+    assert has_text.tolist() == [any(isinstance(value, str) for value in row) for row in text]
+    for row, row_values, bad in zip(text, values, rejected):
+        numbers = []
+        for value in row:
+            try:
+                numbers.append(float(value))
+            except ValueError:
+                numbers.append(None)
+        assert bad == (None in numbers)
+        assert all(np.isnan(x) or x == number for x, number in zip(row_values, numbers) if number is not None)
+    assert set(value for value in text.ravel() if isinstance(value, str)) <= set(TEXT_VALUES)
+
+
+def test_invariants_hold_on_exact_inputs():
+
+    report = fuzz(seed=5, chunks=2, chunk_rows=20000, weights=EXACT)
+    assert report["failed"] == {"case": 0, "residual": 0, "cancellation": 0, "scalar": 0, "text": 0}
+    assert report["checks"] > report["rows"] and report["failures"] == []
+
+
+def test_broken_solver_is_caught():
+
+    # a solver that reports one real root as two
+    def broken(a, b, c):
+        cases, root1, root2 = solve_quadratic_batch(a, b, c)
+        cases[cases == CASE_CODES["quadratic_one_real"]] = CASE_CODES["quadratic_two_real"]
+        return cases, root1, root2
+
+    report = fuzz(seed=5, chunk_rows=20000, weights={"small_int": 1.0}, invariants=["case"], limit=1, solve=broken)
+    assert report["failed"]["case"] > 0
+    failure = report["failures"][0]
+    assert failure.case == "quadratic_two_real" and _complexity(failure.shrunk) <= _complexity(failure.row)
+
+
+def test_default_run_passes():
+
+    # the default distributions only hit the textbook formula's known cancellation, which is reported apart
+    report = fuzz(seed=0, chunks=2, limit=0)
+    assert report["failed"]["cancellation"] > 0
+    assert {name: count for name, count in report["failed"].items() if name != "cancellation"} == \
+        {"case": 0, "residual": 0, "scalar": 0, "text": 0}
+
+
+def test_residual_catches_what_stable_solving_would_not():
+
+    # a solver whose smaller roots are off by 1e-3 fails residual, not cancellation
+    def perturbed(a, b, c):
+        cases, root1, root2 = solve_quadratic_batch(a, b, c)
+        return cases, root1 * (1 + 1e-3), root2
+
+    report = fuzz(seed=5, chunk_rows=5000, weights={"small_int": 1.0}, invariants=["residual", "cancellation"],
+                  limit=1, shrink_failures=False, solve=perturbed)
+    assert report["failed"]["residual"] > 0 and report["failed"]["cancellation"] == 0
+
+
+def test_cancellation_failures_are_shrunk_and_replayed():
+
+    # the textbook formula loses the smaller root to cancellation where b * b is far larger than 4ac
+    report = fuzz(seed=7, chunks=2, chunk_rows=5000, weights={"log_uniform": 1.0}, invariants=["cancellation"],
+                  limit=3)
+    assert report["failed"]["cancellation"] > 0
+    for failure in report["failures"]:
+        assert _complexity(failure.shrunk) <= _complexity(failure.row)
+        assert check_values(np.array([failure.shrunk]))[0]["cancellation"][1][0]
+        assert not check_values(np.array([failure.shrunk]), solve=stable_batch)[0]["residual"][1][0]
+
+    last = report["failures"][-1]
+    replay = fuzz(seed=7, chunks=1, chunk_rows=5000, weights={"log_uniform": 1.0}, invariants=["cancellation"],
+                  first_chunk=last.chunk, limit=10 ** 6, shrink_failures=False)
+    assert last.row in [failure.row for failure in replay["failures"]]
+
+
+def test_shrink_keeps_failing():
+
+    row = shrink((1.2345, 9.87654321e12, 3.3), "cancellation")
+    assert row == (1.0, 1e13, 1.0)
+
+
+def test_parse_weights_and_main(capsys):
+
+    assert parse_weights(["small_int=2", "text"]) == {"small_int": 2.0, "text": 1.0}
+    with pytest.raises(ValueError):
+        parse_weights(["normal"])
+
+    assert main(["--chunks", "1", "--chunk-rows", "1000", "--distribution", "small_int"]) == 0
+    assert "1000 rows" in capsys.readouterr().out
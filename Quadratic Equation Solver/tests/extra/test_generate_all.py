@@ -0,0 +1,119 @@
+import sys
+import pathlib
+import json
+import pytest
+
+from pathlib import Path
+
+sys.path.insert(0, str(pathlib.Path(__file__).resolve().parents[2]))
+sys.path.insert(0, str(pathlib.Path(__file__).resolve().parents[2] / "Generators"))
+
+from Generate_All_Test_Sets import GENERATORS, generate_all, main
+from Manifest import fingerprint, is_up_to_date, manifest_path, read_manifest, write_manifest
+
+
+TEST_SETS = Path(__file__).resolve().parents[2] / "TestSets"
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_matches_committed_test_sets(workers, tmp_path):
+
+    results = generate_all(output_dir=tmp_path, workers=workers)
+    assert [result["name"] for result in results] == list(GENERATORS)
+
+    for result in results:
+        path = Path(result["path"])
+        assert path.parent == tmp_path
+        assert path.read_bytes() == (TEST_SETS / path.name).read_bytes()
+        assert path.with_suffix(".npy").read_bytes() == (TEST_SETS / path.name).with_suffix(".npy").read_bytes()
+        assert result["seconds"] >= 0
+        assert result["regenerated"]
+        assert "Wrote results to" in result["output"]
+        assert read_manifest(path)["rows"] == result["rows"]
+        # the committed manifest is current, so running the generator in TestSets/ would skip it
+        assert read_manifest(path) == read_manifest(TEST_SETS / path.name)
+
+    assert {result["name"]: result["rows"] for result in results} == \
+        {"all_combinations": 125, "base": 15, "metamorphic": 750, "pairwise": 25}
+
+
+def test_only_some_generators(tmp_path):
+
+    results = generate_all(["pairwise"], output_dir=tmp_path)
+    assert [result["name"] for result in results] == ["pairwise"]
+    assert sorted(path.name for path in tmp_path.iterdir()) == \
+        ["PairWiseTestSet.csv", "PairWiseTestSet.manifest.json", "PairWiseTestSet.npy"]
+
+
+def test_unknown_generator(tmp_path):
+
+    with pytest.raises(ValueError):
+        generate_all(["random"], output_dir=tmp_path)
+
+
+def test_main(tmp_path, capsys):
+
+    assert main(["--only", "base", "pairwise", "--output-dir", str(tmp_path), "--workers", "1"]) == 0
+    output = capsys.readouterr().out
+    assert "base: 15 rows" in output and "pairwise: 25 rows" in output
+
+
+def test_unchanged_test_sets_are_skipped(tmp_path):
+
+    generate_all(["pairwise", "metamorphic"], output_dir=tmp_path, workers=1)
+    written = {path.name: path.stat().st_mtime_ns for path in tmp_path.iterdir()}
+
+    results = generate_all(["pairwise", "metamorphic"], output_dir=tmp_path, workers=1)
+    assert [result["regenerated"] for result in results] == [False, False]
+    assert [result["rows"] for result in results] == [25, 750]
+    assert "is up to date" in results[0]["output"]
+    assert {path.name: path.stat().st_mtime_ns for path in tmp_path.iterdir()} == written
+
+    assert generate_all(["pairwise"], output_dir=tmp_path, force=True)[0]["regenerated"]
+
+
+def test_changed_outputs_or_fingerprint_regenerate(tmp_path):
+
+    generate_all(["base", "pairwise"], output_dir=tmp_path, workers=1)
+
+    # an edited CSV no longer matches its manifest
+    (tmp_path / "CategoryBaseTestSet.csv").write_text("edited\n")
+    # a different fingerprint stands for a changed generator, engine, Solver.py or parameters
+    manifest = read_manifest(tmp_path / "PairWiseTestSet.csv")
+    manifest["fingerprint"] = "0" * 64
+    manifest_path(tmp_path / "PairWiseTestSet.csv").write_text(json.dumps(manifest))
+
+    results = generate_all(["base", "pairwise"], output_dir=tmp_path, workers=1)
+    assert [result["regenerated"] for result in results] == [True, True]
+    assert (tmp_path / "CategoryBaseTestSet.csv").read_bytes() == (TEST_SETS / "CategoryBaseTestSet.csv").read_bytes()
+
+
+def test_fingerprint(tmp_path):
+
+    source = tmp_path / "generator.py"
+    source.write_bytes(b"x = 1\n")
+    digest = fingerprint([source], {"seed": 101})
+
+    source.write_bytes(b"x = 1\r\n")
+    assert fingerprint([source], {"seed": 101}) == digest
+    assert fingerprint([source], {"seed": 102}) != digest
+    source.write_bytes(b"x = 2\n")
+    assert fingerprint([source], {"seed": 101}) != digest
+
+    # functions by their source, constants by their repr, so the rest of their module does not count
+    assert fingerprint([fingerprint, ("a", "b")], {}) == fingerprint([fingerprint, ("a", "b")], {})
+    assert fingerprint([fingerprint, ("a", "b")], {}) != fingerprint([fingerprint, ("a", "c")], {})
+    assert fingerprint([fingerprint], {}) != fingerprint([is_up_to_date], {})
+
+
+def test_manifest_round_trip(tmp_path):
+
+    output = tmp_path / "set.csv"
+    assert not is_up_to_date([output], "abc")
+
+    output.write_text("1,2,3\n")
+    write_manifest([output], "abc", 1)
+    assert manifest_path(output) == tmp_path / "set.manifest.json"
+    assert is_up_to_date([output], "abc")
+    assert not is_up_to_date([output], "abd")
+    assert not is_up_to_date([output, tmp_path / "set.npy"], "abc")
@@ -0,0 +1,123 @@
+import sys
+import ast
+import pathlib
+import textwrap
+import pytest
+
+from pathlib import Path
+
+sys.path.insert(0, str(pathlib.Path(__file__).resolve().parents[2]))
+
+from Mutation_Engine import MutationEngine, find_mutations, main, solver_oracle
+
+
+ROOT = Path(__file__).resolve().parents[2]
+
+SOURCE = '''
+"""module docstring"""
+
+LIMIT = 3
+
+
+def count(n):
+    """docstring"""
+    i = 0
+    while i < n:
+        i += 1
+    return i
+
+
+def label(x):
+    return f"value {x}" if x and not x is None else "none"
+
+
+class Box:
+
+    def size(self):
+        return -LIMIT
+'''
+
+
+@pytest.fixture
+def engine(tmp_path):
+
+    path = tmp_path / "Sample.py"
+    path.write_text(textwrap.dedent(SOURCE))
+    return MutationEngine(path)
+
+
+def test_find_mutations(engine):
+
+    described = [(m.function, m.description) for m in engine.mutations]
+    assert described == [
+        ("count", "0 -> 1"), ("count", "< -> <="), ("count", "+ -> -"), ("count", "1 -> 2"),
+        ("label", "and -> or"), ("label", "not removed"), ("label", "is -> is not"), ("label", "'none' -> 'XXnoneXX'"),
+        ("Box.size", "unary - removed"),
+    ]
+
+
+def test_functions_filter():
+
+    tree = ast.parse(textwrap.dedent(SOURCE))
+    assert {m.function for m, _ in find_mutations(tree, ["count", "Box.size"])} == {"count", "Box.size"}
+    assert {m.function for m, _ in find_mutations(tree, ["size"])} == {"Box.size"}
+
+
+def test_mutant_modules(engine):
+
+    original = engine.module()
+    assert original.count(3) == 3 and original.Box().size() == -3
+
+    assert engine.module(0).count(3) == 3
+    assert engine.module(1).count(3) == 4
+    assert engine.module(8).Box().size() == 3
+
+    # the tree is back to the original after every mutant
+    assert ast.dump(engine.tree) == ast.dump(ast.parse(engine.source))
+    assert engine.module().count(5) == 5
+
+
+def test_run(engine):
+
+    def oracle(module):
+        if module.count(2) != 2:
+            return "count(2)"
+        return None
+
+    results = engine.run(oracle, indexes=[0, 1, 2, 5], timeout=0.5)
+    assert [r["status"] for r in results] == ["survived", "killed", "timeout", "survived"]
+    assert results[1]["failure"] == "count(2)"
+
+
+def test_exceptions_kill(engine):
+
+    results = engine.run(lambda module: module.label(None) and None, indexes=[5])
+    assert results[0]["status"] == "survived"
+    assert engine.run(lambda module: 1 / (module.count(1) - 2) and None, indexes=[1])[0]["status"] == "killed"
+
+
+def test_oracle_must_pass_original(engine):
+
+    with pytest.raises(ValueError):
+        engine.run(lambda module: "always fails")
+
+
+def test_solver_mutants():
+
+    engine = MutationEngine(ROOT / "Solver.py", ["solve_quadratic"])
+    oracle = solver_oracle(sorted((ROOT / "TestSets").glob("*.csv")))
+    assert oracle.rows == 915
+
+    # the mutants of solve_quadratic's a == 0.0 check
+    line = (ROOT / "Solver.py").read_text().splitlines().index("    if a == 0.0:") + 1
+    results = engine.run(oracle)
+    statuses = {r["mutant"].description: r["status"] for r in results if r["mutant"].line == line}
+    assert statuses == {"== -> !=": "killed", "0.0 -> 1.0": "killed"}
+    assert not any(r["status"] == "timeout" for r in results)
+    assert sum(r["status"] == "killed" for r in results) > len(results) // 2
+
+
+def test_main_list(capsys):
+
+    assert main(["--list"]) == 0
+    assert "solve_quadratic line" in capsys.readouterr().out
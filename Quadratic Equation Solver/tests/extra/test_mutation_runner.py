@@ -0,0 +1,188 @@
+import sys
+import json
+import pathlib
+import sqlite3
+import textwrap
+import importlib.util
+import pytest
+
+from pathlib import Path
+
+sys.path.insert(0, str(pathlib.Path(__file__).resolve().parents[2]))
+
+from Mutation_Runner import (EXIT_KILLED, EXIT_SURVIVED, EXIT_USAGE_ERROR, find_mutants, main, run_cached_mutants,
+                             run_mutant, run_mutants, select_tests)
+
+
+MUTANTS_DIR = Path(__file__).resolve().parents[2] / "mutants"
+
+
+# a mutants directory in the layout mutmut writes, with one mutant per outcome
+CALC = '''
+def _trampoline(orig, mutants, args):
+    import os
+    name = os.environ["MUTANT_UNDER_TEST"].rpartition(".")[-1]
+    return mutants[name](*args) if name in mutants else orig(*args)
+
+def x_double__mutmut_orig(x):
+    return 2 * x
+def x_double__mutmut_1(x):
+    return 3 * x
+def x_double__mutmut_2(x):
+    return x + x
+def x_double__mutmut_3(x):
+    while True:
+        pass
+def x_double__mutmut_4(x):
+    raise KeyboardInterrupt()
+x_double__mutmut_mutants = {name: globals()[name] for name in
+                            ["x_double__mutmut_1", "x_double__mutmut_2", "x_double__mutmut_3",
+                             "x_double__mutmut_4"]}
+def double(x):
+    return _trampoline(x_double__mutmut_orig, x_double__mutmut_mutants, (x,))
+
+def x_unused__mutmut_orig():
+    return 1
+def x_unused__mutmut_1():
+    return 2
+'''
+
+TESTS = '''
+import sys
+import pathlib
+import pytest
+
+sys.path.insert(0, str(pathlib.Path(__file__).resolve().parents[1]))
+
+from Calc import double
+
+
+@pytest.mark.parametrize("x", [0, 1, 2])
+def test_double(x):
+    assert double(x) == 2 * x
+'''
+
+
+@pytest.fixture
+def mutants_dir(tmp_path):
+
+    (tmp_path / "tests").mkdir()
+    (tmp_path / "Calc.py").write_text(textwrap.dedent(CALC))
+    (tmp_path / "tests" / "test_calc.py").write_text(textwrap.dedent(TESTS))
+    tests = [f"tests/test_calc.py::test_double[{x}]" for x in range(3)]
+    (tmp_path / "mutmut-stats.json").write_text(json.dumps({
+        "tests_by_mangled_function_name": {"Calc.x_double": tests},
+        "duration_by_test": {tests[0]: 0.3, tests[1]: 0.1, tests[2]: 0.2},
+    }))
+    (tmp_path / "Calc.py.meta").write_text(json.dumps({"exit_code_by_key": {}, "hash_by_function_name": {}}))
+    return tmp_path
+
+
+def test_find_mutants(mutants_dir):
+
+    assert find_mutants(mutants_dir) == [
+        "Calc.x_double__mutmut_1", "Calc.x_double__mutmut_2", "Calc.x_double__mutmut_3", "Calc.x_double__mutmut_4",
+        "Calc.x_unused__mutmut_1",
+    ]
+
+
+def test_select_tests_fastest_first(mutants_dir):
+
+    tests_by_function = {"Calc.x_double": ["b", "a", "c", "a"]}
+    durations = {"a": 0.3, "b": 0.1, "c": 0.2}
+    assert select_tests("Calc.x_double__mutmut_2", tests_by_function, durations) == ["b", "c", "a"]
+    assert select_tests("Calc.x_unused__mutmut_1", tests_by_function, durations) == []
+
+
+@pytest.mark.parametrize("workers", [1, 2])
+def test_run_mutants(mutants_dir, workers):
+
+    results = run_mutants(mutants_dir, workers=workers, timeout_factor=0, timeout_base=3)
+    assert {r["mutant"]: r["status"] for r in results} == {
+        "Calc.x_double__mutmut_1": "killed",
+        "Calc.x_double__mutmut_2": "survived",
+        "Calc.x_double__mutmut_3": "timeout",
+        "Calc.x_double__mutmut_4": "interrupted",
+        "Calc.x_unused__mutmut_1": "no tests",
+    }
+
+    # the fastest test runs first and kills it
+    assert results[0]["killed_by"] == "tests/test_calc.py::test_double[1]"
+
+    meta = json.loads((mutants_dir / "Calc.py.meta").read_text())
+    assert meta["exit_code_by_key"] == {r["mutant"]: r["exit_code"] for r in results}
+    assert set(meta["durations_by_key"]) == set(meta["exit_code_by_key"])
+    assert meta["hash_by_function_name"] == {}
+
+
+def test_patterns_and_no_write(mutants_dir):
+
+    results = run_mutants(mutants_dir, ["*double__mutmut_[12]"], write_meta=False)
+    assert [r["exit_code"] for r in results] == [EXIT_KILLED, EXIT_SURVIVED]
+    assert json.loads((mutants_dir / "Calc.py.meta").read_text())["exit_code_by_key"] == {}
+
+
+def test_run_mutant_in_new_process(mutants_dir):
+
+    # outside a warmed up worker every mutant gets its own pytest process
+    tests = ["tests/test_calc.py::test_double[1]"]
+    assert run_mutant("Calc.x_double__mutmut_1", tests, str(mutants_dir))["status"] == "killed"
+    assert run_mutant("Calc.x_double__mutmut_2", tests, str(mutants_dir))["status"] == "survived"
+
+
+def test_errors_do_not_kill(mutants_dir):
+
+    # a test id that is not found is a usage error (pytest exit code 4), not a kill
+    result = run_mutant("Calc.x_double__mutmut_1", ["tests/test_calc.py::test_missing"], str(mutants_dir))
+    assert (result["exit_code"], result["status"]) == (EXIT_USAGE_ERROR, "usage error")
+
+    assert main(["--mutants-dir", str(mutants_dir), "Calc.x_double__mutmut_4", "--no-write"]) == 1
+    assert main(["--mutants-dir", str(mutants_dir), "Calc.x_double__mutmut_1", "--no-write"]) == 0
+
+
+@pytest.mark.skipif(not (MUTANTS_DIR / "mutmut-stats.json").exists(), reason="no mutmut run in this checkout")
+def test_matches_mutmut_results():
+
+    # the same outcome as the mutmut run recorded in mutants/Solver.py.meta
+    meta = json.loads((MUTANTS_DIR / "Solver.py.meta").read_text())["exit_code_by_key"]
+    patterns = ["Solver.x_solve_quadratic__mutmut_1", "Solver.x_solve_quadratic__mutmut_10"]
+    results = run_mutants(MUTANTS_DIR, patterns, write_meta=False)
+    assert {r["mutant"]: r["exit_code"] for r in results} == {name: meta[name] for name in patterns}
+
+
+# a project as mutmut 2 runs it: the sources in place, mutants listed in .mutmut-cache
+PLAIN_CALC = '''
+def double(x):
+    return 2 * x
+'''
+
+
+@pytest.fixture
+def mutmut2_project(tmp_path, monkeypatch):
+
+    (tmp_path / "tests").mkdir()
+    (tmp_path / "Calc.py").write_text(textwrap.dedent(PLAIN_CALC))
+    (tmp_path / "tests" / "test_calc.py").write_text(textwrap.dedent(TESTS))
+    monkeypatch.chdir(tmp_path)
+    return tmp_path
+
+
+@pytest.mark.skipif(importlib.util.find_spec("mutmut") is None, reason="mutmut is not installed")
+def test_mutmut2_cache(mutmut2_project):
+
+    pytest.importorskip("mutmut.cache", reason="needs mutmut 2")
+    results = run_cached_mutants(["Calc.py"], workers=2, timeout_factor=0, timeout_base=30)
+    assert results and all(r["status"] == "killed" for r in results)
+    assert (mutmut2_project / "Calc.py").read_text() == textwrap.dedent(PLAIN_CALC)
+
+    # stored as mutmut 2 stores them, under the ids `mutmut show` takes
+    with sqlite3.connect(mutmut2_project / ".mutmut-cache") as db:
+        statuses = dict(db.execute("SELECT id, status FROM Mutant"))
+    assert statuses == {int(r["mutant"]): "ok_killed" for r in results}
+
+
+def test_mutmut2_needs_mutmut_2(mutmut2_project, monkeypatch, capsys):
+
+    monkeypatch.setitem(sys.modules, "mutmut", None)
+    assert main(["--mutmut2", "Calc.py"]) == 1
+    assert "mutmut==2.4.4" in capsys.readouterr().err
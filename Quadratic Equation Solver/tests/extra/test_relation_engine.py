@@ -0,0 +1,81 @@
+import sys
+import pathlib
+import itertools
+import pytest
+import numpy as np
+
+from pathlib import Path
+
+sys.path.insert(0, str(pathlib.Path(__file__).resolve().parents[2]))
+
+from Solver_Batch import solve_quadratic_batch
+from Metamorphic_Relations import RELATIONS, block_rows, check_relations, follow_ups, main, rows_of_test_sets
+
+
+def counts(results):
+
+    return {name: (result["checked"], result["violated"]) for name, result in results.items()}
+
+
+def test_mr1_mr2_on_all_combinations():
+
+    # the instances test_metamorphic_relation.py checks one pytest item at a time, less the scalings by
+    # 10 and -0.1 of rows whose small root is lost to cancellation
+    rows = list(rows_of_test_sets(["AllCombinations.csv"]))
+    results = check_relations(rows, [RELATIONS["scale"], RELATIONS["negate_b"]])
+    assert counts(results) == {"scale": (545, 0), "negate_b": (125, 0)}
+
+
+def test_every_relation_holds_on_the_block_space():
+
+    results = check_relations(block_rows("all_combinations", 5, 3, 101))
+    assert all(result["violated"] == 0 for result in results.values()), results
+    assert all(result["checked"] > 0 for result in results.values())
+
+
+def test_scale_holds_on_a_fine_block_space():
+
+    # wide coefficient ranges, where scaling c by 10 or -0.1 rounds it and moves roots lost to cancellation
+    results = check_relations(block_rows("all_combinations", 21, 1, 101), [RELATIONS["scale"]])
+    assert results["scale"]["violated"] == 0, results["scale"]["violations"][:3]
+    assert results["scale"]["checked"] > 0
+
+
+def test_chunks_do_not_change_the_results():
+
+    rows = np.array(list(block_rows("pairwise", 5, 2, 7)))
+    assert counts(check_relations(rows, chunk_rows=7)) == counts(check_relations(iter(rows.tolist())))
+
+
+def test_relation_instances_are_found():
+
+    rows = list(block_rows("all_combinations", 5, 2, 101))
+
+    # a solver whose second root is slightly off breaks every relation that has two roots
+    def off(a, b, c):
+        cases, root1, root2 = solve_quadratic_batch(a, b, c)
+        return cases, root1, root2 * (1 + 1e-3)
+
+    results = check_relations(rows, solve=off, limit=2)
+    assert all(result["violated"] > 0 for result in results.values())
+    violation = results["negate_b"]["violations"][0]
+    assert violation.relation == "negate_b" and violation.follow_up == (violation.source[0], -violation.source[1],
+                                                                        violation.source[2])
+    assert len(results["scale"]["violations"]) == 2
+
+
+def test_follow_ups_are_lazy():
+
+    # an endless source: only the first chunk is read
+    rows = ((1.0, float(n), 1.0) for n in itertools.count())
+    first = list(itertools.islice(follow_ups(rows, RELATIONS["scale"], chunk_rows=4), 6))
+    assert [p for _, p, _ in first] == [2.0, 0.5, 10.0, -1.0, -0.1, 2.0]
+    assert first[0] == ((1.0, 0.0, 1.0), 2.0, (2.0, 0.0, 2.0))
+    assert first[5][0] == (1.0, 1.0, 1.0)
+
+
+def test_main(capsys):
+
+    assert main(["--relation", "swap_a_c", "--relation", "shift"]) == 0
+    out = capsys.readouterr().out
+    assert "swap_a_c: " in out and "shift: " in out and "scale" not in out
@@ -0,0 +1,99 @@
+import sys
+import pathlib
+import pytest
+import numpy as np
+
+from pathlib import Path
+
+sys.path.insert(0, str(pathlib.Path(__file__).resolve().parents[2]))
+
+from Solver import solve_quadratic
+from Solver_Batch import CASE_CODES
+from TestSetIO import (compare_roots, expected_arrays, load_test_set, mismatch_report, mismatched_rows,
+                       result_arrays, root_arrays)
+
+
+ROWS = "1,-3,2,quadratic_two_real,2.0,1.0\n1,2,5,quadratic_two_complex,(-1+2j),(-1-2j)\n0,2,0,linear,0.0,N/A\n"
+
+
+@pytest.fixture
+def rows(tmp_path):
+
+    path = tmp_path / "Small.csv"
+    path.write_text(ROWS)
+    return load_test_set(path)
+
+
+def test_root_arrays():
+
+    arrays = root_arrays(["linear", "unknown"], [[-0.0, "N/A"], [(1 - 2j), 3.0]])
+    assert arrays.cases.tolist() == [CASE_CODES["linear"], 255]
+    assert arrays.na.tolist() == [[False, True], [False, False]]
+    assert not np.signbit(arrays.roots[0, 0].real)
+    assert np.isnan(arrays.roots[0, 1])
+    assert arrays.roots[1].tolist() == [(1 - 2j), (3 + 0j)]
+
+
+def test_matching_results(rows):
+
+    results = [solve_quadratic([row.a, row.b, row.c]) for row in rows]
+    assert mismatched_rows(rows, results).tolist() == []
+
+    # two roots in either order, and -0.0 equal to 0.0
+    results = [("quadratic_two_real", [1.0, 2.0]), ("quadratic_two_complex", [(-1 - 2j), (-1 + 2j)]),
+               ("linear", [-0.0, "N/A"])]
+    assert mismatched_rows(rows, results).tolist() == []
+
+
+def test_mismatches(rows):
+
+    results = [("quadratic_two_real", [2.0, 1.001]), ("quadratic_two_complex", [(-1 + 2j), (-1 + 2j)]),
+               ("linear", ["N/A", 0.0])]
+    assert mismatched_rows(rows, results).tolist() == [0, 1, 2]
+
+    results = [("quadratic_two_real", [2.0, 1.0]), ("quadratic_one_real", [(-1 + 2j), (-1 - 2j)]),
+               ("linear", [0.0, 0.0])]
+    assert mismatched_rows(rows, results).tolist() == [1, 2]
+
+    # a linear or one-real root must be a float, not a complex or int of the same value
+    results = [("quadratic_two_real", [2.0, 1.0]), ("quadratic_two_complex", [(-1 + 2j), (-1 - 2j)]),
+               ("linear", [0j, "N/A"])]
+    assert mismatched_rows(rows, results).tolist() == [2]
+    results[2] = ("linear", [0, "N/A"])
+    assert mismatched_rows(rows, results).tolist() == [2]
+
+
+def test_tolerance(rows):
+
+    results = [("quadratic_two_real", [2.0, 1.000001]), ("quadratic_two_complex", [(-1 + 2j), (-1 - 2j)]),
+               ("linear", [0.0, "N/A"])]
+    assert mismatched_rows(rows, results).tolist() == []
+    assert mismatched_rows(rows, results, digits=8).tolist() == [0]
+
+    # units in the last place, for exact comparisons
+    actual = result_arrays([("linear", [np.nextafter(2.0, 3.0), "N/A"])])
+    expected = result_arrays([("linear", [2.0, "N/A"])])
+    assert compare_roots(actual, expected, rtol=0).tolist() == [0]
+    assert compare_roots(actual, expected, rtol=0, ulps=1).tolist() == []
+
+    # an infinite root only equals itself
+    actual = result_arrays([("linear", [np.inf, "N/A"]), ("linear", [np.inf, "N/A"])])
+    expected = result_arrays([("linear", [np.inf, "N/A"]), ("linear", [1e308, "N/A"])])
+    assert compare_roots(actual, expected).tolist() == [1]
+
+
+def test_expected_arrays_cached(rows):
+
+    assert expected_arrays(rows) is expected_arrays(rows)
+    assert expected_arrays(rows[:2]) is not expected_arrays(rows[:2])
+
+
+def test_mismatch_report(rows):
+
+    results = [("linear", [1.0, "N/A"])] * 3
+    report = mismatch_report(rows, results, mismatched_rows(rows, results), first_row=10, limit=1)
+    assert report.splitlines() == [
+        "3 of 3 rows do not match:",
+        "  row 10 (1, -3, 2): expected quadratic_two_real [2.0, 1.0], got linear [1.0, 'N/A']",
+        "  ... and 2 more",
+    ]
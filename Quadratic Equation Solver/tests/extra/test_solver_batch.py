@@ -0,0 +1,114 @@
+import sys
+import pathlib
+import csv
+import math
+import pytest
+import numpy as np
+
+from pathlib import Path
+
+sys.path.insert(0, str(pathlib.Path(__file__).resolve().parents[2]))
+
+from Solver import solve_quadratic
+from Solver_Batch import solve_quadratic_batch, CASE_NAMES, CASE_CODES, ROOT_COUNTS
+
+
+TEST_SETS = ["AllCombinations.csv", "CategoryBaseTestSet.csv", "MetamorphicTestSet.csv", "PairWiseTestSet.csv"]
+
+EDGE_ROWS = [
+    [0.0, 0.0, 0.0], [0.0, 0.0, 5.0], [0.0, 2.0, 4.0], [0.0, -0.0, 1.0],
+    [1.0, -3.0, 2.0], [1.0, 2.0, 1.0], [1.0, 0.0, 1.0], [-1.0, 0.0, -1.0], [2.0, -0.0, 3.0],
+    [1e200, 1e200, 1e200], [float("nan"), 1.0, 1.0], [1.0, float("inf"), 1.0],
+    ["abc", 1.0, 1.0], [1.0, None, 1.0], ["1.5", "-2", "0.25"],
+]
+
+
+def load_coefficients():
+
+    rows = []
+    for name in TEST_SETS:
+        path = Path(__file__).resolve().parents[2] / "TestSets" / name
+        with open(path, 'r') as f:
+            for row in csv.reader(f):
+                if len(row) >= 6:
+                    rows.append(row[:3])
+    return rows + EDGE_ROWS
+
+
+def same_value(expected, actual):
+
+    # exact comparison including the sign of zero, NaN equal to NaN
+    def same_float(x, y):
+        if math.isnan(x) or math.isnan(y):
+            return math.isnan(x) and math.isnan(y)
+        return x == y and math.copysign(1.0, x) == math.copysign(1.0, y)
+
+    expected = complex(expected)
+    actual = complex(actual)
+    return same_float(expected.real, actual.real) and same_float(expected.imag, actual.imag)
+
+
+def test_batch_matches_scalar():
+
+    rows = load_coefficients()
+    columns = [np.array([row[i] for row in rows], dtype=object) for i in range(3)]
+    cases, root1, root2 = solve_quadratic_batch(*columns)
+
+    for i, row in enumerate(rows):
+        expected_case, expected_roots = solve_quadratic(row)
+        assert CASE_NAMES[cases[i]] == expected_case, f"Case mismatch for {row}"
+
+        for k, (expected, actual) in enumerate(zip(expected_roots, (root1[i], root2[i]))):
+            if k >= ROOT_COUNTS[cases[i]]:
+                assert expected == "N/A"
+                assert np.isnan(actual)
+            else:
+                assert same_value(expected, actual), f"Root {k} mismatch for {row}: {expected} vs {actual}"
+
+
+def test_tiny_discriminants_match_scalar_bit_for_bit():
+
+    # discriminants below 8 * DBL_MIN, where cmath.sqrt and np.sqrt of |disc| round differently
+    rng = np.random.default_rng(7)
+    c = np.concatenate([[-1.4e-308, -1e-310, -5e-324, -2.2250738585072014e-308],
+                        -rng.random(2000) * 10.0 ** rng.integers(-323, -306, 2000)])
+    a = np.full(c.shape, -1.0)
+    cases, root1, root2 = solve_quadratic_batch(a, 0.0, c)
+
+    for i in range(len(c)):
+        expected_case, expected_roots = solve_quadratic([a[i], 0.0, c[i]])
+        assert CASE_NAMES[cases[i]] == expected_case
+        if expected_case == "quadratic_two_complex":
+            assert same_value(expected_roots[0], root1[i]), f"Root 0 mismatch for c={c[i]!r}"
+            assert same_value(expected_roots[1], root2[i]), f"Root 1 mismatch for c={c[i]!r}"
+    assert root1[0].imag == -1.183215956619923e-154
+
+
+def test_float_roots_without_complex_cases():
+
+    cases, root1, root2 = solve_quadratic_batch(np.array([1.0, 0.0]), np.array([-3.0, 2.0]), np.array([2.0, -4.0]))
+    assert root1.dtype == np.float64
+    assert [CASE_NAMES[code] for code in cases] == ["quadratic_two_real", "linear"]
+    assert root1.tolist() == [2.0, 2.0]
+    assert root2[0] == 1.0 and np.isnan(root2[1])
+
+
+def test_complex_roots():
+
+    cases, root1, root2 = solve_quadratic_batch([1.0], [0.0], [1.0])
+    assert root1.dtype == np.complex128
+    assert cases[0] == CASE_CODES["quadratic_two_complex"]
+    assert root1[0] == 1j and root2[0] == -1j
+
+
+def test_broadcasting():
+
+    cases, root1, _ = solve_quadratic_batch(1.0, np.array([-3.0, 2.0]), 2.0)
+    assert cases.shape == (2,)
+    assert [CASE_NAMES[code] for code in cases] == ["quadratic_two_real", "quadratic_two_complex"]
+
+
+def test_case_tables():
+
+    assert len(CASE_NAMES) == len(ROOT_COUNTS) == len(CASE_CODES)
+    assert CASE_CODES["overflow"] == CASE_NAMES.index("overflow")
@@ -0,0 +1,100 @@
+import sys
+import pathlib
+import csv
+import pytest
+import numpy as np
+
+from pathlib import Path
+
+sys.path.insert(0, str(pathlib.Path(__file__).resolve().parents[2]))
+
+from Solver import solve_quadratic
+from Solver_Batch import solve_file, main, BINARY_RESULT_DTYPE, CASE_CODES
+
+
+TEST_SETS = ["AllCombinations.csv", "CategoryBaseTestSet.csv", "MetamorphicTestSet.csv", "PairWiseTestSet.csv"]
+
+
+def expected_row(row):
+
+    # what the generators would write for this input row
+    case, roots = solve_quadratic((row + [None, None, None])[:3])
+    if not isinstance(roots, list):
+        roots = []
+    return [case] + [str(root) for root in roots] + ["N/A"] * (2 - len(roots))
+
+
+@pytest.mark.parametrize("name", TEST_SETS)
+@pytest.mark.parametrize("chunk_rows", [1, 7, 65536])
+def test_csv_matches_solve_quadratic(name, chunk_rows, tmp_path):
+
+    input_path = Path(__file__).resolve().parents[2] / "TestSets" / name
+    output_path = tmp_path / "out.csv"
+    counts = solve_file(str(input_path), str(output_path), chunk_rows=chunk_rows)
+
+    with open(input_path, 'r') as f:
+        rows = [row for row in csv.reader(f) if row]
+    with open(output_path, 'r') as f:
+        results = list(csv.reader(f))
+
+    assert len(results) == len(rows) == sum(counts.values())
+    for row, result in zip(rows, results):
+        assert result[:3] == row[:3]
+        assert result[3:] == expected_row(row)
+
+
+def test_csv_short_and_invalid_rows(tmp_path):
+
+    input_path = tmp_path / "in.csv"
+    input_path.write_text("1,2\nabc,1,1\n\n1,-3,2\n")
+    output_path = tmp_path / "out.csv"
+    counts = solve_file(str(input_path), str(output_path))
+
+    with open(output_path, 'r') as f:
+        results = list(csv.reader(f))
+    assert [result[3] for result in results] == ["incorrect_type", "incorrect_type", "quadratic_two_real"]
+    assert results[2][4:] == ["2.0", "1.0"]
+    assert counts["incorrect_type"] == 2
+
+
+def test_binary_input_and_output(tmp_path):
+
+    coefficients = np.array([[1.0, -3.0, 2.0], [1.0, 0.0, 1.0], [0.0, 2.0, 4.0], [0.0, 0.0, 5.0]], dtype="<f8")
+    input_path = tmp_path / "in.bin"
+    coefficients.tofile(input_path)
+
+    output_path = tmp_path / "out.bin"
+    solve_file(str(input_path), str(output_path), input_format="binary", output_format="binary", chunk_rows=3)
+    records = np.fromfile(output_path, dtype=BINARY_RESULT_DTYPE)
+
+    assert records["case"].tolist() == [CASE_CODES[name] for name in
+                                        ["quadratic_two_real", "quadratic_two_complex", "linear", "no_solution"]]
+    assert records["root1"][:3].tolist() == [2.0, 1j, -2.0]
+    assert records["root2"][:2].tolist() == [1.0, -1j]
+    assert np.isnan(records["root1"][3])
+
+
+def test_binary_input_truncated(tmp_path):
+
+    input_path = tmp_path / "in.bin"
+    input_path.write_bytes(np.zeros(4, dtype="<f8").tobytes())
+    with pytest.raises(ValueError):
+        solve_file(str(input_path), str(tmp_path / "out.csv"), input_format="binary")
+
+
+def test_main(tmp_path, capsys):
+
+    input_path = tmp_path / "in.csv"
+    input_path.write_text("1,2,1\n0,0,0\n")
+    output_path = tmp_path / "out.csv"
+
+    assert main([str(input_path), str(output_path), "--chunk-rows", "1"]) == 0
+    assert output_path.read_text().splitlines() == ["1,2,1,quadratic_one_real,-1.0,N/A",
+                                                    "0,0,0,infinite_solutions,N/A,N/A"]
+    assert "Solved 2 rows" in capsys.readouterr().err
+
+
+def test_main_missing_file(tmp_path, capsys):
+
+    assert main([str(tmp_path / "missing.csv"), str(tmp_path / "out.csv")]) == 1
+    assert "Error" in capsys.readouterr().err
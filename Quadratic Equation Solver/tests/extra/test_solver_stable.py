@@ -0,0 +1,114 @@
+import sys
+import pathlib
+import csv
+import pytest
+
+from decimal import Decimal, getcontext
+from pathlib import Path
+
+sys.path.insert(0, str(pathlib.Path(__file__).resolve().parents[2]))
+
+from Solver import solve_quadratic, solve_quadratic_stable, NA_ROOTS
+
+
+TEST_SETS = ["AllCombinations.csv", "CategoryBaseTestSet.csv", "MetamorphicTestSet.csv", "PairWiseTestSet.csv"]
+
+
+def load_coefficients():
+
+    rows = []
+    for name in TEST_SETS:
+        path = Path(__file__).resolve().parents[2] / "TestSets" / name
+        with open(path, 'r') as f:
+            for row in csv.reader(f):
+                if len(row) >= 6:
+                    rows.append(row[:3])
+    return rows
+
+
+def reference_real_roots(a, b, c):
+
+    # exact decimal arithmetic with enough digits to survive the cancellation
+    getcontext().prec = 200
+    a, b, c = Decimal(float(a)), Decimal(float(b)), Decimal(float(c))
+    sqrt_d = (b * b - 4 * a * c).sqrt()
+    return (-b + sqrt_d) / (2 * a), (-b - sqrt_d) / (2 * a)
+
+
+@pytest.mark.parametrize("row", load_coefficients())
+def test_same_case_as_scalar(row):
+
+    assert solve_quadratic_stable(row)[0] == solve_quadratic(row)[0]
+
+
+def test_real_roots_accurate():
+
+    for row in load_coefficients():
+        case, roots = solve_quadratic_stable(row)
+        if case != "quadratic_two_real":
+            continue
+
+        for actual, expected in zip(roots, reference_real_roots(*row)):
+            assert abs(Decimal(actual) - expected) <= abs(expected) * Decimal("1e-15"), \
+                f"Root inaccurate for {row}: {actual} vs {expected}"
+
+
+def test_small_root_not_lost():
+
+    # solve_quadratic returns -0.0 for the small root of this row
+    case, roots = solve_quadratic_stable(["-1.4252653e+37", "-1.4252653e+37", "-0.8052455044658633"])
+    assert case == "quadratic_two_real"
+    assert roots[0] == -1.0
+    assert roots[1] == pytest.approx(-5.649793792537173e-38, rel=1e-15)
+
+
+@pytest.mark.parametrize("row", [[1.0, -3.0, 2.0], [1.0, 3.0, 2.0], [-2.0, 0.0, 2.0], [-2.0, -0.0, 2.0], [4.0, 1.0, -3.0]])
+def test_root_order_matches_scalar(row):
+
+    assert list(solve_quadratic_stable(row)[1]) == solve_quadratic(row)[1]
+
+
+def test_large_coefficients_do_not_overflow():
+
+    assert solve_quadratic([1e200, 3e200, 1e200])[0] == "overflow"
+    case, roots = solve_quadratic_stable([1e200, 3e200, 1e200])
+    assert case == "quadratic_two_real"
+    assert roots == pytest.approx((-0.3819660112501051, -2.618033988749895))
+
+
+@pytest.mark.parametrize("row,case,expected", [
+    ([5e-324, 1.0, 1.0], "quadratic_two_real", (-1.0, float("-inf"))),
+    ([1e-300, 1.0, 1e300], "quadratic_two_complex", (complex(-5e299, 8.660254037844386e299),
+                                                     complex(-5e299, -8.660254037844386e299))),
+    ([1e-300, 1e300, 1.0], "quadratic_two_real", (-1e-300, float("-inf"))),
+    ([1e-200, 1e200, 1e-200], "quadratic_two_real", (-0.0, float("-inf"))),
+    ([1e-300, 0.0, -1e300], "quadratic_two_real", (1e300, -1e300)),
+    ([1e308, 1e-308, 1e308], "quadratic_two_complex", (complex(-0.0, 1.0), complex(-0.0, -1.0))),
+])
+def test_coefficients_far_apart(row, case, expected):
+
+    # scaling them all by the same power of two used to underflow a (or b * b) to 0 and divide by it
+    actual_case, roots = solve_quadratic_stable(row)
+    assert actual_case == case
+    assert roots == pytest.approx(expected, rel=1e-15)
+
+
+@pytest.mark.parametrize("row", [[float("inf"), 1.0, 1.0], [1.0, float("nan"), 1.0], [1.0, 1.0, float("-inf")]])
+def test_non_finite_coefficients_overflow(row):
+
+    assert solve_quadratic_stable(row) == ("overflow", NA_ROOTS)
+
+
+def test_other_cases():
+
+    assert solve_quadratic_stable([0, 0, 0]) == ("infinite_solutions", NA_ROOTS)
+    assert solve_quadratic_stable([0, 0, 1]) == ("no_solution", NA_ROOTS)
+    assert solve_quadratic_stable([0, 2, 4]) == ("linear", (-2.0, "N/A"))
+    assert solve_quadratic_stable(["x", 2, 4]) == ("incorrect_type", NA_ROOTS)
+    assert solve_quadratic_stable([1, 2, 1]) == ("quadratic_one_real", (-1.0, "N/A"))
+    assert solve_quadratic_stable([1, 0, 1]) == ("quadratic_two_complex", (complex(-0.0, 1.0), complex(-0.0, -1.0)))
+
+
+def test_na_results_are_shared():
+
+    assert solve_quadratic_stable([0, 0, 0])[1] is solve_quadratic_stable([0, 0, 5])[1]